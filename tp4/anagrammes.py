@@ -0,0 +1,73 @@
+from itertools import product
+
+
+class IndexAnagrammes:
+    """
+    Index des mots d'un lexique selon leur signature: leurs lettres triées en ordre alphabétique. Deux mots ont la même
+    signature si et seulement si ce sont des anagrammes l'un de l'autre.
+
+    Pour trouver les mots qu'on peut former avec un ensemble de lettres, on énumère les sous-multiensembles de ces
+    lettres (au plus 2⁸ = 256 pour un chevalet de 7 jetons et une lettre du plateau) et on cherche chacun dans l'index.
+
+    Attributes:
+        longueur_max (int): Longueur des plus longs mots indexés.
+        signatures (dict): Pour chaque signature, la liste des mots (str) qui l'ont.
+    """
+    def __init__(self, lexique, longueur_max=8):
+        """
+        Constructeur. Parcourt le lexique jusqu'à la profondeur longueur_max.
+
+        Args:
+            lexique (Lexique): Le lexique à indexer.
+            longueur_max (int): Longueur des plus longs mots à indexer (7 jetons plus une lettre du plateau par
+                                défaut).
+        """
+        self.longueur_max = longueur_max
+        self.signatures = {}
+        pile = [(lexique.racine(), '')]
+        while pile:
+            noeud, prefixe = pile.pop()
+            for lettre, suivant in lexique.enfants(noeud):
+                mot = prefixe + lettre
+                if len(mot) > 1 and lexique.est_terminal(suivant):
+                    self.signatures.setdefault(''.join(sorted(mot)), []).append(mot)
+                if len(mot) < longueur_max:
+                    pile.append((suivant, mot))
+
+    def anagrammes(self, lettres):
+        """
+        Args:
+            lettres (iterable): Des lettres.
+
+        Returns:
+            list: Les mots qui utilisent exactement ces lettres.
+        """
+        return list(self.signatures.get(''.join(sorted(lettres)), ()))
+
+    def mots(self, lettres, lettre_plateau=None):
+        """
+        Trouve tous les mots qu'on peut former avec une partie des lettres données et, s'il y a lieu, une lettre déjà
+        placée sur le plateau.
+
+        Args:
+            lettres (iterable): Les lettres disponibles (par exemple celles d'un chevalet).
+            lettre_plateau (str, optionnel): Une lettre du plateau que les mots peuvent aussi utiliser.
+
+        Returns:
+            list: Les mots trouvés, des plus longs aux plus courts.
+        """
+        nombres = {}
+        for lettre in lettres:
+            nombres[lettre] = nombres.get(lettre, 0) + 1
+        if lettre_plateau is not None:
+            nombres[lettre_plateau] = nombres.get(lettre_plateau, 0) + 1
+        ordre = sorted(nombres)
+
+        trouves = []
+        for choix in product(*(range(nombres[lettre] + 1) for lettre in ordre)):
+            if not 2 <= sum(choix) <= self.longueur_max:
+                continue
+            mots = self.signatures.get(''.join(lettre * n for lettre, n in zip(ordre, choix)))
+            if mots:
+                trouves.extend(mots)
+        return sorted(trouves, key=len, reverse=True)
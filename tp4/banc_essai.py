@@ -0,0 +1,249 @@
+"""
+Banc d'essai du moteur de jeu: chargement du dictionnaire, validation des mots, validation des positions, calcul du
+pointage, vérification complète des coups et parties complètes.
+
+Toutes les mesures utilisent des graines fixes, de sorte que deux exécutions mesurent exactement le même travail. Les
+résultats sont écrits en JSON et peuvent être comparés à ceux d'une exécution précédente (la référence) pour repérer
+les régressions de performance.
+
+Exemple:
+    python -m tp4.banc_essai --sortie reference.json
+    python -m tp4.banc_essai --reference reference.json
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from tp4.generateur import GenerateurCoups
+from tp4.langues import REGISTRE
+from tp4.lexique import charger_lexique
+from tp4.partie import Partie
+from tp4.simulateur import jouer_partie, strategie_meilleur
+from tp4.exceptions import FinPartie
+
+# Nombre de coups joués avant de mesurer, pour chaque type de grille.
+GRILLES = {'clairsemee': 2, 'milieu': 10, 'dense': 22}
+
+
+def mesurer(fonction, repetitions=5):
+    """
+    Exécute une fonction plusieurs fois.
+
+    Args:
+        fonction (callable): La fonction à mesurer (sans argument).
+        repetitions (int): Le nombre d'exécutions.
+
+    Returns:
+        float: La durée médiane d'une exécution, en secondes.
+    """
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - debut)
+    return statistics.median(durees)
+
+
+def mesure(valeur, unite):
+    """
+    Returns:
+        dict: Une mesure, telle qu'écrite dans le JSON des résultats.
+    """
+    return {'valeur': valeur, 'unite': unite}
+
+
+def banc_chargement(langue):
+    """
+    Mesure le chargement du dictionnaire, tel que fait par le registre des langues la première fois qu'une partie
+    en a besoin (voir RegistreLangues.lexique).
+    """
+    chemin = REGISTRE.langue(langue).dictionnaire
+    duree = mesurer(lambda: charger_lexique(chemin))
+    tracemalloc.start()
+    lexique = charger_lexique(chemin)
+    memoire = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del lexique
+    return {
+        f'chargement_{langue}': mesure(duree, 's'),
+        f'memoire_chargement_{langue}': mesure(memoire, 'octets'),
+    }
+
+
+def banc_mot_permis(langue, nb_mots=20000):
+    """
+    Mesure le débit de Partie.mot_permis sur un mélange de mots permis et de mots inexistants, une première fois sur
+    un lexique qui vient d'être chargé, puis une seconde fois sur les mêmes mots.
+    """
+    hasard = random.Random(0)
+    partie = Partie(2, langue, graine=0)
+    mots = hasard.sample(sorted(partie.dictionnaire), nb_mots // 2)
+    mots += [''.join(hasard.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(len(mot))) for mot in mots]
+    hasard.shuffle(mots)
+
+    def verifier():
+        for mot in mots:
+            partie.mot_permis(mot)
+
+    premiere = mesurer(verifier, repetitions=1)
+    seconde = mesurer(verifier)
+    return {
+        f'mot_permis_{langue}': mesure(len(mots) / premiere, 'appels/s'),
+        f'mot_permis_repete_{langue}': mesure(len(mots) / seconde, 'appels/s'),
+    }
+
+
+def preparer_partie(langue, nb_coups, graine=0):
+    """
+    Joue nb_coups coups avec la stratégie du meilleur coup.
+
+    Returns:
+        Partie: La partie, avec la grille obtenue.
+    """
+    partie = Partie(2, langue, graine=graine)
+    generateur = GenerateurCoups(partie.dictionnaire)
+    for _ in range(nb_coups):
+        coup = strategie_meilleur(partie, generateur, None)
+        try:
+            if coup is None:
+                partie.passer_son_tour()
+            else:
+                partie.jouer_coup(coup.jetons, coup.positions)
+        except FinPartie:
+            break
+    return partie
+
+
+def banc_grilles(langue, nb_candidats=200):
+    """
+    Mesure la latence de Grille.valider_positions_avant_ajout, de Grille.mots_score_obtenus et de
+    Grille.verifier_coups (le chemin de Partie.jouer_coup) sur des grilles clairsemée, de milieu de partie et dense,
+    pour des coups permis tirés au hasard. verifier_coups est mesurée coup par coup, comme dans une partie, et pour
+    tous les coups d'un seul appel, comme dans un générateur ou un serveur qui vérifie des coups en lot.
+    """
+    resultats = {}
+    for nom, nb_coups in GRILLES.items():
+        partie = preparer_partie(langue, nb_coups)
+        grille = partie.plateau
+        coups = GenerateurCoups(partie.dictionnaire).generer(grille, partie.joueur_actif.chevalet)
+        coups = random.Random(0).sample(coups, min(nb_candidats, len(coups)))
+        if not coups:
+            continue
+        index = [[grille.index_position(p) for p in coup.positions] for coup in coups]
+        paires = [(coup.jetons, coup.positions) for coup in coups]
+
+        def valider():
+            for coup in coups:
+                grille.valider_positions_avant_ajout(coup.positions)
+
+        def verifier_un_a_un():
+            for paire in paires:
+                grille.verifier_coups([paire])
+
+        def verifier_en_lot():
+            grille.verifier_coups(paires)
+
+        def compter(repetitions=20):
+            duree = 0.0
+            for coup, positions in zip(coups, index):
+                for jeton, k in zip(coup.jetons, positions):
+                    grille.placer_jeton_index(jeton, k)
+                debut = time.perf_counter()
+                for _ in range(repetitions):
+                    grille.mots_score_obtenus(coup.positions)
+                duree += time.perf_counter() - debut
+                for k in positions:
+                    grille.retirer_jeton_index(k)
+            return duree / (repetitions * len(coups))
+
+        resultats[f'valider_positions_{nom}_{langue}'] = mesure(mesurer(valider) / len(coups), 's')
+        resultats[f'mots_score_{nom}_{langue}'] = mesure(statistics.median(compter() for _ in range(5)), 's')
+        resultats[f'verifier_coup_{nom}_{langue}'] = mesure(mesurer(verifier_un_a_un) / len(coups), 's')
+        resultats[f'verifier_coups_lot_{nom}_{langue}'] = mesure(mesurer(verifier_en_lot) / len(coups), 's')
+    return resultats
+
+
+def banc_parties(langue, nb_parties=3):
+    """
+    Mesure le débit de parties complètes jouées par deux robots qui choisissent le meilleur coup.
+    """
+    debut = time.perf_counter()
+    nb_coups = 0
+    for graine in range(nb_parties):
+        resume = jouer_partie(graine, ['meilleur', 'meilleur'], langue)
+        nb_coups += sum(resume['coups']) + sum(resume['passes'])
+    duree = time.perf_counter() - debut
+    return {
+        f'parties_{langue}': mesure(nb_parties / duree, 'parties/s'),
+        f'coups_{langue}': mesure(nb_coups / duree, 'coups/s'),
+    }
+
+
+def executer(langues=('fr', 'en'), nb_parties=3):
+    """
+    Exécute toutes les mesures.
+
+    Returns:
+        dict: Les mesures, par nom.
+    """
+    resultats = {}
+    for langue in langues:
+        resultats.update(banc_chargement(langue))
+        resultats.update(banc_mot_permis(langue))
+        resultats.update(banc_grilles(langue))
+        resultats.update(banc_parties(langue, nb_parties))
+    return resultats
+
+
+def comparer(resultats, reference, tolerance=0.1):
+    """
+    Compare des mesures à celles d'une exécution de référence.
+    Une mesure en « /s » est meilleure si elle est plus grande, les autres si elles sont plus petites.
+
+    Args:
+        resultats (dict): Les mesures de l'exécution courante.
+        reference (dict): Les mesures de référence.
+        tolerance (float): Écart relatif au-delà duquel une mesure moins bonne est une régression.
+
+    Returns:
+        dict: Pour chaque mesure présente des deux côtés, le ratio (courante / référence) et si c'est une régression.
+    """
+    comparaison = {}
+    for nom, courante in resultats.items():
+        if nom not in reference or not reference[nom]['valeur']:
+            continue
+        ratio = courante['valeur'] / reference[nom]['valeur']
+        if courante['unite'].endswith('/s'):
+            regression = ratio < 1 - tolerance
+        else:
+            regression = ratio > 1 + tolerance
+        comparaison[nom] = {'ratio': ratio, 'regression': regression}
+    return comparaison
+
+
+if __name__ == '__main__':
+    analyseur = argparse.ArgumentParser(prog='python -m tp4.banc_essai', description="Banc d'essai du moteur de jeu.")
+    analyseur.add_argument('--langues', nargs='+', default=['fr', 'en'], choices=[code.lower() for code in REGISTRE.codes()])
+    analyseur.add_argument('--parties', type=int, default=3, help='nombre de parties complètes à jouer par langue')
+    analyseur.add_argument('--sortie', default='-', help='fichier JSON où écrire les résultats')
+    analyseur.add_argument('--reference', help='fichier JSON de résultats auxquels se comparer')
+    analyseur.add_argument('--tolerance', type=float, default=0.1, help='écart relatif toléré (0.1 pour 10 %%)')
+    args = analyseur.parse_args()
+
+    rapport = {'python': sys.version.split()[0], 'mesures': executer(args.langues, args.parties)}
+    if args.reference:
+        with open(args.reference, encoding='utf-8') as fichier:
+            rapport['comparaison'] = comparer(rapport['mesures'], json.load(fichier)['mesures'], args.tolerance)
+
+    texte = json.dumps(rapport, indent=2)
+    if args.sortie == '-':
+        print(texte)
+    else:
+        with open(args.sortie, 'w', encoding='utf-8') as fichier:
+            fichier.write(texte + '\n')
+    if any(c['regression'] for c in rapport.get('comparaison', {}).values()):
+        sys.exit(1)
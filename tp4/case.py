@@ -11,6 +11,8 @@ class Case:
                      vaut None si la case n'est pas spéciale.
         jeton_occupant (Jeton): Le jeton contenu sur la case (None si aucun jeton).
     """
+    __slots__ = ('multiplicateur', 'effet', 'jeton_occupant')
+
     def __init__(self, multiplicateur=1, effet=None):
         """
         Constructeur de la classe.
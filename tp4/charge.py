@@ -0,0 +1,219 @@
+"""
+Test de charge du serveur de parties (voir le module serveur).
+
+Le client ouvre une connexion par joueur, crée des parties et les joue jusqu'au bout en parallèle: chaque joueur
+attend son tour (évènements du serveur), puis joue un coup trouvé par le générateur de coups sur sa propre copie de
+la grille. On mesure le débit de requêtes et leur latence (médiane et centiles).
+
+Exemple:
+    python -m tp4.charge --parties 500 --concurrence 200 --demarrer-serveur
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+
+from tp4.generateur import GenerateurCoups
+from tp4.grille import Grille
+from tp4.jeton import Jeton
+from tp4.langues import codes_langues, lexique
+from tp4.serveur import VIDE
+
+
+class Client:
+    """
+    Connexion d'un joueur au serveur. Les réponses sont associées aux requêtes par leur id, et les évènements sont
+    rangés dans une file par partie.
+
+    Attributes:
+        latences (list): Durée de chaque requête, en secondes.
+    """
+    def __init__(self, latences):
+        """
+        Constructeur.
+
+        Args:
+            latences (list): Liste où ajouter la durée de chaque requête.
+        """
+        self.latences = latences
+        self._ids = itertools.count()
+        self._attentes = {}
+        self._evenements = {}
+
+    async def connecter(self, hote, port):
+        """
+        Ouvre la connexion et commence à lire les messages du serveur.
+        """
+        self._lecteur, self._ecrivain = await asyncio.open_connection(hote, port, limit=2 ** 20)
+        self._lecture = asyncio.create_task(self._lire())
+
+    async def fermer(self):
+        """
+        Ferme la connexion.
+        """
+        self._lecture.cancel()
+        self._ecrivain.close()
+        await self._ecrivain.wait_closed()
+
+    async def _lire(self):
+        while True:
+            ligne = await self._lecteur.readline()
+            if not ligne:
+                break
+            message = json.loads(ligne)
+            if 'evenement' in message:
+                self.file(message['partie']).put_nowait(message['etat'])
+            else:
+                self._attentes.pop(message['id']).set_result(message)
+        for attente in self._attentes.values():
+            attente.set_exception(ConnectionError('Connexion fermée par le serveur.'))
+
+    def file(self, partie):
+        """
+        Returns:
+            asyncio.Queue: Les états reçus dans les évènements d'une partie.
+        """
+        return self._evenements.setdefault(partie, asyncio.Queue())
+
+    async def requete(self, action, **champs):
+        """
+        Envoie une requête et attend la réponse.
+
+        Returns:
+            dict: La réponse du serveur.
+        """
+        identifiant = next(self._ids)
+        attente = asyncio.get_running_loop().create_future()
+        self._attentes[identifiant] = attente
+        debut = time.perf_counter()
+        self._ecrivain.write(json.dumps(dict(champs, id=identifiant, action=action)).encode() + b'\n')
+        reponse = await attente
+        self.latences.append(time.perf_counter() - debut)
+        return reponse
+
+
+def _choisir(generateur, grille, chevalet, strategie):
+    coups = generateur.iterer(grille, chevalet)
+    if strategie == 'premier':
+        return next(coups, None)
+    return max(coups, key=lambda coup: coup.score, default=None)
+
+
+async def jouer_joueur(client, numero, strategie, statistiques):
+    """
+    Rejoint une partie et la joue jusqu'à la fin.
+
+    Args:
+        client (Client): La connexion du joueur.
+        numero (int): Numéro de la partie.
+        strategie (str): 'premier' (premier coup trouvé) ou 'meilleur' (meilleur pointage).
+        statistiques (dict): Compteurs à mettre à jour (coups, passes, refus).
+    """
+    reponse = await client.requete('rejoindre', partie=numero)
+    joueur, valeurs, etat = reponse['joueur'], reponse['valeurs'], reponse['etat']
+    generateur = GenerateurCoups(lexique(etat['langue']))
+    grille = Grille()
+    grille.definir_lexique(generateur.lexique)
+    file = client.file(numero)
+
+    while not etat['terminee']:
+        if etat['joueur_actif'] != joueur:
+            etat = await file.get()
+            continue
+        for k, lettre in enumerate(etat['grille']):
+            if lettre != VIDE and not grille.lettres[k]:
+                grille.placer_jeton_index(Jeton(lettre, valeurs[lettre]), k)
+        chevalet = [Jeton(lettre, valeurs[lettre]) for lettre in etat['chevalet'] if lettre != VIDE]
+        coup = _choisir(generateur, grille, chevalet, strategie)
+        if coup is not None:
+            reponse = await client.requete('jouer', partie=numero, positions=coup.positions,
+                                           lettres=''.join(jeton.lettre for jeton in coup.jetons))
+            statistiques['coups' if reponse['ok'] else 'refus'] += 1
+        if coup is None or not reponse['ok']:
+            reponse = await client.requete('passer', partie=numero)
+            statistiques['passes'] += 1
+        etat = reponse['etat']
+
+
+async def jouer_partie(hote, port, nb_joueurs, langue, graine, strategie, latences, statistiques):
+    """
+    Crée une partie sur le serveur et la fait jouer par nb_joueurs clients.
+    """
+    clients = [Client(latences) for _ in range(nb_joueurs)]
+    for client in clients:
+        await client.connecter(hote, port)
+    try:
+        numero = (await clients[0].requete('creer', nb_joueurs=nb_joueurs, langue=langue, graine=graine))['partie']
+        await asyncio.gather(*(jouer_joueur(client, numero, strategie, statistiques) for client in clients))
+        statistiques['parties'] += 1
+    finally:
+        for client in clients:
+            await client.fermer()
+
+
+def _centile(valeurs, p):
+    return valeurs[min(len(valeurs) - 1, int(p * len(valeurs)))] if valeurs else 0.0
+
+
+async def tester(hote, port, nb_parties, concurrence, nb_joueurs=2, langue='fr', graine=0, strategie='premier'):
+    """
+    Joue nb_parties parties sur le serveur, dont au plus concurrence en même temps.
+
+    Returns:
+        dict: Le nombre de parties, de coups, de passes et de coups refusés, la durée, le débit de requêtes et la
+              latence des requêtes (médiane, 95e et 99e centiles), en millisecondes.
+    """
+    latences = []
+    statistiques = {'parties': 0, 'coups': 0, 'passes': 0, 'refus': 0}
+    limite = asyncio.Semaphore(concurrence)
+
+    async def une_partie(i):
+        async with limite:
+            await jouer_partie(hote, port, nb_joueurs, langue, graine + i, strategie, latences, statistiques)
+
+    debut = time.perf_counter()
+    await asyncio.gather(*(une_partie(i) for i in range(nb_parties)))
+    duree = time.perf_counter() - debut
+
+    latences.sort()
+    return dict(statistiques, duree=duree, requetes=len(latences), requetes_par_seconde=len(latences) / duree,
+                latence_mediane_ms=1000 * _centile(latences, 0.5), latence_p95_ms=1000 * _centile(latences, 0.95),
+                latence_p99_ms=1000 * _centile(latences, 0.99))
+
+
+async def principal(args):
+    serveur = None
+    if args.demarrer_serveur:
+        serveur = await asyncio.create_subprocess_exec(sys.executable, '-m', 'tp4.serveur', '--hote', args.hote,
+                                                       '--port', str(args.port))
+        for _ in range(100):
+            try:
+                _, ecrivain = await asyncio.open_connection(args.hote, args.port)
+                ecrivain.close()
+                break
+            except OSError:
+                await asyncio.sleep(0.1)
+    try:
+        return await tester(args.hote, args.port, args.parties, args.concurrence, args.joueurs, args.langue,
+                            args.graine, args.strategie)
+    finally:
+        if serveur is not None:
+            serveur.terminate()
+            await serveur.wait()
+
+
+if __name__ == '__main__':
+    analyseur = argparse.ArgumentParser(prog='python -m tp4.charge', description='Test de charge du serveur.')
+    analyseur.add_argument('--hote', default='127.0.0.1')
+    analyseur.add_argument('--port', type=int, default=7777)
+    analyseur.add_argument('-n', '--parties', type=int, default=100, help='nombre de parties à jouer')
+    analyseur.add_argument('-c', '--concurrence', type=int, default=50, help='nombre de parties simultanées')
+    analyseur.add_argument('--joueurs', type=int, default=2, choices=[2, 3, 4])
+    analyseur.add_argument('--langue', default='fr', choices=[code.lower() for code in codes_langues()])
+    analyseur.add_argument('--graine', type=int, default=0, help='graine de la première partie')
+    analyseur.add_argument('--strategie', default='premier', choices=['premier', 'meilleur'])
+    analyseur.add_argument('--demarrer-serveur', action='store_true',
+                           help='démarre un serveur local le temps du test')
+    print(json.dumps(asyncio.run(principal(analyseur.parse_args())), indent=2))
@@ -0,0 +1,116 @@
+"""
+Contrôle des fuites de widgets de l'interface graphique.
+
+Une fenêtre Scrabble joue automatiquement de nombreux tours (le meilleur coup de chaque joueur, placé sur le plateau
+puis joué comme si le joueur avait cliqué sur « Jouer »), en enchaînant les parties au besoin. Le nombre de widgets de
+la fenêtre (tous les descendants, voir winfo_children) est compté avant et après: il doit rester le même, sans quoi
+chaque tour laisse des widgets derrière lui. Les boîtes de dialogue qui annoncent les coups sont remplacées par des
+fonctions qui ne font rien, pour ne pas bloquer le contrôle.
+
+Le contrôle a besoin d'un affichage; sur un serveur, on peut utiliser un affichage virtuel.
+
+Exemple:
+    xvfb-run python -m tp4.controle_widgets --tours 500
+"""
+import argparse
+import sys
+from tkinter import messagebox
+from unittest import mock
+
+from tp4.generateur import GenerateurCoups
+from tp4.langues import codes_langues
+from tp4.partie import Partie
+from tp4.sauvegarde import etat_partie, restaurer_partie
+from tp4.scrabble import Scrabble
+from tp4.simulateur import strategie_meilleur
+
+
+def compter_widgets(widget):
+    """
+    Args:
+        widget (tkinter.Misc): Un widget (ou la fenêtre principale).
+
+    Returns:
+        int: Le nombre de descendants du widget, à toutes les profondeurs.
+    """
+    return sum(1 + compter_widgets(enfant) for enfant in widget.winfo_children())
+
+
+def nouvelle_partie(jeu, langue, graine):
+    """
+    Remplace la partie de la fenêtre par une nouvelle partie à deux joueurs, sans boîte de dialogue (par le même
+    chemin que le chargement d'une sauvegarde, voir Scrabble).
+    """
+    restaurer_partie(etat_partie(Partie(2, langue, graine=graine)), jeu)
+    jeu.plateau.dessiner()
+    jeu.dessiner_chevalet()
+    jeu.afficher_info_joueurs()
+
+
+def jouer_tour(jeu, generateur):
+    """
+    Joue le meilleur coup du joueur actif par l'interface: les jetons sont mis en jeu sur le plateau, puis le tour est
+    joué (voir Scrabble.jouer_un_tour). Sans coup permis, le joueur passe son tour.
+    """
+    coup = strategie_meilleur(jeu, generateur, None)
+    if coup is None:
+        jeu.passer_son_tour()
+        return
+    jeu.reinitialiser_tour()
+    for jeton, position in zip(coup.jetons, coup.positions):
+        jeu.joueur_actif.retirer_jeton(jeu.joueur_actif.chevalet.index(jeton))
+        jeu.plateau.jetons_en_jeu.append(jeton)
+        jeu.plateau.positions_en_jeu.append(position)
+    jeu.plateau.dessiner()
+    jeu.dessiner_chevalet()
+    jeu.jouer_un_tour()
+
+
+def controler(nb_tours=500, langue='fr', graine=0):
+    """
+    Joue nb_tours tours dans une fenêtre Scrabble et compte ses widgets avant et après. Une nouvelle partie commence
+    dès que le sac ne permet plus à coup sûr de compléter un chevalet.
+
+    Args:
+        nb_tours (int): Nombre de tours à jouer.
+        langue (str): 'fr' ou 'en'.
+        graine (int): Graine de la première partie (les suivantes utilisent graine + 1, graine + 2, etc.).
+
+    Returns:
+        tuple: Le nombre de widgets avant le premier tour et après le dernier, et le nombre de parties jouées.
+    """
+    with mock.patch.object(messagebox, 'showinfo'), mock.patch.object(messagebox, 'showerror'):
+        with mock.patch('tp4.scrabble.simpledialog.askinteger', return_value=2), \
+                mock.patch('tp4.scrabble.simpledialog.askstring', return_value=langue):
+            jeu = Scrabble()
+        try:
+            nouvelle_partie(jeu, langue, graine)
+            generateur = GenerateurCoups(jeu.dictionnaire)
+            jeu.update()
+            avant = compter_widgets(jeu)
+            nb_parties = 1
+            for _ in range(nb_tours):
+                if len(jeu.jetons_libres) < 7:
+                    nouvelle_partie(jeu, langue, graine + nb_parties)
+                    nb_parties += 1
+                jouer_tour(jeu, generateur)
+            jeu.update()
+            apres = compter_widgets(jeu)
+        finally:
+            jeu.destroy()
+    return avant, apres, nb_parties
+
+
+if __name__ == '__main__':
+    analyseur = argparse.ArgumentParser(prog='python -m tp4.controle_widgets',
+                                        description="Contrôle des fuites de widgets de l'interface graphique.")
+    analyseur.add_argument('--tours', type=int, default=500, help='nombre de tours à jouer')
+    analyseur.add_argument('--langue', default='fr', choices=[code.lower() for code in codes_langues()])
+    analyseur.add_argument('--graine', type=int, default=0, help='graine de la première partie')
+    args = analyseur.parse_args()
+
+    avant, apres, nb_parties = controler(args.tours, args.langue, args.graine)
+    print(f'{args.tours} tours ({nb_parties} parties): {avant} widgets avant, {apres} après.')
+    if apres != avant:
+        print('Fuite de widgets.', file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,255 @@
+"""
+Résolution exacte des fins de partie.
+
+Avec la fin standard (voir Partie.fin_standard), on continue de jouer une fois le sac vide. Les chevalets des deux
+joueurs sont alors connus: la fin de partie est un jeu à information complète, qu'on peut résoudre par une recherche
+alpha-bêta (negamax) sur l'écart de points. La recherche procède par approfondissement itératif: chaque itération
+explore un tour de plus que la précédente, en essayant d'abord le meilleur coup de l'itération précédente (lu dans
+une table de transposition, voir le module zobrist), puis les coups qui rapportent le plus. Elle s'arrête dès qu'une
+itération a exploré l'arbre jusqu'à la fin de la partie (le résultat est alors exact), lorsque le temps alloué est
+écoulé (on garde le résultat de la dernière itération terminée) ou lorsque la profondeur maximale est atteinte. Sans
+temps alloué, le résultat ne dépend pas de la vitesse de la machine.
+
+Exemple:
+    resultat = analyser_finale(partie, temps_max=10)
+    print(resultat)
+"""
+import time
+
+from tp4.generateur import GenerateurCoups
+from tp4.jeton import Jeton
+from tp4.zobrist import TableTransposition, empreinte_lettres, rotation, tirer_cles
+
+# Bornes des valeurs de la table de transposition.
+EXACTE, MINORANT, MAJORANT = 0, 1, 2
+# Profondeur des évaluations exactes dans la table: elles servent à n'importe quelle profondeur.
+PROFONDEUR_EXACTE = 1 << 20
+# Nombre de tours passés d'affilée qui terminent la partie (deux par joueur, voir Partie.partie_terminee).
+NB_PASSES_FIN = 4
+CLES_PASSES = tirer_cles(NB_PASSES_FIN + 1, 0x504153)
+
+
+class TempsEcoule(Exception):
+    pass
+
+
+class ResultatFinale:
+    """
+    Résultat de la résolution d'une fin de partie, du point de vue du joueur actif.
+
+    Attributes:
+        sequence (list): La meilleure suite de coups trouvée, en alternant les joueurs à partir du joueur actif
+                         (instances de la classe Coup, ou None pour passer son tour).
+        gain (int): L'écart de points que le joueur actif gagne sur son adversaire d'ici la fin de la partie, reliquats
+                    compris, si les deux joueurs jouent au mieux.
+        ecart (int): L'écart final prévu entre les pointages du joueur actif et de son adversaire.
+        exacte (bool): True si la recherche a été menée jusqu'à la fin de la partie dans toutes les variantes.
+        profondeur (int): Nombre de tours explorés par la dernière itération terminée.
+        noeuds (int): Nombre de positions visitées.
+        duree (float): Durée de la recherche, en secondes.
+    """
+    def __init__(self, sequence, gain, ecart, exacte, profondeur, noeuds, duree):
+        self.sequence = sequence
+        self.gain = gain
+        self.ecart = ecart
+        self.exacte = exacte
+        self.profondeur = profondeur
+        self.noeuds = noeuds
+        self.duree = duree
+
+    def __str__(self):
+        """
+        Returns:
+            str: Chaîne de caractères représentant un résultat.
+        """
+        coups = ' / '.join('passe' if coup is None else str(coup) for coup in self.sequence)
+        return '{} {:+d} (écart final {:+d}, profondeur {}, {} positions en {:.2f} s): {}'.format(
+            'Exact' if self.exacte else 'Estimé', self.gain, self.ecart, self.profondeur, self.noeuds, self.duree,
+            coups)
+
+
+class SolveurFinale:
+    """
+    Résout les fins de partie à deux joueurs dont le sac est vide (voir le module finale).
+
+    Attributes:
+        generateur (GenerateurCoups): Le générateur des coups permis.
+        temps_max (float): Temps alloué à une résolution, en secondes, ou None pour ne pas limiter le temps. La
+                           première itération est toujours terminée.
+        profondeur_max (int): Nombre maximal de tours explorés, ou None pour ne pas limiter la profondeur.
+        table (TableTransposition): Les évaluations déjà faites, conservées d'une résolution à l'autre.
+        noeuds (int): Nombre de positions visitées par la dernière résolution.
+    """
+    def __init__(self, generateur, temps_max=5.0, taille_table=1 << 18, profondeur_max=None):
+        """
+        Constructeur.
+
+        Args:
+            generateur (GenerateurCoups): Le générateur des coups permis.
+            temps_max (float): Temps alloué à une résolution, en secondes, ou None.
+            taille_table (int): Nombre d'entrées de la table de transposition.
+            profondeur_max (int, optionnel): Nombre maximal de tours explorés (au moins 1).
+        """
+        self.generateur = generateur
+        self.temps_max = temps_max
+        self.profondeur_max = profondeur_max
+        self.table = TableTransposition(taille_table, 'profondeur')
+        self.noeuds = 0
+        self._echeance = None
+
+    def resoudre(self, partie):
+        """
+        Cherche la meilleure suite de coups du joueur actif d'une partie dont le sac est vide.
+
+        Args:
+            partie (Partie): La partie (elle n'est pas modifiée).
+
+        Returns:
+            ResultatFinale: Le résultat.
+
+        Raises:
+            ValueError: Si la partie n'a pas exactement deux joueurs ou si son sac n'est pas vide.
+        """
+        if len(partie.joueurs) != 2 or len(partie.jetons_libres) != 0:
+            raise ValueError('La finale se résout à deux joueurs, une fois le sac vide.')
+        debut = time.monotonic()
+        actif = partie.joueur_actif
+        autre = partie.joueurs[1 - partie.joueurs.index(actif)]
+        self._valeurs = partie.valeurs_lettres
+        grille = partie.plateau.copier()
+        chevalets = ([jeton.lettre for jeton in actif.chevalet if jeton is not None],
+                     [jeton.lettre for jeton in autre.chevalet if jeton is not None])
+        passes = 0
+        for tour in reversed(partie.historique):
+            if not tour.get('passe') or passes == NB_PASSES_FIN:
+                break
+            passes += 1
+
+        self.noeuds = 0
+        self._echeance = None
+        gain, exacte, sequence, profondeur = 0, False, [], 0
+        while not exacte and (self.profondeur_max is None or profondeur < self.profondeur_max):
+            try:
+                resultat = self._negamax(grille, chevalets, passes, profondeur + 1, -float('inf'), float('inf'))
+            except TempsEcoule:
+                break
+            gain, exacte, sequence = resultat
+            profondeur += 1
+            self._echeance = None if self.temps_max is None else debut + self.temps_max
+        return ResultatFinale(sequence, gain, actif.points - autre.points + gain, exacte, profondeur, self.noeuds,
+                              time.monotonic() - debut)
+
+    def _somme(self, lettres):
+        return sum(self._valeurs[lettre] for lettre in lettres)
+
+    def _negamax(self, grille, chevalets, passes, profondeur, alpha, beta):
+        """
+        Évalue une position du point de vue du joueur qui a le trait.
+
+        Args:
+            grille (Grille): La grille (modifiée pendant la recherche puis remise dans son état).
+            chevalets (tuple): Les lettres du joueur qui a le trait, puis celles de son adversaire.
+            passes (int): Nombre de tours passés d'affilée jusqu'ici.
+            profondeur (int): Nombre de tours qui restent à explorer.
+            alpha (float): Valeur que le joueur est déjà assuré d'obtenir ailleurs.
+            beta (float): Valeur que l'adversaire est déjà assuré de ne pas dépasser ailleurs.
+
+        Returns:
+            int: L'écart de points que le joueur qui a le trait gagne d'ici la fin de la partie.
+            bool: True si la valeur ne dépend d'aucune position laissée inexplorée faute de profondeur.
+            list: La meilleure suite de coups trouvée.
+
+        Raises:
+            TempsEcoule: Si l'échéance est dépassée.
+        """
+        self.noeuds += 1
+        if self._echeance is not None and time.monotonic() > self._echeance:
+            raise TempsEcoule
+        mien, sien = chevalets
+        if passes >= NB_PASSES_FIN:
+            return self._somme(sien) - self._somme(mien), True, []
+        if profondeur == 0:
+            # Estimation: les reliquats, comme si la partie s'arrêtait maintenant.
+            return self._somme(sien) - self._somme(mien), False, []
+
+        cle = grille.empreinte ^ empreinte_lettres(mien) ^ rotation(empreinte_lettres(sien), 16) ^ CLES_PASSES[passes]
+        entree = self.table.chercher(cle)
+        coup_connu = None
+        if entree is not None:
+            valeur, borne, exacte, coup_connu, profondeur_entree = entree
+            if exacte or profondeur_entree >= profondeur:
+                if borne == EXACTE or (borne == MINORANT and valeur >= beta) or (borne == MAJORANT and valeur <= alpha):
+                    return valeur, exacte, [coup_connu]
+
+        valeurs = self._valeurs
+        bonus_sortie = 2 * self._somme(sien)
+        coups = self.generateur.generer(grille, [Jeton(lettre, valeurs[lettre]) for lettre in mien])
+        coups.sort(key=lambda coup: coup.score + (bonus_sortie if len(coup.jetons) == len(mien) else 0),
+                   reverse=True)
+        coups.append(None)
+        if coup_connu is not None:
+            for i, coup in enumerate(coups):
+                if _meme_coup(coup, coup_connu):
+                    coups.insert(0, coups.pop(i))
+                    break
+
+        alpha_initial = alpha
+        meilleure_valeur, meilleure_suite, exacte_partout = -float('inf'), [], True
+        for coup in coups:
+            if coup is None:
+                valeur, exacte, suite = self._negamax(grille, (sien, mien), passes + 1, profondeur - 1, -beta, -alpha)
+                valeur = -valeur
+            else:
+                reste = list(mien)
+                for jeton in coup.jetons:
+                    reste.remove(jeton.lettre)
+                if not reste:
+                    valeur, exacte, suite = coup.score + bonus_sortie, True, []
+                else:
+                    index = [grille.index_position(position) for position in coup.positions]
+                    for jeton, k in zip(coup.jetons, index):
+                        grille.placer_jeton_index(jeton, k)
+                    try:
+                        valeur, exacte, suite = self._negamax(grille, (sien, reste), 0, profondeur - 1, -beta, -alpha)
+                    finally:
+                        for k in index:
+                            grille.retirer_jeton_index(k)
+                    valeur = coup.score - valeur
+            exacte_partout = exacte_partout and exacte
+            if valeur > meilleure_valeur:
+                meilleure_valeur, meilleure_suite = valeur, [coup] + suite
+            alpha = max(alpha, valeur)
+            if alpha >= beta:
+                break
+
+        if meilleure_valeur <= alpha_initial:
+            borne = MAJORANT
+        elif meilleure_valeur >= beta:
+            borne = MINORANT
+        else:
+            borne = EXACTE
+        self.table.stocker(cle, (meilleure_valeur, borne, exacte_partout, meilleure_suite[0], profondeur),
+                           PROFONDEUR_EXACTE if exacte_partout else profondeur)
+        return meilleure_valeur, exacte_partout, meilleure_suite
+
+
+def _meme_coup(coup, autre):
+    if coup is None or autre is None:
+        return coup is autre
+    return coup.positions == autre.positions and coup.jetons == autre.jetons
+
+
+def analyser_finale(partie, temps_max=5.0, generateur=None):
+    """
+    Résout la fin de partie du joueur actif (voir SolveurFinale.resoudre).
+
+    Args:
+        partie (Partie): La partie, à deux joueurs et dont le sac est vide.
+        temps_max (float): Temps alloué, en secondes.
+        generateur (GenerateurCoups, optionnel): Le générateur des coups permis (un nouveau par défaut).
+
+    Returns:
+        ResultatFinale: Le résultat.
+    """
+    generateur = GenerateurCoups(partie.dictionnaire) if generateur is None else generateur
+    return SolveurFinale(generateur, temps_max).resoudre(partie)
@@ -0,0 +1,205 @@
+from tp4.grille import CENTRE, CODES, MULTIPLICATEURS_LETTRE, MULTIPLICATEURS_MOT
+
+
+class Coup:
+    """
+    Cette classe représente un coup jouable: des jetons du chevalet placés à certaines positions du plateau.
+
+    Attributes:
+        jetons (list): Les jetons (instances de la classe Jeton) à placer, pris sur le chevalet.
+        positions (list): Les codes de positionnement (str) où placer les jetons, dans le même ordre.
+        mots (list): Les mots (str) formés par le coup, le mot principal en premier.
+        score (int): Les points obtenus par le coup.
+    """
+    def __init__(self, jetons, positions, mots, score):
+        """
+        Constructeur.
+
+        Args:
+            jetons (list): Les jetons à placer.
+            positions (list): Les positions où placer les jetons.
+            mots (list): Les mots formés.
+            score (int): Les points obtenus.
+        """
+        self.jetons = jetons
+        self.positions = positions
+        self.mots = mots
+        self.score = score
+
+    def __str__(self):
+        """
+        Formatage d'un coup.
+
+        Returns:
+            str: Chaîne de caractères représentant un coup.
+        """
+        return '{} en {}: {} points'.format(', '.join(self.mots), ' '.join(self.positions), self.score)
+
+
+class GenerateurCoups:
+    """
+    Générateur de tous les coups permis pour un chevalet et une grille donnés (algorithme d'Appel et Jacobson).
+
+    Pour chaque ligne, puis chaque colonne, on part des cases d'ancrage (cases vides voisines d'un jeton, ou le
+    centre si la grille est vide) et des lettres permises par le mot perpendiculaire que formerait chaque case vide,
+    tenues à jour par la grille (voir Grille.ancres et Grille.croisements_h). On construit ensuite, en descendant dans
+    le lexique, la partie du mot située à gauche de chaque ancre, puis on la prolonge vers la droite. Les coups
+    produits respectent donc les règles de Grille.valider_positions_avant_ajout et leur pointage est celui de
+    Grille.mots_score_obtenus.
+
+    Attributes:
+        lexique (Lexique): Le lexique des mots permis.
+    """
+    def __init__(self, lexique):
+        """
+        Constructeur.
+
+        Args:
+            lexique (Lexique): Le lexique des mots permis.
+        """
+        self.lexique = lexique
+
+    def generer(self, grille, chevalet):
+        """
+        Args:
+            grille (Grille): La grille de jeu.
+            chevalet (list): Le chevalet du joueur (jetons ou None).
+
+        Returns:
+            list: Tous les coups permis (instances de la classe Coup), du meilleur pointage au moins bon.
+        """
+        return sorted(self.iterer(grille, chevalet), key=lambda coup: coup.score, reverse=True)
+
+    def iterer(self, grille, chevalet):
+        """
+        Produit les coups permis un à un, ligne par ligne puis colonne par colonne.
+        Si la grille n'utilise pas le même lexique que le générateur, on le lui assigne d'abord.
+
+        Args:
+            grille (Grille): La grille de jeu.
+            chevalet (list): Le chevalet du joueur (jetons ou None).
+
+        Yields:
+            Coup: Chaque coup permis.
+        """
+        jetons_par_lettre = {}
+        for jeton in chevalet:
+            if jeton is not None:
+                jetons_par_lettre.setdefault(jeton.lettre, []).append(jeton)
+        if not jetons_par_lettre:
+            return
+        if grille.lexique is not self.lexique:
+            grille.definir_lexique(self.lexique)
+        self._jetons_par_lettre = jetons_par_lettre
+        self._valeurs_lettres = {lettre: jetons[0].valeur for lettre, jetons in jetons_par_lettre.items()}
+        self._restants = {lettre: len(jetons) for lettre, jetons in jetons_par_lettre.items()}
+
+        n = grille.dimension
+        lettres = [chr(code) if code else None for code in grille.lettres]
+        ancres = {CENTRE} if grille.est_vide() else grille.ancres
+
+        for horizontal, pas, croisements in ((True, 1, grille.croisements_h), (False, n, grille.croisements_v)):
+            for i in range(n):
+                debut = i * n if horizontal else i
+                indices = range(debut, debut + n * pas, pas)
+                ancres_ligne = [j for j, k in enumerate(indices) if k in ancres]
+                if ancres_ligne:
+                    ligne = [lettres[k] for k in indices]
+                    yield from self._coups_ligne(ligne, indices, grille.valeurs, croisements, ancres_ligne,
+                                                 horizontal)
+
+    def _coups_ligne(self, ligne, indices, valeurs, croisements, ancres, horizontal):
+        """
+        Produit les coups dont le mot principal est sur une ligne ou une colonne de la grille, étant donné les lettres
+        de cette ligne, les index de ses cases dans la grille et ses ancres (rangs dans la ligne, en ordre croissant).
+        """
+        n = len(ligne)
+        ensemble_ancres = set(ancres)
+        coups = []
+        lexique = self.lexique
+        restants = self._restants
+
+        def enregistrer(partiel, fin):
+            debut = fin - len(partiel)
+            somme, multiplicateur, croises = 0, 1, 0
+            mots, nouvelles = [partiel], []
+            for j in range(debut, fin):
+                lettre = partiel[j - debut]
+                k = indices[j]
+                if ligne[j] is not None:
+                    somme += valeurs[k]
+                    continue
+                valeur = self._valeurs_lettres[lettre]
+                mult_lettre, mult_mot = MULTIPLICATEURS_LETTRE[k], MULTIPLICATEURS_MOT[k]
+                somme += valeur * mult_lettre
+                multiplicateur *= mult_mot
+                croisement = croisements[k]
+                if croisement is not None:
+                    croises += (croisement.points + valeur * mult_lettre) * mult_mot
+                    mots.append(croisement.avant + lettre + croisement.apres)
+                nouvelles.append((k, lettre))
+            # Un coup d'un seul jeton qui forme aussi un mot horizontal a déjà été produit lors du passage horizontal.
+            if not horizontal and len(nouvelles) == 1 and croisements[nouvelles[0][0]] is not None:
+                return
+            pris = {}
+            jetons, positions = [], []
+            for k, lettre in nouvelles:
+                jetons.append(self._jetons_par_lettre[lettre][pris.get(lettre, 0)])
+                pris[lettre] = pris.get(lettre, 0) + 1
+                positions.append(CODES[k])
+            coups.append(Coup(jetons, positions, mots, somme * multiplicateur + croises))
+
+        def etendre_droite(partiel, noeud, j, ancre):
+            if j < n and ligne[j] is not None:
+                suivant = lexique.enfant(noeud, ligne[j])
+                if suivant is not None:
+                    etendre_droite(partiel + ligne[j], suivant, j + 1, ancre)
+                return
+            if j > ancre and lexique.est_terminal(noeud):
+                enregistrer(partiel, j)
+            if j >= n:
+                return
+            croisement = croisements[indices[j]]
+            for lettre, nombre in restants.items():
+                if nombre == 0 or (croisement is not None and lettre not in croisement.permises):
+                    continue
+                suivant = lexique.enfant(noeud, lettre)
+                if suivant is not None:
+                    restants[lettre] = nombre - 1
+                    etendre_droite(partiel + lettre, suivant, j + 1, ancre)
+                    restants[lettre] = nombre
+
+        def partie_gauche(partiel, noeud, limite, ancre):
+            etendre_droite(partiel, noeud, ancre, ancre)
+            if limite == 0:
+                return
+            for lettre, nombre in restants.items():
+                if nombre == 0:
+                    continue
+                suivant = lexique.enfant(noeud, lettre)
+                if suivant is not None:
+                    restants[lettre] = nombre - 1
+                    partie_gauche(partiel + lettre, suivant, limite - 1, ancre)
+                    restants[lettre] = nombre
+
+        for ancre in ancres:
+            if ancre > 0 and ligne[ancre - 1] is not None:
+                debut = ancre - 1
+                while debut > 0 and ligne[debut - 1] is not None:
+                    debut -= 1
+                partiel, noeud = '', lexique.racine()
+                for k in range(debut, ancre):
+                    partiel += ligne[k]
+                    noeud = lexique.enfant(noeud, ligne[k])
+                    if noeud is None:
+                        break
+                if noeud is not None:
+                    etendre_droite(partiel, noeud, ancre, ancre)
+            else:
+                limite = 0
+                while ancre - limite > 0 and ligne[ancre - limite - 1] is None and \
+                        ancre - limite - 1 not in ensemble_ancres:
+                    limite += 1
+                partie_gauche('', lexique.racine(), limite, ancre)
+            yield from coups
+            coups.clear()
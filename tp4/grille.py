@@ -0,0 +1,889 @@
+from tp4.case import Case
+from tp4.jeton import Jeton
+from tp4.zobrist import NB_LETTRES, tirer_cles
+from tp4.exceptions import *
+
+DIMENSION = 15
+NB_CASES = DIMENSION * DIMENSION
+CENTRE = 7 * DIMENSION + 7
+
+
+def _construire_primes():
+    """
+    Construit la disposition des cases spéciales du plateau.
+
+    Returns:
+        list: Liste de NB_CASES couples (multiplicateur, effet), indexée par i * DIMENSION + j.
+    """
+    primes = [[(1, None) for _ in range(DIMENSION)] for _ in range(DIMENSION)]
+    for (i, j) in [(0, 0), (0, 7), (0, 14), (7, 0), (7, 14), (14, 0), (14, 7), (14, 14)]:
+        primes[i][j] = (3, 'M')
+    for (i, j) in [(1, 5), (1, 9), (5, 1), (5, 5), (5, 9), (5, 13),
+                   (9, 1), (9, 5), (9, 9), (9, 13), (13, 5), (13, 9)]:
+        primes[i][j] = (3, 'L')
+    for i in [1, 2, 3, 4]:
+        primes[i][i] = (2, 'M')
+        primes[i][DIMENSION - i - 1] = (2, 'M')
+        primes[DIMENSION - i - 1][DIMENSION - i - 1] = (2, 'M')
+        primes[DIMENSION - i - 1][i] = (2, 'M')
+    for i, j in [(1, 1), (4, 0), (0, 4), (5, 1), (1, 5), (7, 4)]:
+        primes[7 - i][7 - j] = (2, 'L')
+        primes[7 + i][7 - j] = (2, 'L')
+        primes[7 - i][7 + j] = (2, 'L')
+        primes[7 + i][7 + j] = (2, 'L')
+    primes[7][7] = (2, 'M')
+    return [prime for ligne in primes for prime in ligne]
+
+
+# Tables précalculées, indexées par i * DIMENSION + j.
+PRIMES = tuple(_construire_primes())
+MULTIPLICATEURS_LETTRE = bytes(multiplicateur if effet == 'L' else 1 for multiplicateur, effet in PRIMES)
+MULTIPLICATEURS_MOT = bytes(multiplicateur if effet == 'M' else 1 for multiplicateur, effet in PRIMES)
+CODES = tuple(f"{chr(ord('A') + k // DIMENSION)}{k % DIMENSION + 1}" for k in range(NB_CASES))
+INDEX_CODES = {code: k for k, code in enumerate(CODES)}
+INDEX_CODES.update({code.lower(): k for k, code in enumerate(CODES)})
+VOISINS = tuple(tuple(i * DIMENSION + j for i, j in ((k // DIMENSION - 1, k % DIMENSION),
+                                                      (k // DIMENSION + 1, k % DIMENSION),
+                                                      (k // DIMENSION, k % DIMENSION - 1),
+                                                      (k // DIMENSION, k % DIMENSION + 1))
+                      if 0 <= i < DIMENSION and 0 <= j < DIMENSION)
+                for k in range(NB_CASES))
+
+# Masques d'occupation: le bit k d'un entier correspond à la case k. La copie transposée de l'occupation utilise le
+# bit j * DIMENSION + i pour la case (i, j), de sorte qu'une colonne y devienne une suite de bits consécutifs.
+TOUTES_CASES = (1 << NB_CASES) - 1
+PREMIERE_COLONNE = sum(1 << (i * DIMENSION) for i in range(DIMENSION))
+DERNIERE_COLONNE = PREMIERE_COLONNE << (DIMENSION - 1)
+MASQUES_VOISINS = tuple(sum(1 << voisin for voisin in VOISINS[k]) for k in range(NB_CASES))
+TRANSPOSEES = tuple((k % DIMENSION) * DIMENSION + k // DIMENSION for k in range(NB_CASES))
+# Clés de Zobrist (voir le module zobrist): la clé de la lettre de code ASCII c sur la case k est
+# CLES_CASES[k * NB_LETTRES + c - 65].
+CLES_CASES = tirer_cles(NB_CASES * NB_LETTRES, 0x475249)
+
+
+def dilater(masque):
+    """
+    Args:
+        masque (int): Un masque de cases.
+
+    Returns:
+        int: Le masque des cases voisines (en haut, en bas, à gauche ou à droite) d'au moins une case du masque.
+    """
+    return (((masque << 1) & ~PREMIERE_COLONNE) | ((masque >> 1) & ~DERNIERE_COLONNE)
+            | (masque << DIMENSION) | (masque >> DIMENSION)) & TOUTES_CASES
+
+
+def _sans_trou(masque, occupation):
+    """
+    Returns:
+        bool: True si toutes les cases entre le premier et le dernier bit du masque sont dans le masque ou occupées.
+    """
+    etendue = (1 << masque.bit_length()) - (masque & -masque)
+    return etendue & ~(masque | occupation) == 0
+
+
+class Croisement:
+    """
+    Contrainte imposée à une case vide par les jetons qui la touchent dans la direction perpendiculaire à un mot.
+    Par exemple, pour un mot horizontal, il s'agit des jetons placés juste au-dessus et juste en dessous de la case.
+
+    Attributes:
+        avant (str): Lettres placées juste avant la case (au-dessus ou à gauche).
+        apres (str): Lettres placées juste après la case (en dessous ou à droite).
+        points (int): Somme des valeurs des jetons de avant et apres (le pointage partiel du mot croisé).
+        permises (frozenset): Lettres qui forment un mot permis une fois placées entre avant et apres
+                              (None si la grille n'a pas de lexique).
+    """
+    def __init__(self, avant, apres, points, permises):
+        self.avant = avant
+        self.apres = apres
+        self.points = points
+        self.permises = permises
+
+
+class Verification:
+    """
+    Résultat de la vérification d'un coup sans le jouer (voir Grille.verifier_coups).
+
+    Attributes:
+        valide (bool): True si le coup peut être joué.
+        mots (list): Les mots (str) formés par le coup, dans l'ordre de Grille.mots_score_obtenus (vide si les
+                     positions sont invalides).
+        score (int): Les points que rapporterait le coup (0 si les positions sont invalides).
+        erreur (type): L'exception que lèverait Partie.jouer_coup (AucunJeton, PositionInvalideException ou
+                       MotNonPermisException), ou None si le coup est valide.
+    """
+    def __init__(self, mots=(), score=0, erreur=None):
+        self.valide = erreur is None
+        self.mots = list(mots)
+        self.score = score
+        self.erreur = erreur
+
+
+class Grille:
+    """
+    Cette classe représente la grille d'un plateau de scrabble, indépendamment de toute interface graphique.
+    Elle implémente les règles de placement des jetons et le calcul du pointage.
+
+    Les cases sont désignées à l'interne par un index entier k = i * dimension + j, où i est l'index de la ligne et j
+    celui de la colonne. Le contenu de la grille tient dans deux tableaux d'octets, ce qui rend la copie d'une grille
+    (voir copier) très peu coûteuse. Les cases spéciales sont décrites par les tables PRIMES, MULTIPLICATEURS_LETTRE et
+    MULTIPLICATEURS_MOT du module.
+
+    L'utilisateur de la classe, désignera les cases grâce à un code au format « XY » où X représente une lettre
+    comprise entre 'A' et 'O', et Y un nombre compris entre 1 et 15. Ex: K9, E15.
+    - La lettre désigne une ligne: 'A' pour la 1ère ligne, B pour la seconde ligne, etc.
+    - Le nombre désigne une colonne: 5 correspond à la 5ème colonne.
+    Par exemple:
+    - K9 permet de désigner la case à l'intersection de la 11ème ligne et de la 9ème colonne.
+    - E15 permet de désigner la case à l'intersection de la 5ème ligne et 15ème colonne.
+
+    Attributes:
+        dimension (int): La dimension (nombre de lignes et de colonnes) pour le plateau de scrabble. Dans notre cas, la
+                         dimension sera toujours égale à 15.
+        lettres (bytearray): Pour chaque case, le code ASCII de la lettre du jeton qui l'occupe (0 si la case est vide).
+        valeurs (bytearray): Pour chaque case, la valeur du jeton qui l'occupe (0 si la case est vide).
+        occupation (int): Masque des cases occupées (le bit k vaut 1 si la case k est occupée).
+        occupation_transposee (int): Même masque, pour la grille transposée (voir TRANSPOSEES).
+        lexique (Lexique): Lexique servant à calculer les lettres permises des croisements (None si aucun).
+        ancres (set): Index des cases vides voisines d'au moins une case occupée.
+        croisements_h (list): Pour chaque case vide, le Croisement qu'elle forme avec les jetons au-dessus et en
+                              dessous (utile pour jouer un mot horizontal), ou None.
+        croisements_v (list): Même chose avec les jetons à gauche et à droite (utile pour jouer un mot vertical).
+        empreinte (int): Empreinte de Zobrist des jetons de la grille (voir le module zobrist).
+
+        Les attributs ancres, croisements_h et croisements_v sont mis à jour à chaque ajout ou retrait de jeton, en ne
+        touchant qu'aux cases voisines du jeton concerné.
+    """
+    def __init__(self, lexique=None):
+        """
+        Constructeur. Crée une grille vide.
+
+        Args:
+            lexique (Lexique, optionnel): Lexique servant à calculer les lettres permises des croisements.
+        """
+        self.dimension = DIMENSION
+        self.lettres = bytearray(NB_CASES)
+        self.valeurs = bytearray(NB_CASES)
+        self.occupation = 0
+        self.occupation_transposee = 0
+        self.empreinte = 0
+
+        self.ancres = set()
+        self.croisements_h = [None] * NB_CASES
+        self.croisements_v = [None] * NB_CASES
+        self.definir_lexique(lexique)
+
+    def copier(self):
+        """
+        Crée une copie indépendante de la grille (sans interface graphique), par exemple pour explorer des coups.
+
+        Returns:
+            Grille: La copie.
+        """
+        copie = Grille.__new__(Grille)
+        copie.dimension = self.dimension
+        copie.lettres = self.lettres[:]
+        copie.valeurs = self.valeurs[:]
+        copie.occupation = self.occupation
+        copie.occupation_transposee = self.occupation_transposee
+        copie.empreinte = self.empreinte
+        copie.lexique = self.lexique
+        copie.ancres = set(self.ancres)
+        copie.croisements_h = self.croisements_h[:]
+        copie.croisements_v = self.croisements_v[:]
+        return copie
+
+    def case(self, i, j):
+        """
+        Construit une vue de la case à l'intersection de la ligne i et de la colonne j.
+        Modifier cette vue ne modifie pas la grille.
+
+        Args:
+            i (int): Index de la ligne.
+            j (int): Index de la colonne.
+
+        Returns:
+            Case: La case, avec son jeton occupant s'il y a lieu.
+        """
+        k = i * self.dimension + j
+        case = Case(*PRIMES[k])
+        if self.lettres[k]:
+            case.placer_jeton(Jeton(chr(self.lettres[k]), self.valeurs[k]))
+        return case
+
+    @property
+    def cases(self):
+        """
+        Vue en liste de liste de cases, conservée pour le code qui accède aux cases par cases[i][j].
+        Modifier ces cases ne modifie pas la grille.
+
+        Returns:
+            list: Liste de liste de cases (instances de la classe Case).
+        """
+        return [[self.case(i, j) for j in range(self.dimension)] for i in range(self.dimension)]
+
+    def definir_lexique(self, lexique):
+        """
+        Change le lexique de la grille et recalcule toutes les lettres permises des croisements.
+
+        Args:
+            lexique (Lexique): Le nouveau lexique (None si aucun).
+        """
+        self.lexique = lexique
+        for k in range(NB_CASES):
+            if not self.lettres[k]:
+                self.croisements_h[k] = self._calculer_croisement(k, DIMENSION)
+                self.croisements_v[k] = self._calculer_croisement(k, 1)
+
+    def _calculer_croisement(self, k, pas):
+        """
+        Calcule le croisement de la case vide k avec les jetons situés avant et après elle, en avançant de pas
+        (DIMENSION pour les jetons au-dessus et en dessous, 1 pour ceux à gauche et à droite).
+
+        Returns:
+            Croisement: Le croisement, ou None si aucun jeton ne touche la case dans cette direction.
+        """
+        lettres, valeurs = self.lettres, self.valeurs
+        debut = k
+        while self._suivante(debut, -pas) is not None and lettres[debut - pas]:
+            debut -= pas
+        fin = k
+        while self._suivante(fin, pas) is not None and lettres[fin + pas]:
+            fin += pas
+        if debut == fin:
+            return None
+        avant = lettres[debut:k:pas].decode()
+        apres = lettres[k + pas:fin + 1:pas].decode()
+        points = sum(valeurs[debut:fin + 1:pas])
+
+        permises = None
+        if self.lexique is not None:
+            permises = set()
+            noeud = self.lexique.racine()
+            for lettre in avant:
+                noeud = self.lexique.enfant(noeud, lettre)
+                if noeud is None:
+                    break
+            if noeud is not None:
+                for lettre, suivant in self.lexique.enfants(noeud):
+                    for lettre_apres in apres:
+                        suivant = self.lexique.enfant(suivant, lettre_apres)
+                        if suivant is None:
+                            break
+                    if suivant is not None and self.lexique.est_terminal(suivant):
+                        permises.add(lettre)
+            permises = frozenset(permises)
+        return Croisement(avant, apres, points, permises)
+
+    def _suivante(self, k, pas):
+        """
+        Returns:
+            int: L'index de la case voisine de k en avançant de pas (±1 ou ±DIMENSION), ou None si on sort de la grille.
+        """
+        if pas == 1:
+            return k + 1 if k % DIMENSION < DIMENSION - 1 else None
+        if pas == -1:
+            return k - 1 if k % DIMENSION > 0 else None
+        suivante = k + pas
+        return suivante if 0 <= suivante < NB_CASES else None
+
+    def _mettre_a_jour_voisinage(self, k):
+        """
+        Met à jour les ancres et les croisements touchés par l'ajout ou le retrait d'un jeton à la case k: la case
+        elle-même, ses voisines directes et la première case vide au bout de chaque suite de jetons qui la touche.
+        """
+        lettres = self.lettres
+        for pas, croisements in ((DIMENSION, self.croisements_h), (1, self.croisements_v)):
+            croisements[k] = None if lettres[k] else self._calculer_croisement(k, pas)
+            for sens in (-pas, pas):
+                suivante = self._suivante(k, sens)
+                while suivante is not None and lettres[suivante]:
+                    suivante = self._suivante(suivante, sens)
+                if suivante is not None:
+                    croisements[suivante] = self._calculer_croisement(suivante, pas)
+
+        for case in (k,) + VOISINS[k]:
+            if not lettres[case] and self.occupation & MASQUES_VOISINS[case]:
+                self.ancres.add(case)
+            else:
+                self.ancres.discard(case)
+
+    def code_position_est_valide(self, code):
+        """
+        Méthode permettant de valider si un code de positionnement sur le tableau est valide ou pas.
+
+        Args:
+            code (str): Chaîne au format « XY » ou « xy » représentant un
+            code de positionnement.
+
+        Returns:
+            bool: True si le code passé en argument est un code de positionnement au format « XY » ou « xy » valide,
+                  False sinon.
+        """
+        if code in INDEX_CODES:
+            return True
+        code = code.upper()
+        valide = 2 <= len(code) <= 3 and code[0].isalpha() and code[1:].isdigit()
+        if valide:
+            index_ligne = ord(code[0]) - ord('A')
+            index_colonne = int(code[1:]) - 1
+            return 0 <= index_ligne < self.dimension and 0 <= index_colonne < self.dimension
+        return False
+
+    def index_position(self, code):
+        """
+        Méthode servant à transformer un code de positionnement sur le plateau en index de case.
+
+        Args:
+            code (str): Chaîne au format « XY » ou « xy » représentant un code de positionnement.
+
+        Returns:
+            int: Index de la case (i * dimension + j).
+
+        Raises:
+            PositionInvalideException: Si le code de la position est invalide.
+        """
+        k = INDEX_CODES.get(code)
+        if k is None:
+            index_ligne, index_colonne = self.decode_position(code)
+            k = index_ligne * self.dimension + index_colonne
+        return k
+
+    def decode_position(self, code):
+        """
+        Méthode servant à transformer un code de positionnement sur
+        le plateau en index d'accès de ligne et de colonne sur le plateau.
+
+        Args:
+            code (str): Chaîne au format « XY » ou « xy » représentant un
+            code de positionnement.
+
+        Returns:
+            int: Index de la ligne
+            int: Index de la colonne
+
+        Raises:
+            AssertionError: Si le code de la position est invalide.
+        """
+        k = INDEX_CODES.get(code)
+        if k is not None:
+            return divmod(k, self.dimension)
+        if not self.code_position_est_valide(code):
+            raise PositionInvalideException
+
+        code = code.upper()
+        index_ligne = ord(code[0]) - ord('A')
+        index_colonne = int(code[1:]) - 1
+        return index_ligne, index_colonne
+
+    def case_est_vide(self, position_code):
+        """
+        Permet de déterminer si une case est vide, c'est-à-dire qu'elle ne contient pas de jeton.
+
+        Args:
+            position_code (str): code de positionnement de la case sur le plateau (au format « XY » ou « xy »).
+
+        Returns:
+            bool: True si la case est vide, False sinon.
+        """
+        return not self.lettres[self.index_position(position_code)]
+
+    def est_vide(self):
+        """
+        Permet de déterminer si le plateau est vide, c'est à dire que toutes les cases sont vides.
+
+        Returns:
+            bool: True si le plateau est vide, False sinon.
+        """
+        return self.occupation == 0
+
+    def placer_jeton_index(self, jeton, k):
+        """
+        Place un jeton dans la case vide d'index k.
+
+        Args:
+            jeton (Jeton): Le jeton à placer.
+            k (int): Index de la case.
+        """
+        self.lettres[k] = ord(jeton.lettre)
+        self.valeurs[k] = jeton.valeur
+        self.occupation |= 1 << k
+        self.occupation_transposee |= 1 << TRANSPOSEES[k]
+        self.empreinte ^= CLES_CASES[k * NB_LETTRES + self.lettres[k] - 65]
+        self._mettre_a_jour_voisinage(k)
+
+    def retirer_jeton_index(self, k):
+        """
+        Retire le jeton de la case occupée d'index k.
+
+        Args:
+            k (int): Index de la case.
+
+        Returns:
+            Jeton: Le jeton retiré.
+        """
+        jeton = Jeton(chr(self.lettres[k]), self.valeurs[k])
+        self.empreinte ^= CLES_CASES[k * NB_LETTRES + self.lettres[k] - 65]
+        self.lettres[k] = 0
+        self.valeurs[k] = 0
+        self.occupation &= ~(1 << k)
+        self.occupation_transposee &= ~(1 << TRANSPOSEES[k])
+        self._mettre_a_jour_voisinage(k)
+        return jeton
+
+    def ajouter_jeton(self, jeton, position_code):
+        """
+        Permet d'ajouter un jeton dans une case vide du plateau.
+        La case est indiquée grâce à son code de positionnement.
+
+        Args:
+            jeton (Jeton): Le jeton à ajouter sur le plateau.
+            position_code (str): La position où ajouter (au format « XY » ou « xy »)
+
+
+        Returns:
+            bool: True si le jeton a été placé avec succès;
+                False sinon (si la case est déjà occupée).
+        """
+        if self.code_position_est_valide(position_code) and self.case_est_vide(position_code):
+            self.placer_jeton_index(jeton, self.index_position(position_code))
+            return True
+        else:
+            return False
+
+    def retirer_jeton(self, position_code):
+        """
+        Permet d'enlever le jeton dans une case du plateau.
+        La case est indiquée grâce à son code de positionnement.
+
+        Args:
+            position_code (str): La position où enlever le jeton (au format « XY » ou « xy »).
+
+        Returns:
+             Jeton: Le jeton retiré du plateau, ou None si la case est vide.
+        """
+        if self.code_position_est_valide(position_code) and not self.case_est_vide(position_code):
+            return self.retirer_jeton_index(self.index_position(position_code))
+        else:
+            return None
+
+    def cases_adjacentes_occupees(self, position_code):
+        """
+        Étant donné une position, cette méthode permet de voir si au moins  l'une de ses positions voisines est occupée.
+        Les cases voisines sont les cases juste en haut, en bas, à gauche et à droite de la case concernée.
+        NB: Les cases voisines diagonales ne comptent pas.
+
+        Args:
+            position_code (str): La position d'intérêt.
+
+        Returns:
+            bool: True si au moins l'une des cases voisines est occupée,
+                  False si aucune case voisine n'est occupée.
+        """
+        return self.occupation & MASQUES_VOISINS[self.index_position(position_code)] != 0
+
+    def valider_positions_avant_ajout(self, positions_codes):
+        """
+        Cette méthode implémente certaines règles du jeu donc soyez attentifs au texte ci-dessous.
+        Étant donné des positions_codes où un utilisateur veut placer ses jetons, cette méthode permet de valider s'il
+        peut réelement ajouter les jetons à ces positions.
+
+        Les positions sont valides si:
+         - elles sont toutes vides;
+         - elles sont toutes sur la même ligne ou la même colonne;
+         - une fois qu'elles seront placées sur une même ligne ou une même colonne, elles formeront un mot et pas plus
+           sur cette même ligne ou colonne. Ici, le mot formé n'est pas important du tout donc on n'essaie pas de le
+           valider. Par exemple, si toutes les positions sont sur la ligne 5, le code s'assure simplememt
+           qu'entre les positions où l'on doit ajouter des jetons, des cases ne sont vides.
+         - si le plateau est vide, le centre du plateau doit être dans les positions;
+         - sinon, au moins une des positions doit être adjacente à une des cases occupées du plateau.
+
+        Args:
+            positions_codes (list): liste de chaînes de caractères (str) représentant les positions où on veut ajouter
+                                    des jetons.
+
+        Returns:
+            bool: True si les positions sont valides, False sinon.
+        """
+        masque, masque_transpose, lignes, cols = 0, 0, set(), set()
+        for p in positions_codes:
+            k = self.index_position(p)
+            masque |= 1 << k
+            masque_transpose |= 1 << TRANSPOSEES[k]
+            lignes.add(k // DIMENSION)
+            cols.add(k % DIMENSION)
+        meme_ligne, meme_col = len(lignes) == 1, len(cols) == 1
+        valide = (meme_ligne or meme_col) and masque & self.occupation == 0
+        if valide:
+            if self.occupation == 0:
+                valide = masque >> CENTRE & 1 == 1
+            else:
+                valide = dilater(self.occupation) & masque != 0
+
+            if valide:
+                if meme_ligne:
+                    valide = _sans_trou(masque, self.occupation)
+                else:
+                    valide = _sans_trou(masque_transpose, self.occupation_transposee)
+        if not valide:
+            raise PositionInvalideException
+        return valide
+
+    def placer_mots(self, jetons_a_ajouter, position_codes):
+        """
+        Permet de placer plusieurs jetons sur le plateau afin de former un ou plusieurs mots.
+
+        Args:
+            jetons_a_ajouter (list): Jetons à ajouter pour placer nos mots (instances de la classe Jeton).
+            position_codes (list): Liste de chaînes de caractères (str) représentant les positions où placer les jetons.
+
+        Returns:
+            list: Liste des mots (str) formés avec les jetons si l'ajout a été fait, liste vide sinon.
+            int: Points obtenus si l'ajout a été fait, 0 sinon.
+
+        Raises:
+            AssertionError:
+                - Si le nombre de jetons à ajouter est différent du nombre de positions fournies.
+                - Si les positions sont invalides.
+        """
+
+        if not len(jetons_a_ajouter) == len(position_codes):
+            raise PositionInvalideException
+
+        if not self.valider_positions_avant_ajout(position_codes):
+            raise PositionInvalideException
+
+        for i in range(len(jetons_a_ajouter)):
+            self.ajouter_jeton(jetons_a_ajouter[i], position_codes[i])
+
+        mots, score = self.mots_score_obtenus(position_codes)
+        return mots, score
+
+    def verifier_coup(self, jetons, positions, verifier_mots=True):
+        """
+        Vérifie un seul coup sans modifier la grille (voir verifier_coups).
+
+        Returns:
+            Verification: Le résultat de la vérification.
+        """
+        return self.verifier_coups([(jetons, positions)], verifier_mots)[0]
+
+    def verifier_coups(self, coups, verifier_mots=True):
+        """
+        Vérifie plusieurs coups sur l'état actuel de la grille, sans la modifier: pour chacun, on valide les positions
+        (mêmes règles que valider_positions_avant_ajout), puis on trouve les mots formés et leur pointage (mêmes
+        résultats que placer_mots suivi de mots_score_obtenus).
+
+        Les coups partagent le travail fait une fois pour la grille: les mots croisés et leurs lettres permises sont
+        lus dans croisements_h et croisements_v, et chaque mot principal n'est cherché qu'une fois dans le lexique.
+
+        Args:
+            coups (iterable): Les coups, des paires (jetons, positions) comme pour placer_mots.
+            verifier_mots (bool): Si True (par défaut) et que la grille a un lexique, les mots formés doivent y être.
+
+        Returns:
+            list: Une Verification par coup, dans le même ordre.
+        """
+        lexique = self.lexique if verifier_mots else None
+        mots_permis = {}
+        voisinage = dilater(self.occupation) if self.occupation else 1 << CENTRE
+        resultats = []
+
+        for jetons, positions in coups:
+            erreur, nouveaux, ordre, meme_ligne, meme_colonne = self._valider_placement(jetons, positions, voisinage)
+            if erreur is not None:
+                resultats.append(Verification(erreur=erreur))
+                continue
+            mots, details = self._extraire_mots(nouveaux, ordre, meme_ligne, meme_colonne)
+            if not mots:
+                resultats.append(Verification(erreur=PositionInvalideException))
+                continue
+            if lexique is not None and not self._mots_permis(mots, details, nouveaux, lexique, mots_permis):
+                erreur = MotNonPermisException
+            resultats.append(Verification(mots, self._points_mots(mots, details, nouveaux), erreur))
+        return resultats
+
+    def _valider_placement(self, jetons, positions, voisinage):
+        """
+        Valide les positions d'un coup (voir verifier_coups).
+
+        Args:
+            jetons (list): Les jetons à placer.
+            positions (list): Les positions des jetons.
+            voisinage (int): Les cases voisines des jetons déjà placés (la case du centre si la grille est vide).
+
+        Returns:
+            type: L'exception que lèverait le coup (AucunJeton ou PositionInvalideException), ou None.
+            dict: Les jetons à placer, par index de case (None si le placement est invalide).
+            list: Les index des nouvelles cases, en ordre croissant.
+            bool: True si les nouvelles cases sont sur une même ligne.
+            bool: True si les nouvelles cases sont sur une même colonne.
+        """
+        if len(positions) == 0:
+            return AucunJeton, None, None, False, False
+        lettres = self.lettres
+        nouveaux = {}
+        for jeton, position in zip(jetons, positions):
+            k = INDEX_CODES.get(position)
+            if k is None and self.code_position_est_valide(position):
+                k = self.index_position(position)
+            if k is None or k in nouveaux or lettres[k]:
+                break
+            nouveaux[k] = jeton
+        if len(nouveaux) != len(positions) or len(jetons) != len(positions):
+            return PositionInvalideException, None, None, False, False
+
+        masque, masque_transpose = 0, 0
+        for k in nouveaux:
+            masque |= 1 << k
+            masque_transpose |= 1 << TRANSPOSEES[k]
+        ordre = sorted(nouveaux)
+        meme_ligne = ordre[0] // DIMENSION == ordre[-1] // DIMENSION
+        meme_colonne = all(k % DIMENSION == ordre[0] % DIMENSION for k in ordre)
+        if not (meme_ligne or meme_colonne) or not masque & voisinage or \
+                not (_sans_trou(masque, self.occupation) if meme_ligne
+                     else _sans_trou(masque_transpose, self.occupation_transposee)):
+            return PositionInvalideException, None, None, False, False
+        return None, nouveaux, ordre, meme_ligne, meme_colonne
+
+    def _extraire_mots(self, nouveaux, ordre, meme_ligne, meme_colonne):
+        """
+        Trouve les mots formés par un coup dont le placement est valide, dans l'ordre de mots_score_obtenus.
+
+        Args:
+            nouveaux (dict): Les jetons à placer, par index de case.
+            ordre (list): Les index des nouvelles cases, en ordre croissant.
+            meme_ligne (bool): True si les nouvelles cases sont sur une même ligne.
+            meme_colonne (bool): True si les nouvelles cases sont sur une même colonne.
+
+        Returns:
+            list: Les mots (str).
+            list: Pour chaque mot, une paire (k, croisement): pour le mot principal, k est sa première case et
+                  croisement est le pas (1 ou DIMENSION, un entier); pour un mot croisé, k est la nouvelle case et
+                  croisement est son Croisement.
+        """
+        mots, details = [], []
+        for pas, croisements, principal in ((1, self.croisements_v, meme_ligne and len(ordre) > 1),
+                                            (DIMENSION, self.croisements_h, meme_colonne and len(ordre) > 1)):
+            if principal:
+                mot, debut = self._mot_principal(ordre[0], pas, nouveaux)
+                mots.append(mot)
+                details.append((debut, pas))
+                continue
+            for k in ordre:
+                croisement = croisements[k]
+                if croisement is not None:
+                    mots.append(croisement.avant + nouveaux[k].lettre + croisement.apres)
+                    details.append((k, croisement))
+        return mots, details
+
+    def _mots_permis(self, mots, details, nouveaux, lexique, mots_permis):
+        """
+        Cherche dans le lexique les mots formés par un coup (voir _extraire_mots). Un mot croisé est validé par les
+        lettres permises de son croisement lorsqu'elles sont connues.
+
+        Args:
+            mots (list): Les mots formés.
+            details (list): Les cases et croisements des mots (voir _extraire_mots).
+            nouveaux (dict): Les jetons à placer, par index de case.
+            lexique (Lexique): Le lexique.
+            mots_permis (dict): Les mots principaux déjà cherchés pendant la vérification (mis à jour).
+
+        Returns:
+            bool: True si tous les mots sont permis.
+        """
+        for mot, (k, croisement) in zip(mots, details):
+            if type(croisement) is int:
+                if mot not in mots_permis:
+                    mots_permis[mot] = mot in lexique
+                permis = mots_permis[mot]
+            elif croisement.permises is not None:
+                permis = nouveaux[k].lettre in croisement.permises
+            else:
+                permis = mot in lexique
+            if not permis:
+                return False
+        return True
+
+    def _points_mots(self, mots, details, nouveaux):
+        """
+        Calcule les points des mots formés par un coup (voir _extraire_mots).
+
+        Args:
+            mots (list): Les mots formés.
+            details (list): Les cases et croisements des mots (voir _extraire_mots).
+            nouveaux (dict): Les jetons à placer, par index de case.
+
+        Returns:
+            int: Les points.
+        """
+        valeurs, multiplicateurs_lettre, multiplicateurs_mot = self.valeurs, MULTIPLICATEURS_LETTRE, MULTIPLICATEURS_MOT
+        score = 0
+        for mot, (k, croisement) in zip(mots, details):
+            if type(croisement) is int:
+                score_mot, multiplicateur = 0, 1
+                for i in range(k, k + len(mot) * croisement, croisement):
+                    jeton = nouveaux.get(i)
+                    if jeton is None:
+                        score_mot += valeurs[i]
+                    else:
+                        score_mot += jeton.valeur * multiplicateurs_lettre[i]
+                        multiplicateur *= multiplicateurs_mot[i]
+                score += score_mot * multiplicateur
+            else:
+                jeton = nouveaux[k]
+                score += (croisement.points + jeton.valeur * multiplicateurs_lettre[k]) * multiplicateurs_mot[k]
+        return score
+
+    def _mot_principal(self, premiere, pas, nouveaux):
+        """
+        Lit, sans modifier la grille, le mot qui passe par les nouvelles cases à partir de premiere en avançant de
+        pas, prolongé par les jetons déjà placés de part et d'autre.
+
+        Args:
+            premiere (int): La première nouvelle case.
+            pas (int): 1 pour un mot horizontal, DIMENSION pour un mot vertical.
+            nouveaux (dict): Les jetons à placer, par index de case.
+
+        Returns:
+            str: Le mot.
+            int: La première case du mot.
+        """
+        lettres = self.lettres
+        k = premiere
+        precedente = self._suivante(k, -pas)
+        while precedente is not None and lettres[precedente]:
+            k, precedente = precedente, self._suivante(precedente, -pas)
+        debut, mot = k, ''
+        while k is not None and (lettres[k] or k in nouveaux):
+            mot += nouveaux[k].lettre if k in nouveaux else chr(lettres[k])
+            k = self._suivante(k, pas)
+        return mot, debut
+
+    def mots_score_obtenus(self, nouvelles_positions):
+        """
+        Trouver les mots ajoutés et le score total obtenu lorsque le joueur
+        vient juste d'ajouter des jetons aux positions de la liste en argument.
+        Seules les cases des mots qui passent par les nouvelles positions sont parcourues.
+
+        Args:
+            nouvelles_positions (list): Liste de chaînes de caractères (str) représentant les dernières positions où des
+                                        jetons ont été ajoutés.
+        Returns
+            list: Liste de tous les mots (str) formés par l'ajout de jetons aux nouvelles positions.
+            int: Somme des points obtenus par l'ajout de ces mots.
+        """
+        index = {self.index_position(p) for p in nouvelles_positions}
+        mots, score_total = [], 0
+        for pas in (1, DIMENSION):
+            debuts = set()
+            for k in sorted(index):
+                if not self.lettres[k]:
+                    continue
+                precedente = self._suivante(k, -pas)
+                while precedente is not None and self.lettres[precedente]:
+                    k, precedente = precedente, self._suivante(precedente, -pas)
+                if k in debuts:
+                    continue
+                debuts.add(k)
+                mot, score = self._mot_et_score(k, pas, index)
+                if len(mot) > 1:
+                    mots.append(mot)
+                    score_total += score
+        return mots, score_total
+
+    def _mot_et_score(self, k, pas, index):
+        """
+        Lit le mot qui commence à la case occupée k en avançant de pas (1 ou DIMENSION) et calcule son score.
+        Les cases spéciales ne comptent que pour les nouvelles positions (l'ensemble index).
+
+        Returns:
+            str: Le mot.
+            int: Le score du mot.
+        """
+        mot, score_mot, multiplicateur = '', 0, 1
+        while k is not None and self.lettres[k]:
+            mot += chr(self.lettres[k])
+            if k in index:
+                score_mot += self.valeurs[k] * MULTIPLICATEURS_LETTRE[k]
+                multiplicateur *= MULTIPLICATEURS_MOT[k]
+            else:
+                score_mot += self.valeurs[k]
+            k = self._suivante(k, pas)
+        return mot, score_mot * multiplicateur
+
+    def mots_et_score_sur_ligne_ou_colonne(self, nouvelles_positions, ligne=None, colonne=None):
+        """
+        Permet de trouver les mots sur une ligne ou une colonne et le score associé.
+
+        Args:
+            nouvelles_positions (list): Liste de chaînes de caractères (str) représentant les dernières positions où des
+                                        jetons ont été ajoutés.
+
+            ligne (int, optionnel): Index de la ligne d'intérêt
+            colonne: (int, optionnel): Index de la colonne d'intérêt
+
+        Returns:
+            list: La liste des mots (str) trouvés sur la ligne ou la colonne.
+            int: Score total.
+
+            Plus précisément la liste devra contenir au maximum un élément car un tout nouvel ajout de jetons ne peut
+            pas créer plus d'un mot sur la même ligne ou colonne.
+
+        Raises:
+            AssertionError: Si la ligne et la colonne sont spécifiées ou aucun des deux ne l'est. Pour les curieux(ses),
+                            il s'agit d'un OU Exclusif (XOR): https://fr.wikipedia.org/wiki/Fonction_OU_exclusif).
+        """
+        if not (ligne is None) ^ (colonne is None):
+            raise CaseOccupeeException
+
+        index = {self.index_position(p) for p in nouvelles_positions}
+        if ligne is not None:
+            debut, pas = ligne * DIMENSION, 1
+        else:
+            debut, pas = colonne, DIMENSION
+        mots, score_total = [], 0
+        for k in range(debut, debut + DIMENSION * pas, pas):
+            precedente = self._suivante(k, -pas)
+            if not self.lettres[k] or (precedente is not None and self.lettres[precedente]):
+                continue
+            mot, score = self._mot_et_score(k, pas, index)
+            fin = k + len(mot) * pas
+            if len(mot) > 1 and any(c in index for c in range(k, fin, pas)):
+                mots.append(mot)
+                score_total += score
+
+        return mots, score_total
+
+    def __str__(self):
+        """
+        Formatage du plateau pour l'affichage.
+        Utilise des codes Unicode, ce qui pourrait causer des problèmes avec le système d'exploitation utilisé par
+        certains. Écrivez-nous sur le forum si cela vous arrive!
+
+        Returns:
+            str: Chaîne de caractères représentant un tableau.
+        """
+        ligne_separation = '  +' + '----+' * self.dimension + '\n'
+        chaine = '   '
+        for colonne in range(self.dimension):
+            chaine += "{:^5d}".format(colonne+1)
+        chaine += '\n'
+        chaine += ligne_separation
+        for rangee in range(self.dimension):
+            chaine += '{} |'.format(chr(ord('A')+rangee))
+            for colonne in range(self.dimension):
+                case = self.case(rangee, colonne)
+                if rangee == colonne and rangee == 7 and case.est_vide():
+                    s = '\x1b[0;30;{}m{:^4s}\x1b[0m'.format(case.code_couleur(), '★')
+                else:
+                    s = '{:^4s}'.format(str(case))
+                chaine += s + '|'
+            chaine += ' {}\n'.format(chr(ord('A') + rangee))
+            chaine += ligne_separation
+        chaine += '   '
+        for colonne in range(self.dimension):
+            chaine += "{:^5d}".format(colonne+1)
+        chaine += '\n'
+        return chaine
@@ -0,0 +1,208 @@
+"""
+Mesure du temps passé dans chaque phase d'un tour de jeu.
+
+L'instrumentation est désactivée par défaut et ne coûte alors rien: les méthodes mesurées ne sont enveloppées qu'à
+l'activation (voir activer) et sont remises en place à la désactivation. Pour chaque phase, on compte les appels, les
+appels interrompus par une exception (un coup refusé, par exemple) et on classe leur durée dans un histogramme. Les
+mesures s'exportent en JSON ou au format texte de Prometheus.
+
+Exemple:
+    with instrumentation.activee():
+        partie.jouer_coup(jetons, positions)
+    print(instrumentation.exporter_prometheus())
+"""
+import functools
+import importlib
+import json
+import time
+from contextlib import contextmanager
+
+# Phases mesurables: pour chacune, le module, la classe et la méthode à envelopper. Un coup est vérifié par
+# Grille.verifier_coups (appelée par Partie.jouer_coup), qui enchaîne pour chaque coup la validation des positions,
+# l'extraction des mots (principal et croisés), leur recherche dans le lexique et le calcul des points.
+PHASES = {
+    'jouer_coup': ('tp4.partie', 'Partie', 'jouer_coup'),
+    'verifier_coups': ('tp4.grille', 'Grille', 'verifier_coups'),
+    'valider_positions': ('tp4.grille', 'Grille', '_valider_placement'),
+    'extraire_mots': ('tp4.grille', 'Grille', '_extraire_mots'),
+    'mots_permis': ('tp4.grille', 'Grille', '_mots_permis'),
+    'pointage': ('tp4.grille', 'Grille', '_points_mots'),
+    'tirer_jetons': ('tp4.partie', 'Partie', 'tirer_jetons'),
+    'dessiner': ('tp4.plateau', 'Plateau', 'dessiner'),
+}
+
+# Bornes supérieures des classes des histogrammes, en secondes (la dernière classe, sans borne, est implicite).
+BORNES = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+PREFIXE_PROMETHEUS = 'scrabble_phase'
+
+# Mesures de chaque phase, par nom, et méthodes d'origine des phases instrumentées.
+_MESURES = {}
+_ORIGINALES = {}
+
+
+class Mesure:
+    """
+    Mesures d'une phase.
+
+    Attributes:
+        appels (int): Nombre d'appels.
+        erreurs (int): Nombre d'appels interrompus par une exception.
+        total (float): Durée totale des appels, en secondes.
+        classes (list): Pour chaque borne de BORNES, puis pour les durées plus longues, le nombre d'appels dont la
+                        durée tombe dans cette classe (et pas dans une classe précédente).
+    """
+    def __init__(self):
+        self.appels = 0
+        self.erreurs = 0
+        self.total = 0.0
+        self.classes = [0] * (len(BORNES) + 1)
+
+    def observer(self, duree):
+        """
+        Ajoute un appel d'une durée donnée.
+
+        Args:
+            duree (float): La durée de l'appel, en secondes.
+        """
+        self.appels += 1
+        self.total += duree
+        for i, borne in enumerate(BORNES):
+            if duree <= borne:
+                self.classes[i] += 1
+                return
+        self.classes[-1] += 1
+
+    def en_dict(self):
+        """
+        Returns:
+            dict: Les mesures, prêtes à être écrites en JSON (les classes sont cumulatives, comme dans Prometheus).
+        """
+        cumul, histogramme = 0, {}
+        for borne, nombre in zip(BORNES + ('+Inf',), self.classes):
+            cumul += nombre
+            histogramme[str(borne)] = cumul
+        return {
+            'appels': self.appels,
+            'erreurs': self.erreurs,
+            'total_secondes': self.total,
+            'moyenne_secondes': self.total / self.appels if self.appels else 0.0,
+            'histogramme': histogramme,
+        }
+
+
+def _envelopper(methode, mesure):
+    @functools.wraps(methode)
+    def enveloppe(*args, **kwargs):
+        debut = time.perf_counter()
+        try:
+            return methode(*args, **kwargs)
+        except BaseException:
+            mesure.erreurs += 1
+            raise
+        finally:
+            mesure.observer(time.perf_counter() - debut)
+    return enveloppe
+
+
+def activer(phases=None):
+    """
+    Active l'instrumentation des phases données. Les mesures déjà prises sont conservées.
+
+    Args:
+        phases (iterable, optionnel): Noms des phases (voir PHASES). Par défaut, toutes les phases dont le module peut
+                                      être importé (sans tkinter, la phase dessiner est ignorée).
+
+    Raises:
+        KeyError: Si une phase est inconnue.
+        ImportError: Si le module d'une phase demandée explicitement ne peut pas être importé.
+    """
+    explicites = phases is not None
+    for phase in PHASES if phases is None else phases:
+        if phase in _ORIGINALES:
+            continue
+        nom_module, nom_classe, nom_methode = PHASES[phase]
+        try:
+            classe = getattr(importlib.import_module(nom_module), nom_classe)
+        except ImportError:
+            if explicites:
+                raise
+            continue
+        originale = classe.__dict__[nom_methode]
+        _ORIGINALES[phase] = (classe, nom_methode, originale)
+        setattr(classe, nom_methode, _envelopper(originale, _MESURES.setdefault(phase, Mesure())))
+
+
+def desactiver():
+    """
+    Remet en place les méthodes d'origine de toutes les phases instrumentées. Les mesures sont conservées.
+    """
+    for classe, nom_methode, originale in _ORIGINALES.values():
+        setattr(classe, nom_methode, originale)
+    _ORIGINALES.clear()
+
+
+def est_active():
+    """
+    Returns:
+        bool: True si au moins une phase est instrumentée.
+    """
+    return bool(_ORIGINALES)
+
+
+@contextmanager
+def activee(phases=None):
+    """
+    Active l'instrumentation le temps d'un bloc with (voir activer), puis la désactive.
+    """
+    activer(phases)
+    try:
+        yield
+    finally:
+        desactiver()
+
+
+def reinitialiser():
+    """
+    Efface toutes les mesures.
+    """
+    for mesure in _MESURES.values():
+        mesure.__init__()
+
+
+def mesures():
+    """
+    Returns:
+        dict: Les mesures de chaque phase qui a été instrumentée, par nom (voir Mesure.en_dict).
+    """
+    return {phase: mesure.en_dict() for phase, mesure in _MESURES.items()}
+
+
+def exporter_json():
+    """
+    Returns:
+        str: Les mesures, en JSON.
+    """
+    return json.dumps(mesures(), indent=2)
+
+
+def exporter_prometheus():
+    """
+    Returns:
+        str: Les mesures au format texte de Prometheus: un histogramme de durées et un compteur d'erreurs, avec une
+             étiquette phase.
+    """
+    nom = f'{PREFIXE_PROMETHEUS}_duree_secondes'
+    lignes = [f'# HELP {nom} Durée des phases du tour de jeu.', f'# TYPE {nom} histogram']
+    for phase, mesure in _MESURES.items():
+        cumul = 0
+        for borne, nombre in zip(BORNES + ('+Inf',), mesure.classes):
+            cumul += nombre
+            lignes.append(f'{nom}_bucket{{phase="{phase}",le="{borne}"}} {cumul}')
+        lignes.append(f'{nom}_sum{{phase="{phase}"}} {mesure.total}')
+        lignes.append(f'{nom}_count{{phase="{phase}"}} {mesure.appels}')
+    erreurs = f'{PREFIXE_PROMETHEUS}_erreurs_total'
+    lignes += [f'# HELP {erreurs} Appels interrompus par une exception.', f'# TYPE {erreurs} counter']
+    for phase, mesure in _MESURES.items():
+        lignes.append(f'{erreurs}{{phase="{phase}"}} {mesure.erreurs}')
+    return '\n'.join(lignes) + '\n'
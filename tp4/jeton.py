@@ -2,15 +2,22 @@ class Jeton:
     """
     Cette classe représente un jeton.
 
+    Les jetons sont immuables et partagés: il n'existe qu'un seul objet Jeton par couple (lettre, valeur), que l'on
+    obtient en appelant Jeton(lettre, valeur) autant de fois que nécessaire.
+
     Attributes:
         lettre (str): La lettre écrite sur le jeton. Par convention toutes les lettres au scrabble sont en majuscules.
                       Dans ce travail nous ne considérons pas les jetons blancs (jokers) qui n'ont aucune lettre inscrite.
         valeur (int): Nombre de points associé au jeton (compris entre 0 et 20).
     """
-    def __init__(self, lettre, valeur):
+    __slots__ = ('lettre', 'valeur')
+    _instances = {}
+
+    def __new__(cls, lettre, valeur):
         """
         Constructeur de la classe.
-        Permet de créer un Jeton à partir d'une lettre et d'un nombre de points
+        Permet d'obtenir le Jeton d'une lettre et d'un nombre de points. Le jeton n'est créé (et validé) que la
+        première fois.
 
         Args:
             lettre (str): La lettre écrite sur le jeton (un caractère minuscule).
@@ -21,13 +28,30 @@ class Jeton:
                 - Si la valeur n'est pas comprise entre 0 et 20 (0 et 20 étant inclus).
                 - Si la lettre n'est pas en majuscule.
         """
-        # On valide les pré-conditions
-        assert len(lettre) == 1 and lettre.isupper() and lettre.isalpha(), 'Lettre incorrecte.'
-        assert 0 <= valeur <= 20, 'Valeur incorrecte.'
+        jeton = cls._instances.get((lettre, valeur))
+        if jeton is None:
+            # On valide les pré-conditions
+            assert len(lettre) == 1 and lettre.isupper() and lettre.isalpha(), 'Lettre incorrecte.'
+            assert 0 <= valeur <= 20, 'Valeur incorrecte.'
+
+            # On initialise les différents attributs
+            jeton = object.__new__(cls)
+            object.__setattr__(jeton, 'lettre', lettre)
+            object.__setattr__(jeton, 'valeur', valeur)
+            jeton = cls._instances.setdefault((lettre, valeur), jeton)
+        return jeton
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError('Un jeton est immuable.')
 
-        # On initialise les différents attributs
-        self.lettre = lettre
-        self.valeur = valeur
+    def __delattr__(self, nom):
+        raise AttributeError('Un jeton est immuable.')
+
+    def __reduce__(self):
+        """
+        Permet de copier ou de sérialiser un jeton (pickle) en retrouvant le jeton partagé au chargement.
+        """
+        return Jeton, (self.lettre, self.valeur)
 
     def __str__(self):
         """
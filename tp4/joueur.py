@@ -1,5 +1,7 @@
 from random import shuffle
 
+from tp4.zobrist import CLES_CHEVALET, cle_occurrence
+
 
 class Joueur:
     """
@@ -14,7 +16,11 @@ class Joueur:
                          tout temps de taille Joueur.taille_chevalet. À chaque position du chevalier on peut avoir un
                          jeton ou pas. Une position libre devra contenir None. Autrement elle devrait avoir un objet J
                          eton à cette position.
+        empreinte (int): Empreinte de Zobrist des lettres du chevalet, peu importe leur ordre (voir le module zobrist).
+                         Elle est tenue à jour par ajouter_jeton et retirer_jeton.
     """
+    __slots__ = ('taille_chevalet', 'nom', 'points', 'chevalet', 'empreinte')
+
     def __init__(self, nom):
         """
         Initialise un objet joueur avec le nom passé en argument.
@@ -36,6 +42,7 @@ class Joueur:
         self.nom = nom
         self.points = 0
         self.chevalet = [None] * self.taille_chevalet
+        self.empreinte = 0
 
     def nb_a_tirer(self):
         """
@@ -88,11 +95,11 @@ class Joueur:
             position (int, optionnel): Position où ajouter le jeton.
         """
         if position is None:
-            i = self.chevalet.index(None)
-            self.chevalet[i] = jeton
-        else:
-            if self.position_est_valide(position) and self.position_est_vide(position):
-                self.chevalet[position] = jeton
+            position = self.chevalet.index(None)
+        elif not (self.position_est_valide(position) and self.position_est_vide(position)):
+            return
+        self.chevalet[position] = jeton
+        self.empreinte ^= cle_occurrence(CLES_CHEVALET, jeton.lettre, self._occurrences(jeton.lettre))
 
     def retirer_jeton(self, position):
         """
@@ -106,9 +113,18 @@ class Joueur:
             Jeton: Le jeton retiré.
         """
         jeton = self.chevalet[position]
+        if jeton is not None:
+            self.empreinte ^= cle_occurrence(CLES_CHEVALET, jeton.lettre, self._occurrences(jeton.lettre))
         self.chevalet[position] = None
         return jeton
 
+    def _occurrences(self, lettre):
+        """
+        Returns:
+            int: Le nombre de jetons de cette lettre sur le chevalet.
+        """
+        return sum(1 for jeton in self.chevalet if jeton is not None and jeton.lettre == lettre)
+
     def obtenir_jeton(self, position):
         """
         Cette méthode permet d'obtenir un jeton du chevalet. Autrement dit, le joueur regarde un jeton de son chevalet
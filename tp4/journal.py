@@ -0,0 +1,165 @@
+"""
+Journal des tours d'une partie, en ajout seulement, avec des instantanés périodiques.
+
+Le journal note chaque tour joué (jetons placés, mots, pointage, jetons tirés; voir Partie.jouer_coup) et, tous les
+intervalle tours, un instantané de l'état complet de la partie (voir sauvegarde.etat_partie). Pour retrouver la
+partie après n tours, on part du dernier instantané qui précède et on rejoue au plus intervalle - 1 tours: le coût ne
+dépend donc pas de la longueur de la partie.
+
+Sur disque, un journal est un fichier JSON Lines où chaque ligne est soit {"instantane": état, "intervalle": n}, soit
+{"tour": tour}.
+"""
+import json
+
+from tp4.grille import Grille, NB_CASES
+from tp4.jeton import Jeton
+from tp4.sauvegarde import VIDE, appliquer_tour, etat_partie, restaurer_partie
+
+
+class Journal:
+    """
+    Journal des tours d'une partie.
+    Les tours sont numérotés à partir de la création du journal: la position 0 est l'état de la partie à ce moment.
+
+    Attributes:
+        intervalle (int): Nombre de tours entre deux instantanés.
+        tours (list): Les tours notés, dans l'ordre.
+        instantanes (list): instantanes[i] est l'état de la partie après i * intervalle tours (sans historique).
+        chemin (str): Fichier où ajouter chaque entrée du journal au fur et à mesure (None si aucun).
+    """
+    def __init__(self, partie=None, intervalle=16, chemin=None):
+        """
+        Constructeur.
+
+        Args:
+            partie (Partie, optionnel): La partie à suivre. Son état courant devient la position 0 et chacun de ses
+                                        tours sera noté (voir Partie.journal). Sans partie, le journal est vide;
+                                        c'est ce qu'utilise charger.
+            intervalle (int): Nombre de tours entre deux instantanés.
+            chemin (str, optionnel): Fichier où ajouter chaque entrée du journal au fur et à mesure.
+        """
+        self.intervalle = intervalle
+        self.tours = []
+        self.instantanes = []
+        self.chemin = chemin
+        if partie is not None:
+            self._ajouter_instantane(partie)
+            partie.journal = self
+
+    def __len__(self):
+        """
+        Returns:
+            int: Le nombre de tours notés.
+        """
+        return len(self.tours)
+
+    def _ecrire(self, entree):
+        if self.chemin is not None:
+            with open(self.chemin, 'a', encoding='utf-8') as fichier:
+                fichier.write(json.dumps(entree, separators=(',', ':')) + '\n')
+
+    def _ajouter_instantane(self, partie):
+        etat = etat_partie(partie)
+        etat['historique'] = []
+        self.instantanes.append(etat)
+        self._ecrire({'instantane': etat, 'intervalle': self.intervalle})
+
+    def ajouter(self, tour, partie):
+        """
+        Note un tour, qui vient d'être joué dans la partie. Un instantané est pris tous les intervalle tours.
+
+        Args:
+            tour (dict): Le tour (voir Partie.jouer_coup et Partie.passer_son_tour).
+            partie (Partie): La partie, dans l'état qui suit le tour.
+        """
+        self.tours.append(tour)
+        self._ecrire({'tour': tour})
+        if len(self.tours) % self.intervalle == 0:
+            self._ajouter_instantane(partie)
+
+    def _verifier_position(self, n):
+        if not 0 <= n <= len(self.tours):
+            raise IndexError(f'Position {n} hors du journal (0 à {len(self.tours)}).')
+
+    def position(self, n, partie=None):
+        """
+        Reconstruit la partie telle qu'elle était après n tours.
+
+        Args:
+            n (int): Le nombre de tours (entre 0 et len(self)).
+            partie (Partie, optionnel): La partie à restaurer (voir sauvegarde.restaurer_partie).
+
+        Returns:
+            Partie: La partie reconstruite. Son historique contient les n premiers tours.
+
+        Raises:
+            IndexError: Si n est hors du journal.
+        """
+        self._verifier_position(n)
+        i = min(n // self.intervalle, len(self.instantanes) - 1)
+        partie = restaurer_partie(self.instantanes[i], partie)
+        partie.historique = self.tours[:i * self.intervalle]
+        for tour in self.tours[i * self.intervalle:n]:
+            appliquer_tour(partie, tour)
+        return partie
+
+    def grille(self, n, grille=None):
+        """
+        Reconstruit seulement la grille après n tours, sans charger de dictionnaire.
+
+        Args:
+            n (int): Le nombre de tours (entre 0 et len(self)).
+            grille (Grille, optionnel): La grille à remplir (par exemple un Plateau). Par défaut, une nouvelle grille.
+
+        Returns:
+            Grille: La grille reconstruite.
+
+        Raises:
+            IndexError: Si n est hors du journal.
+        """
+        self._verifier_position(n)
+        i = min(n // self.intervalle, len(self.instantanes) - 1)
+        etat = self.instantanes[i]
+        valeurs = etat['valeurs']
+        if grille is None:
+            grille = Grille()
+        for k in range(NB_CASES):
+            if grille.lettres[k]:
+                grille.retirer_jeton_index(k)
+        for k, lettre in enumerate(etat['grille']):
+            if lettre != VIDE:
+                grille.placer_jeton_index(Jeton(lettre, valeurs[lettre]), k)
+        for tour in self.tours[i * self.intervalle:n]:
+            if not tour.get('passe'):
+                for lettre, position in zip(tour['lettres'], tour['positions']):
+                    grille.placer_jeton_index(Jeton(lettre, valeurs[lettre]), grille.index_position(position))
+        return grille
+
+    @classmethod
+    def charger(cls, chemin):
+        """
+        Lit un journal écrit au fur et à mesure d'une partie (voir l'argument chemin du constructeur).
+
+        Args:
+            chemin (str): Le fichier du journal.
+
+        Returns:
+            Journal: Le journal lu. Il n'est associé à aucun fichier ni aucune partie.
+
+        Raises:
+            ValueError: Si le fichier ne commence pas par un instantané.
+        """
+        journal = cls()
+        with open(chemin, encoding='utf-8') as fichier:
+            for ligne in fichier:
+                if not ligne.strip():
+                    continue
+                entree = json.loads(ligne)
+                if 'instantane' in entree:
+                    journal.instantanes.append(entree['instantane'])
+                    journal.intervalle = entree['intervalle']
+                else:
+                    journal.tours.append(entree['tour'])
+        if not journal.instantanes:
+            raise ValueError('Le journal ne contient aucun instantané.')
+        return journal
@@ -0,0 +1,229 @@
+"""
+Registre des langues de jeu: le dictionnaire et la distribution des jetons de chaque langue.
+
+Le lexique d'une langue n'est chargé qu'au premier besoin, puis partagé par toutes les parties du processus (voir
+RegistreLangues.lexique). Le registre garde les lexiques les plus récemment demandés; un lexique qui en est évincé
+reste partagé tant qu'une partie l'utilise encore, et n'est libéré qu'ensuite. Le registre peut être utilisé depuis
+plusieurs fils d'exécution.
+
+Pour ajouter une langue, il suffit d'enregistrer son dictionnaire (un mot par ligne) et sa distribution de jetons:
+    enregistrer_langue('ES', BASE_DIR / 'dictionnaire_espagnol.txt', [('A', 12, 1), ('E', 12, 1), ...])
+"""
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+from tp4.jeton import Jeton
+from tp4.lexique import LETTRES, charger_lexique
+from tp4.zobrist import MAX_OCCURRENCES
+from tp4.exceptions import MauvaiseLangue
+
+BASE_DIR = Path(__file__).resolve().parent
+# Nombre de lexiques gardés en mémoire par le registre, même si aucune partie ne les utilise.
+CAPACITE = 2
+
+
+class Langue:
+    """
+    Une langue de jeu.
+
+    Attributes:
+        code (str): Le code de la langue, en majuscules (par exemple 'FR').
+        dictionnaire (Path): Chemin du fichier dictionnaire (voir lexique.charger_lexique).
+        distribution (tuple): Pour chaque lettre, un triplet (lettre, nombre de jetons, valeur d'un jeton).
+    """
+    def __init__(self, code, dictionnaire, distribution):
+        """
+        Constructeur.
+
+        Args:
+            code (str): Le code de la langue.
+            dictionnaire (Path): Chemin du fichier dictionnaire.
+            distribution (iterable): Les triplets (lettre, nombre de jetons, valeur d'un jeton).
+
+        Raises:
+            ValueError: Si une lettre n'est pas une majuscule sans accent, apparaît deux fois ou a un nombre de jetons
+                        qui n'est pas entre 1 et MAX_OCCURRENCES.
+        """
+        self.code = code.upper()
+        self.dictionnaire = Path(dictionnaire)
+        self.distribution = tuple((lettre, occurences, valeur) for lettre, occurences, valeur in distribution)
+        lettres = [lettre for lettre, occurences, valeur in self.distribution]
+        if len(set(lettres)) != len(lettres) or any(lettre not in LETTRES or len(lettre) != 1 for lettre in lettres):
+            raise ValueError(f'Distribution invalide pour la langue {self.code}: lettres de A à Z, une fois chacune.')
+        if not all(1 <= occurences <= MAX_OCCURRENCES for lettre, occurences, valeur in self.distribution):
+            raise ValueError(f'Distribution invalide pour la langue {self.code}: '
+                             f'entre 1 et {MAX_OCCURRENCES} jetons par lettre.')
+
+    def valeurs_lettres(self):
+        """
+        Returns:
+            dict: La valeur des jetons de chaque lettre.
+        """
+        return {lettre: valeur for lettre, occurences, valeur in self.distribution}
+
+    def jetons(self):
+        """
+        Returns:
+            list: Les jetons de départ d'une partie (instances de la classe Jeton), dans l'ordre de la distribution.
+        """
+        return [Jeton(lettre, valeur) for lettre, occurences, valeur in self.distribution for i in range(occurences)]
+
+
+class RegistreLangues:
+    """
+    Registre des langues et de leurs lexiques, partagés par toutes les parties du processus.
+
+    Attributes:
+        capacite (int): Nombre de lexiques gardés en mémoire même si aucune partie ne les utilise (les moins récemment
+                        demandés sont évincés en premier).
+        chargements (int): Nombre de lexiques chargés depuis la création du registre.
+    """
+    def __init__(self, capacite=CAPACITE):
+        """
+        Constructeur.
+
+        Args:
+            capacite (int): Nombre de lexiques gardés en mémoire même si aucune partie ne les utilise.
+        """
+        self.capacite = capacite
+        self.chargements = 0
+        self._langues = {}
+        # Les lexiques gardés par le registre, du moins récemment demandé au plus récent.
+        self._recents = OrderedDict()
+        # Tous les lexiques encore en vie, qu'ils soient gardés par le registre ou seulement par des parties.
+        self._vivants = weakref.WeakValueDictionary()
+        self._verrou = threading.Lock()
+
+    def enregistrer(self, code, dictionnaire, distribution):
+        """
+        Ajoute une langue au registre, ou remplace celle qui a le même code (son lexique sera rechargé au prochain
+        besoin; les parties en cours gardent l'ancien).
+
+        Args:
+            code (str): Le code de la langue.
+            dictionnaire (Path): Chemin du fichier dictionnaire.
+            distribution (iterable): Les triplets (lettre, nombre de jetons, valeur d'un jeton).
+
+        Returns:
+            Langue: La langue enregistrée.
+
+        Raises:
+            ValueError: Si la distribution est invalide (voir Langue).
+        """
+        langue = Langue(code, dictionnaire, distribution)
+        with self._verrou:
+            self._langues[langue.code] = langue
+            self._recents.pop(langue.code, None)
+            self._vivants.pop(langue.code, None)
+        return langue
+
+    def __contains__(self, code):
+        return isinstance(code, str) and code.upper() in self._langues
+
+    def codes(self):
+        """
+        Returns:
+            list: Les codes des langues enregistrées, en ordre alphabétique.
+        """
+        return sorted(self._langues)
+
+    def langue(self, code):
+        """
+        Args:
+            code (str): Le code de la langue (majuscules ou minuscules).
+
+        Returns:
+            Langue: La langue.
+
+        Raises:
+            MauvaiseLangue: Si la langue n'est pas enregistrée.
+        """
+        if code not in self:
+            raise MauvaiseLangue
+        return self._langues[code.upper()]
+
+    def lexique(self, code):
+        """
+        Charge le lexique d'une langue au premier besoin. Les appels suivants retournent le même lexique tant qu'il est
+        gardé par le registre ou utilisé par une partie.
+
+        Args:
+            code (str): Le code de la langue (majuscules ou minuscules).
+
+        Returns:
+            Lexique: Le lexique de la langue.
+
+        Raises:
+            MauvaiseLangue: Si la langue n'est pas enregistrée.
+        """
+        langue = self.langue(code)
+        with self._verrou:
+            lexique = self._vivants.get(langue.code)
+            if lexique is None:
+                lexique = charger_lexique(langue.dictionnaire)
+                self._vivants[langue.code] = lexique
+                self.chargements += 1
+            self._recents[langue.code] = lexique
+            self._recents.move_to_end(langue.code)
+            while len(self._recents) > self.capacite:
+                self._recents.popitem(last=False)
+        return lexique
+
+    def oublier(self):
+        """
+        Évince tous les lexiques gardés par le registre. Ceux qu'utilisent encore des parties restent partagés.
+        """
+        with self._verrou:
+            self._recents.clear()
+
+
+REGISTRE = RegistreLangues()
+
+# Infos disponibles sur https://fr.wikipedia.org/wiki/Lettres_du_Scrabble
+REGISTRE.enregistrer('FR', BASE_DIR / 'dictionnaire_francais.txt',
+                     [('E', 15, 1), ('A', 9, 1), ('I', 8, 1), ('N', 6, 1), ('O', 6, 1),
+                      ('R', 6, 1), ('S', 6, 1), ('T', 6, 1), ('U', 6, 1), ('L', 5, 1),
+                      ('D', 3, 2), ('M', 3, 2), ('G', 2, 2), ('B', 2, 3), ('C', 2, 3),
+                      ('P', 2, 3), ('F', 2, 4), ('H', 2, 4), ('V', 2, 4), ('J', 1, 8),
+                      ('Q', 1, 8), ('K', 1, 10), ('W', 1, 10), ('X', 1, 10), ('Y', 1, 10),
+                      ('Z', 1, 10)])
+REGISTRE.enregistrer('EN', BASE_DIR / 'dictionnaire_anglais.txt',
+                     [('E', 12, 1), ('A', 9, 1), ('I', 9, 1), ('N', 6, 1), ('O', 8, 1),
+                      ('R', 6, 1), ('S', 4, 1), ('T', 6, 1), ('U', 4, 1), ('L', 4, 1),
+                      ('D', 4, 2), ('M', 2, 3), ('G', 3, 2), ('B', 2, 3), ('C', 2, 3),
+                      ('P', 2, 3), ('F', 2, 4), ('H', 2, 4), ('V', 2, 4), ('J', 1, 8),
+                      ('Q', 1, 10), ('K', 1, 5), ('W', 2, 4), ('X', 1, 8), ('Y', 2, 4),
+                      ('Z', 1, 10)])
+
+
+def enregistrer_langue(code, dictionnaire, distribution):
+    """
+    Ajoute une langue au registre du processus (voir RegistreLangues.enregistrer).
+    """
+    return REGISTRE.enregistrer(code, dictionnaire, distribution)
+
+
+def codes_langues():
+    """
+    Returns:
+        list: Les codes des langues du registre du processus.
+    """
+    return REGISTRE.codes()
+
+
+def langue(code):
+    """
+    Returns:
+        Langue: Une langue du registre du processus (voir RegistreLangues.langue).
+    """
+    return REGISTRE.langue(code)
+
+
+def lexique(code):
+    """
+    Returns:
+        Lexique: Le lexique partagé d'une langue du registre du processus (voir RegistreLangues.lexique).
+    """
+    return REGISTRE.lexique(code)
@@ -0,0 +1,462 @@
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+
+LETTRES = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Format binaire des lexiques compilés: en-tête (voir FORMAT_ENTETE) suivi d'un tableau d'arêtes de 32 bits.
+# L'en-tête contient la signature, l'empreinte SHA-256 du fichier texte source, un marqueur de boutisme,
+# le nombre de mots et le nombre d'arêtes.
+# Chaque arête contient: bits 0 à 4, l'index de la lettre; bit 5, le mot se termine après cette lettre;
+# bit 6, dernière arête du noeud; bits 7 à 31, l'index de la première arête du noeud enfant (0 si aucun).
+# L'arête 0 est fictive et mène à la racine.
+MAGIE = b'SCRDAWG1'
+MARQUEUR_BOUTISME = 0x01020304
+FORMAT_ENTETE = '=8s32sIII'
+TAILLE_ENTETE = struct.calcsize(FORMAT_ENTETE)
+EXTENSION_COMPILEE = '.dawg'
+# Nombre maximal de réponses mémorisées par LexiqueBinaire.contient (les mêmes mots sont validés très souvent).
+TAILLE_CACHE_MOTS = 1 << 16
+# Nombre maximal de transitions (noeud, lettre) mémorisées par LexiqueBinaire.enfant pour la recherche de coups.
+TAILLE_CACHE_TRANSITIONS = 1 << 18
+BIT_TERMINAL = 1 << 5
+BIT_DERNIERE = 1 << 6
+DECALAGE_ENFANT = 7
+
+
+class Lexique:
+    """
+    Interface commune des lexiques utilisés pour valider les mots et pour chercher des coups.
+
+    Un lexique répond à deux questions: « ce mot est-il permis? » et « ce préfixe peut-il mener à un mot permis? ».
+    Pour la recherche de coups, il permet aussi de parcourir les mots lettre par lettre grâce à des noeuds opaques:
+    on part de racine(), on descend avec enfant(noeud, lettre) et on vérifie avec est_terminal(noeud) si le chemin
+    parcouru forme un mot. Toutes les lettres manipulées sont des majuscules.
+    """
+    def contient(self, mot):
+        """
+        Vérifie si un mot fait partie du lexique.
+
+        Args:
+            mot (str): Le mot à vérifier (en majuscules).
+
+        Returns:
+            bool: True si le mot est permis, False sinon.
+        """
+        raise NotImplementedError
+
+    def est_prefixe(self, prefixe):
+        """
+        Vérifie si au moins un mot du lexique commence par le préfixe donné.
+
+        Args:
+            prefixe (str): Le préfixe à vérifier (en majuscules).
+
+        Returns:
+            bool: True si le préfixe peut être prolongé en un mot permis (ou en est déjà un), False sinon.
+        """
+        raise NotImplementedError
+
+    def racine(self):
+        """
+        Returns:
+            Le noeud correspondant au préfixe vide.
+        """
+        raise NotImplementedError
+
+    def enfant(self, noeud, lettre):
+        """
+        Descend d'une lettre à partir d'un noeud.
+
+        Args:
+            noeud: Un noeud obtenu par racine() ou enfant().
+            lettre (str): La lettre à ajouter au préfixe du noeud.
+
+        Returns:
+            Le noeud du préfixe prolongé, ou None si aucun mot ne commence par ce préfixe.
+        """
+        raise NotImplementedError
+
+    def est_terminal(self, noeud):
+        """
+        Args:
+            noeud: Un noeud obtenu par racine() ou enfant().
+
+        Returns:
+            bool: True si le préfixe du noeud est un mot permis, False sinon.
+        """
+        raise NotImplementedError
+
+    def enfants(self, noeud):
+        """
+        Énumère toutes les façons de prolonger le préfixe d'un noeud d'une lettre.
+
+        Args:
+            noeud: Un noeud obtenu par racine() ou enfant().
+
+        Returns:
+            list: Liste de couples (lettre, noeud enfant).
+        """
+        resultat = []
+        for lettre in LETTRES:
+            suivant = self.enfant(noeud, lettre)
+            if suivant is not None:
+                resultat.append((lettre, suivant))
+        return resultat
+
+    def __contains__(self, mot):
+        return self.contient(mot)
+
+
+class LexiqueMemoire(Lexique):
+    """
+    Lexique conservé en mémoire dans des ensembles (tables de hachage).
+
+    La vérification d'un mot ou d'un préfixe se fait en temps constant, peu importe la taille du dictionnaire.
+    Les noeuds de parcours sont simplement les préfixes eux-mêmes.
+
+    Attributes:
+        mots (frozenset): Les mots permis.
+        prefixes (frozenset): Tous les préfixes des mots permis, incluant les mots eux-mêmes et le préfixe vide.
+    """
+    def __init__(self, mots):
+        """
+        Constructeur.
+
+        Args:
+            mots (iterable): Les mots permis, en majuscules.
+        """
+        self.mots = frozenset(mots)
+        self.prefixes = frozenset(mot[:i] for mot in self.mots for i in range(len(mot) + 1))
+
+    def contient(self, mot):
+        return mot in self.mots
+
+    def est_prefixe(self, prefixe):
+        return prefixe in self.prefixes
+
+    def racine(self):
+        return ''
+
+    def enfant(self, noeud, lettre):
+        noeud += lettre
+        return noeud if noeud in self.prefixes else None
+
+    def est_terminal(self, noeud):
+        return noeud in self.mots
+
+    def __len__(self):
+        return len(self.mots)
+
+    def __iter__(self):
+        return iter(self.mots)
+
+
+class LexiqueBinaire(Lexique):
+    """
+    Lexique compilé sous forme de graphe de mots minimal (DAWG) et projeté en mémoire (mmap).
+
+    Le fichier est ouvert en lecture seule et partagé par le système d'exploitation entre tous les processus qui
+    l'utilisent: le chargement ne lit rien d'autre que l'en-tête. Les noeuds de parcours sont des index d'arêtes.
+
+    Attributes:
+        chemin (Path): Chemin du fichier compilé.
+        empreinte (bytes): Empreinte SHA-256 du fichier texte à partir duquel le lexique a été compilé.
+    """
+    def __init__(self, chemin):
+        """
+        Constructeur.
+
+        Args:
+            chemin (Path): Chemin du fichier compilé.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un lexique compilé valide pour cette machine.
+        """
+        self.chemin = Path(chemin)
+        with open(self.chemin, 'rb') as f:
+            self._projection = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._projection) < TAILLE_ENTETE:
+            raise ValueError('Lexique compilé tronqué.')
+        magie, self.empreinte, marqueur, self._nb_mots, nb_aretes = struct.unpack_from(FORMAT_ENTETE,
+                                                                                       self._projection)
+        if magie != MAGIE or marqueur != MARQUEUR_BOUTISME or \
+                len(self._projection) != TAILLE_ENTETE + 4 * nb_aretes:
+            raise ValueError('Lexique compilé invalide.')
+        self._aretes = memoryview(self._projection)[TAILLE_ENTETE:].cast('I')
+        self._mots_verifies = {}
+        self._transitions = {}
+
+    def racine(self):
+        return 0
+
+    def enfant(self, noeud, lettre):
+        cle = (noeud, lettre)
+        try:
+            return self._transitions[cle]
+        except KeyError:
+            pass
+        aretes = self._aretes
+        resultat = None
+        i = aretes[noeud] >> DECALAGE_ENFANT
+        if i != 0:
+            code = ord(lettre) - 65
+            while True:
+                arete = aretes[i]
+                code_arete = arete & 31
+                if code_arete == code:
+                    resultat = i
+                    break
+                if code_arete > code or arete & BIT_DERNIERE:
+                    break
+                i += 1
+        if len(self._transitions) >= TAILLE_CACHE_TRANSITIONS:
+            self._transitions.clear()
+        self._transitions[cle] = resultat
+        return resultat
+
+    def enfants(self, noeud):
+        aretes = self._aretes
+        i = aretes[noeud] >> DECALAGE_ENFANT
+        resultat = []
+        if i == 0:
+            return resultat
+        while True:
+            arete = aretes[i]
+            resultat.append((LETTRES[arete & 31], i))
+            if arete & BIT_DERNIERE:
+                return resultat
+            i += 1
+
+    def est_terminal(self, noeud):
+        return bool(self._aretes[noeud] & BIT_TERMINAL)
+
+    def _trouver(self, chaine):
+        aretes = self._aretes
+        noeud = 0
+        for lettre in chaine:
+            i = aretes[noeud] >> DECALAGE_ENFANT
+            if i == 0:
+                return None
+            code = ord(lettre) - 65
+            arete = aretes[i]
+            while arete & 31 != code:
+                if arete & 31 > code or arete & BIT_DERNIERE:
+                    return None
+                i += 1
+                arete = aretes[i]
+            noeud = i
+        return noeud
+
+    def contient(self, mot):
+        resultat = self._mots_verifies.get(mot)
+        if resultat is None:
+            noeud = self._trouver(mot)
+            resultat = noeud is not None and noeud != 0 and self.est_terminal(noeud)
+            if len(self._mots_verifies) >= TAILLE_CACHE_MOTS:
+                self._mots_verifies.clear()
+            self._mots_verifies[mot] = resultat
+        return resultat
+
+    def est_prefixe(self, prefixe):
+        return self._trouver(prefixe) is not None
+
+    def __len__(self):
+        return self._nb_mots
+
+    def __iter__(self):
+        pile = [(0, '')]
+        while pile:
+            noeud, prefixe = pile.pop()
+            for lettre, suivant in reversed(self.enfants(noeud)):
+                if self.est_terminal(suivant):
+                    yield prefixe + lettre
+                pile.append((suivant, prefixe + lettre))
+
+
+class _NoeudConstruction:
+    """
+    Noeud temporaire utilisé pendant la compilation d'un DAWG.
+    """
+    def __init__(self):
+        self.terminal = False
+        self.aretes = {}
+
+    def cle(self):
+        return self.terminal, tuple((lettre, id(enfant)) for lettre, enfant in self.aretes.items())
+
+
+def construire_dawg(mots):
+    """
+    Construit le graphe de mots minimal d'une liste de mots par l'algorithme incrémental de Daciuk et al.
+
+    Args:
+        mots (iterable): Les mots (str) en majuscules, composés des lettres A à Z.
+
+    Returns:
+        array: Le tableau d'arêtes encodées, au format décrit en tête de module.
+    """
+    racine = _NoeudConstruction()
+    registre = {}
+    non_verifies = []
+
+    def minimiser(jusqu_a):
+        while len(non_verifies) > jusqu_a:
+            parent, lettre, enfant = non_verifies.pop()
+            cle = enfant.cle()
+            if cle in registre:
+                parent.aretes[lettre] = registre[cle]
+            else:
+                registre[cle] = enfant
+
+    precedent = ''
+    for mot in sorted(set(mots)):
+        commun = 0
+        while commun < min(len(mot), len(precedent)) and mot[commun] == precedent[commun]:
+            commun += 1
+        minimiser(commun)
+        noeud = non_verifies[-1][2] if non_verifies else racine
+        for lettre in mot[commun:]:
+            suivant = _NoeudConstruction()
+            noeud.aretes[lettre] = suivant
+            non_verifies.append((noeud, lettre, suivant))
+            noeud = suivant
+        noeud.terminal = True
+        precedent = mot
+    minimiser(0)
+
+    # On attribue à chaque noeud ayant des enfants la position de sa première arête, puis on encode les arêtes.
+    positions = {}
+    ordre = []
+    a_visiter = [racine]
+    prochaine_position = 1
+    while a_visiter:
+        noeud = a_visiter.pop()
+        if id(noeud) in positions or not noeud.aretes:
+            continue
+        positions[id(noeud)] = prochaine_position
+        prochaine_position += len(noeud.aretes)
+        ordre.append(noeud)
+        a_visiter.extend(noeud.aretes.values())
+
+    aretes = array('I', [positions[id(racine)] << DECALAGE_ENFANT])
+    for noeud in ordre:
+        lettres = sorted(noeud.aretes)
+        for k, lettre in enumerate(lettres):
+            enfant = noeud.aretes[lettre]
+            arete = (ord(lettre) - 65) | (positions.get(id(enfant), 0) << DECALAGE_ENFANT)
+            if enfant.terminal:
+                arete |= BIT_TERMINAL
+            if k == len(lettres) - 1:
+                arete |= BIT_DERNIERE
+            aretes.append(arete)
+    return aretes
+
+
+def empreinte_fichier(chemin_fichier):
+    """
+    Args:
+        chemin_fichier (Path): Chemin d'un fichier.
+
+    Returns:
+        bytes: L'empreinte SHA-256 du contenu du fichier.
+    """
+    with open(chemin_fichier, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def chemin_compile(chemin_fichier):
+    """
+    Args:
+        chemin_fichier (Path): Chemin d'un fichier dictionnaire texte.
+
+    Returns:
+        Path: Chemin du lexique compilé correspondant (à côté du fichier texte).
+    """
+    return Path(chemin_fichier).with_suffix(EXTENSION_COMPILEE)
+
+
+def compiler_dictionnaire(chemin_fichier, chemin_destination=None):
+    """
+    Compile un fichier dictionnaire texte en lexique binaire.
+    Le fichier est d'abord écrit sous un nom temporaire puis renommé, afin qu'un autre processus ne puisse jamais
+    projeter un fichier à moitié écrit.
+
+    Args:
+        chemin_fichier (Path): Chemin du fichier dictionnaire texte.
+        chemin_destination (Path, optionnel): Chemin du fichier compilé (à côté du fichier texte par défaut).
+
+    Returns:
+        Path: Chemin du fichier compilé.
+    """
+    if chemin_destination is None:
+        chemin_destination = chemin_compile(chemin_fichier)
+    chemin_destination = Path(chemin_destination)
+
+    mots = lire_mots(chemin_fichier)
+    aretes = construire_dawg(mots)
+    entete = struct.pack(FORMAT_ENTETE, MAGIE, empreinte_fichier(chemin_fichier), MARQUEUR_BOUTISME,
+                         len(set(mots)), len(aretes))
+
+    chemin_temporaire = chemin_destination.with_name(f'{chemin_destination.name}.{os.getpid()}.tmp')
+    with open(chemin_temporaire, 'wb') as f:
+        f.write(entete)
+        aretes.tofile(f)
+    os.replace(chemin_temporaire, chemin_destination)
+    return chemin_destination
+
+
+def lire_mots(chemin_fichier):
+    """
+    Lit un fichier dictionnaire texte (un mot par ligne) et retourne les mots permis.
+    Comme dans le jeu original, les mots d'une seule lettre sont ignorés.
+
+    Args:
+        chemin_fichier (Path): Chemin du fichier dictionnaire.
+
+    Returns:
+        list: Les mots (str) en majuscules.
+    """
+    with open(chemin_fichier, 'r') as f:
+        return [x.strip().upper() for x in f if len(x.strip()) > 1]
+
+
+def charger_lexique(chemin_fichier):
+    """
+    Charge un lexique à partir d'un fichier dictionnaire texte.
+
+    On utilise la version compilée du dictionnaire, projetée en mémoire. Elle est (re)compilée si elle n'existe pas
+    encore ou si l'empreinte du fichier texte a changé. Si le fichier compilé ne peut pas être écrit (dossier en lecture
+    seule, par exemple), on se rabat sur un lexique en mémoire.
+
+    Args:
+        chemin_fichier (Path): Chemin du fichier dictionnaire.
+
+    Returns:
+        Lexique: Le lexique chargé.
+    """
+    chemin = chemin_compile(chemin_fichier)
+    try:
+        lexique = LexiqueBinaire(chemin)
+        if lexique.empreinte == empreinte_fichier(chemin_fichier):
+            return lexique
+    except (OSError, ValueError):
+        pass
+
+    try:
+        return LexiqueBinaire(compiler_dictionnaire(chemin_fichier, chemin))
+    except OSError:
+        return LexiqueMemoire(lire_mots(chemin_fichier))
+
+
+if __name__ == '__main__':
+    parseur = argparse.ArgumentParser(description='Compile les dictionnaires texte en lexiques binaires.')
+    parseur.add_argument('fichiers', nargs='*', type=Path,
+                         help='Fichiers dictionnaire à compiler (tous les dictionnaire_*.txt du jeu par défaut).')
+    arguments = parseur.parse_args()
+    for fichier in arguments.fichiers or sorted(Path(__file__).resolve().parent.glob('dictionnaire_*.txt')):
+        print(f'{fichier} -> {compiler_dictionnaire(fichier)}')
@@ -0,0 +1,309 @@
+from random import Random
+
+from tp4 import langues
+from tp4.grille import Grille
+from tp4.joueur import Joueur
+from tp4.sac import Sac
+from tp4.zobrist import CLES_JOUEUR_ACTIF, rotation
+from tp4.exceptions import *
+
+
+class Partie:
+    """
+    Logique d'une partie de scrabble, sans interface graphique.
+    Une partie peut être jouée telle quelle (simulations, serveurs, robots) ou être enveloppée par une interface
+    graphique (voir la classe Scrabble).
+
+    Attributes:
+        dictionnaire (Lexique): Contient tous les mots qui peuvent être joués sur dans cette partie.
+                                (afin de savoir si un mot est permis, on va vérifier s'il est dans dictionnaire)
+        plateau (Grille): La grille de jeu. On y place des jetons et elle nous dit le nombre de points gagnés.
+        jetons_libres (Sac): Le sac qui contient tous les jetons libres (instances de la classe Jeton), c'est là que
+                             chaque joueur pige des jetons quand il en a besoin.
+        joueurs: (list): L'ensemble des joueurs de la partie (instances de la classe Joueur)
+        joueur_actif (Joueur): Le joueur qui est en train de jouer le tour en cours. Si aucun joueur alors None.
+        langue (str): Le code de la langue, par exemple 'FR' ou 'EN' (voir le module langues).
+        valeurs_lettres (dict): La valeur des jetons de chaque lettre.
+        historique (list): Les tours joués, dans l'ordre (voir jouer_coup et passer_son_tour).
+        dernier_tirage (list): Les jetons tirés du sac par le joueur actif au début de son tour.
+        journal (Journal): Journal où noter chaque tour joué (None si aucun, voir la classe Journal).
+        hasard (random.Random): Le générateur de nombres aléatoires de la partie (choix du premier joueur et tirages).
+        fin_standard (bool): True pour la fin de partie des règles officielles (voir partie_terminee), False (par
+                             défaut) pour terminer la partie dès que le sac ne permet plus de compléter un chevalet.
+    """
+    journal = None
+    fin_standard = False
+
+    def __init__(self, nb_joueurs=2, langue='fr', plateau=None, graine=None, fin_standard=False):
+        """
+        Constructeur.
+
+        Args:
+            nb_joueurs (int): Nombre de joueurs de la partie (au minimun 2 au maximum 4).
+            langue (str): 'FR' pour la langue française et 'EN' pour la langue anglaise.
+            plateau (Grille, optionnel): La grille sur laquelle jouer (une nouvelle grille vide par défaut).
+            graine (int, optionnel): Graine du générateur de nombres aléatoires de la partie. Deux parties créées avec
+                                     la même graine et jouées de la même façon tirent les mêmes jetons.
+            fin_standard (bool): True pour la fin de partie des règles officielles (voir partie_terminee).
+        """
+        self.fin_standard = fin_standard
+        self.plateau = Grille() if plateau is None else plateau
+        self.initialiser_jeu(nb_joueurs, langue, graine)
+
+    def initialiser_jeu(self, nb_joueurs=2, langue='fr', graine=None):
+        """
+        Étant donné un nombre de joueurs et une langue, cette méthode crée une partie de scrabble.
+
+        Pour une nouvelle partie de scrabble:
+        - La liste des joueurs est créée et chaque joueur porte automatiquement le nom Joueur 1, Joueur 2, ... Joueur n,
+          où n est le nombre de joueurs;
+        - Le joueur_actif est None.
+
+        Args:
+            nb_joueurs (int): nombre de joueurs de la partie (au minimun 2 au maximum 4).
+            langue (str): 'FR' pour la langue française et 'EN' pour la langue anglaise, ou toute autre langue
+                          enregistrée (voir le module langues). Le dictionnaire de la langue est chargé au premier besoin
+                          et partagé par toutes les parties du processus.
+            La langue détermine aussi les jetons de départ.
+            Note: Dans notre scrabble, nous n'utiliserons pas les jetons blancs (jokers) qui ne contiennent aucune lettre.
+            graine (int, optionnel): Graine du générateur de nombres aléatoires de la partie (au hasard par défaut).
+
+        Raises:
+            AssertionError:
+                - Si la langue n'est pas enregistrée (par exemple ni 'fr', 'FR', 'en', ou 'EN').
+                - Si le nombre de joueurs n'est pas compris entre 2 et 4 (2 et 4 étant inclus).
+        """
+        if langue not in langues.REGISTRE:
+            raise MauvaiseLangue
+        if not 2 <= nb_joueurs <= 4:
+            raise MauvaisNbrJoueurs
+
+        self.hasard = Random(graine)
+        self.joueur_actif = None
+        self.joueurs = [Joueur(f'Joueur {i + 1}') for i in range(nb_joueurs)]
+        self.langue = langue.upper()
+        self.historique = []
+        self.dernier_tirage = []
+
+        definition = langues.langue(self.langue)
+        self.valeurs_lettres = definition.valeurs_lettres()
+        self.jetons_libres = Sac(definition.jetons(), self.hasard)
+        self.charger_dictionnaire()
+
+        self.joueur_suivant()
+
+    def charger_dictionnaire(self):
+        """
+        Assigne le dictionnaire de la langue de la partie à sa grille. Il est chargé une seule fois par processus et
+        partagé par toutes les parties de la même langue (voir le module langues).
+        """
+        self.dictionnaire = langues.lexique(self.langue)
+        self.plateau.definir_lexique(self.dictionnaire)
+
+    def empreinte(self):
+        """
+        Calcule l'empreinte de Zobrist de la position: la grille, le sac, le chevalet de chaque joueur et le joueur
+        actif (voir le module zobrist). Les pointages n'en font pas partie.
+
+        Returns:
+            int: L'empreinte.
+        """
+        empreinte = self.plateau.empreinte ^ self.jetons_libres.empreinte
+        for i, joueur in enumerate(self.joueurs):
+            empreinte ^= rotation(joueur.empreinte, 16 * i)
+        if self.joueur_actif is not None:
+            empreinte ^= CLES_JOUEUR_ACTIF[self.joueurs.index(self.joueur_actif)]
+        return empreinte
+
+    def mot_permis(self, mot):
+        """
+        Permet de savoir si un mot est permis dans la partie ou pas
+        en vérifiant dans le dictionnaire.
+
+        Args:
+            mot (str): Mot à vérifier.
+
+        Returns:
+            bool: True si le mot est dans le dictionnaire, False sinon.
+        """
+        return mot.upper() in self.dictionnaire
+
+    def determiner_gagnant(self):
+        """
+        Détermine le joueur gagnant.
+        Le joueur gagnant doit avoir un pointage supérieur ou égal à celui des autres.
+
+        Returns:
+            Joueur: Le joueur gagnant. Si plusieurs sont à égalité, on en retourne un seul parmi ceux-ci.
+        """
+        return max(self.joueurs, key=lambda j: j.points)
+
+    def partie_terminee(self):
+        """
+        Vérifie si la partie est terminée. Une partie est terminée si il n'existe plus de jetons libres ou il reste
+        moins de deux (2) joueurs. C'est la règle que nous avons choisi d'utiliser pour ce travail, donc essayez de
+        négliger les autres que vous connaissez ou avez lu sur Internet.
+
+        Avec la fin standard (voir fin_standard), on continue de jouer une fois le sac vide: la partie se termine
+        lorsqu'un joueur a vidé son chevalet ou que chaque joueur a passé son tour deux fois de suite (voir aussi
+        decompter_reliquats).
+
+        Returns:
+            bool: True si la partie est terminée, et False autrement.
+        """
+        if len(self.joueurs) < 2:
+            return True
+        if not self.fin_standard:
+            return len(self.jetons_libres) == 0
+        if len(self.jetons_libres) == 0 and any(joueur.nb_a_tirer() == joueur.taille_chevalet
+                                                 for joueur in self.joueurs):
+            return True
+        derniers = self.historique[-2 * len(self.joueurs):]
+        return len(derniers) == 2 * len(self.joueurs) and all(tour.get('passe') for tour in derniers)
+
+    def decompter_reliquats(self):
+        """
+        Fin standard: chaque joueur perd la valeur des jetons qui restent sur son chevalet et, si un joueur a vidé le
+        sien, il gagne la valeur des jetons restés sur les chevalets des autres.
+
+        Returns:
+            list: Les points ajoutés (ou retirés) à chaque joueur.
+        """
+        restes = [sum(jeton.valeur for jeton in joueur.chevalet if jeton is not None) for joueur in self.joueurs]
+        ajustements = [-reste for reste in restes]
+        for i, reste in enumerate(restes):
+            if reste == 0 and len(self.jetons_libres) == 0:
+                ajustements[i] = sum(restes)
+        for joueur, ajustement in zip(self.joueurs, ajustements):
+            joueur.ajouter_points(ajustement)
+        return ajustements
+
+    def joueur_suivant(self):
+        """
+        Change le joueur actif.
+        Le nouveau joueur actif est celui à l'index du (joueur courant + 1) % nb_joueurs.
+        Si on n'a aucun joueur actif, on détermine au hasard le suivant.
+        Le chevalet du nouveau joueur actif est ensuite complété avec des jetons tirés du sac.
+
+        Raises:
+            FinPartie: S'il n'y a plus assez de jetons dans le sac pour compléter le chevalet (sans la fin standard;
+                       avec elle, le joueur tire simplement les jetons qui restent).
+        """
+        if self.joueur_actif is None:
+            self.joueur_actif = self.hasard.choice(self.joueurs)
+        else:
+            self.joueur_actif = self.joueurs[(self.joueurs.index(self.joueur_actif) + 1) % len(self.joueurs)]
+
+        self.dernier_tirage = []
+        nb_a_tirer = self.joueur_actif.nb_a_tirer()
+        if self.fin_standard:
+            nb_a_tirer = min(nb_a_tirer, len(self.jetons_libres))
+        if nb_a_tirer > 0:
+            self.dernier_tirage = self.tirer_jetons(nb_a_tirer)
+            for jeton in self.dernier_tirage:
+                self.joueur_actif.ajouter_jeton(jeton)
+
+    def tirer_jetons(self, n):
+        """
+        Simule le tirage de n jetons du sac à jetons et renvoie ceux-ci. Il s'agit de prendre au hasard des jetons dans
+        self.jetons_libres et de les retourner (voir Sac.tirer).
+
+        Args:
+            n (int): Le nombre de jetons à tirer.
+
+        Returns:
+            list: La liste des jetons tirés (instances de la classe Jeton).
+
+        Raises:
+            AssertionError: Si n n'est pas compris dans l'intervalle [0, nombre total de jetons libres].
+        """
+        if not 0 <= n <= len(self.jetons_libres):
+            raise FinPartie
+        return self.jetons_libres.tirer(n)
+
+    def jouer_coup(self, jetons, positions):
+        """
+        Joue un coup pour le joueur actif: les jetons de son chevalet sont placés aux positions données, les mots
+        formés sont validés dans le dictionnaire, les points sont ajoutés et on passe au joueur suivant.
+        Le coup est vérifié avant de toucher au plateau (voir Grille.verifier_coup): s'il est refusé, le plateau et le
+        chevalet sont laissés tels qu'ils étaient. Une fois le coup joué, la méthode tour_joue est appelée avant de
+        passer au joueur suivant.
+
+        Le coup est ajouté à l'historique sous la forme d'un dictionnaire {'joueur', 'positions', 'lettres', 'mots',
+        'score', 'tirage'}, où joueur est l'index du joueur, lettres et tirage sont des chaînes de caractères (une
+        lettre par jeton) et tirage contient les jetons tirés par le joueur suivant au début de son tour.
+
+        Args:
+            jetons (list): Jetons (instances de la classe Jeton) du chevalet du joueur actif à placer.
+            positions (list): Liste de chaînes de caractères (str) représentant les positions où placer les jetons.
+
+        Returns:
+            list: Liste des mots (str) formés.
+            int: Points obtenus.
+
+        Raises:
+            AucunJeton: Si aucun jeton n'est placé, ou si les jetons ne sont pas tous sur le chevalet du joueur actif
+                        (en tenant compte des jetons en double).
+            PositionInvalideException: Si les positions ne respectent pas les règles de placement ou ne forment aucun mot.
+            MotNonPermisException: Si au moins l'un des mots formés est absent du dictionnaire.
+        """
+        restants = list(self.joueur_actif.chevalet)
+        index = []
+        for jeton in jetons:
+            if jeton is None or jeton not in restants:
+                raise AucunJeton
+            index.append(restants.index(jeton))
+            restants[index[-1]] = None
+
+        verification = self.plateau.verifier_coup(jetons, positions)
+        if not verification.valide:
+            raise verification.erreur
+        mots, score = verification.mots, verification.score
+
+        for jeton, position in zip(jetons, positions):
+            self.plateau.ajouter_jeton(jeton, position)
+        for i in index:
+            self.joueur_actif.retirer_jeton(i)
+        self.joueur_actif.ajouter_points(score)
+        self._terminer_tour({'joueur': self.joueurs.index(self.joueur_actif), 'positions': list(positions),
+                             'lettres': ''.join(jeton.lettre for jeton in jetons), 'mots': mots, 'score': score})
+        return mots, score
+
+    def passer_son_tour(self):
+        """
+        Passe le tour du joueur actif.
+        Le tour est ajouté à l'historique sous la forme d'un dictionnaire {'joueur', 'passe', 'tirage'}.
+        """
+        self._terminer_tour({'joueur': self.joueurs.index(self.joueur_actif), 'passe': True})
+
+    def tour_joue(self, tour):
+        """
+        Appelée à la fin de chaque tour, une fois le coup joué (ou le tour passé) et noté dans l'historique, mais avant
+        de passer au joueur suivant. Ne fait rien par défaut: une interface peut s'en servir pour annoncer le résultat
+        du tour (voir Scrabble.tour_joue).
+
+        Args:
+            tour (dict): Le tour joué (voir jouer_coup et passer_son_tour).
+        """
+        pass
+
+    def _terminer_tour(self, tour):
+        """
+        Ajoute un tour à l'historique, appelle tour_joue puis passe au joueur suivant, en notant les jetons qu'il a
+        tirés.
+        Le tour est aussi noté dans le journal de la partie, même si la partie se termine.
+        Avec la fin standard, si la partie est terminée, les reliquats sont décomptés (et notés dans le tour) puis
+        FinPartie est levée.
+        """
+        tour['tirage'] = ''
+        self.historique.append(tour)
+        try:
+            self.tour_joue(tour)
+            if self.fin_standard and self.partie_terminee():
+                tour['reliquats'] = self.decompter_reliquats()
+                raise FinPartie
+            self.joueur_suivant()
+            tour['tirage'] = ''.join(jeton.lettre for jeton in self.dernier_tirage)
+        finally:
+            if self.journal is not None:
+                self.journal.ajouter(tour, self)
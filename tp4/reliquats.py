@@ -0,0 +1,296 @@
+"""
+Valeur des reliquats: les jetons qui restent sur le chevalet après un coup.
+
+Une table de reliquats donne, pour chaque multiensemble d'au plus 6 lettres, le nombre de points que ce reliquat
+rapporte (ou coûte) en moyenne au tour suivant, par rapport à un reliquat quelconque. Elle est calculée hors ligne à
+partir de parties entre robots (voir construire_table) puis écrite dans un fichier binaire compact: un en-tête (voir
+FORMAT_ENTETE) suivi d'un tableau d'entiers de 16 bits, en centièmes de point, indexé par le rang du reliquat (voir
+rang_reliquat). Au chargement, le fichier est projeté en mémoire et une valeur se lit en temps constant.
+
+Construction:
+    python -m tp4.reliquats --langue fr --parties 2000
+"""
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from itertools import combinations_with_replacement
+from multiprocessing import Pool
+from pathlib import Path
+
+from tp4.generateur import GenerateurCoups
+from tp4.langues import BASE_DIR, codes_langues
+from tp4.partie import Partie
+from tp4.exceptions import FinPartie
+
+TAILLE_MAX = 6
+NB_LETTRES = 26
+MAGIE = b'SCRRELQ2'
+MARQUEUR_BOUTISME = 0x01020304
+# En-tête: signature, code de la langue (complété par des octets nuls), marqueur de boutisme, nombre de reliquats et
+# nombre de parties.
+TAILLE_CODE_LANGUE = 16
+FORMAT_ENTETE = f'=8s{TAILLE_CODE_LANGUE}sIII'
+TAILLE_ENTETE = struct.calcsize(FORMAT_ENTETE)
+EXTENSION = '.reliquats'
+
+# Lissage: nombre d'observations fictives qui tirent la valeur d'un reliquat (ou d'une lettre) vers son estimation a
+# priori. Un reliquat observé LISSAGE fois compte pour moitié.
+LISSAGE = 20
+
+
+def _binomiaux():
+    table = [[0] * (NB_LETTRES + TAILLE_MAX) for _ in range(TAILLE_MAX + 1)]
+    for n in range(NB_LETTRES + TAILLE_MAX):
+        table[0][n] = 1
+        for k in range(1, TAILLE_MAX + 1):
+            table[k][n] = table[k][n - 1] + table[k - 1][n - 1] if n > 0 else 0
+    return table
+
+
+BINOMIAUX = _binomiaux()
+# DEBUTS[k] est le rang du premier reliquat de k lettres; DEBUTS[TAILLE_MAX + 1] est le nombre total de reliquats.
+DEBUTS = [0]
+for _k in range(TAILLE_MAX + 1):
+    DEBUTS.append(DEBUTS[-1] + BINOMIAUX[_k][NB_LETTRES + _k - 1])
+NB_RELIQUATS = DEBUTS[-1]
+
+
+def rang_reliquat(lettres):
+    """
+    Calcule le rang d'un reliquat parmi tous les multiensembles d'au plus TAILLE_MAX lettres.
+    Les reliquats sont classés par taille, puis, à taille égale, selon l'ordre colexicographique des combinaisons
+    obtenues en ajoutant i à la i-ème plus petite lettre (ce qui rend les lettres toutes différentes).
+
+    Args:
+        lettres (iterable): Les lettres du reliquat (au plus TAILLE_MAX majuscules, dans n'importe quel ordre).
+
+    Returns:
+        int: Le rang, compris entre 0 et NB_RELIQUATS - 1.
+    """
+    codes = sorted(ord(lettre) - 65 for lettre in lettres)
+    rang = DEBUTS[len(codes)]
+    for i, code in enumerate(codes):
+        rang += BINOMIAUX[i + 1][code + i]
+    return rang
+
+
+def chemin_table(langue):
+    """
+    Returns:
+        Path: Le chemin du fichier de la table de reliquats d'une langue.
+    """
+    return BASE_DIR / f'reliquats_{langue.lower()}{EXTENSION}'
+
+
+class TableReliquats:
+    """
+    Table de reliquats projetée en mémoire (mmap).
+
+    Attributes:
+        chemin (Path): Chemin du fichier.
+        langue (str): Le code de la langue de la table (par exemple 'FR' ou 'EN').
+        nb_parties (int): Nombre de parties jouées pour construire la table.
+    """
+    def __init__(self, chemin):
+        """
+        Constructeur.
+
+        Args:
+            chemin (Path): Chemin du fichier.
+
+        Raises:
+            ValueError: Si le fichier n'est pas une table de reliquats valide pour cette machine.
+        """
+        self.chemin = Path(chemin)
+        with open(self.chemin, 'rb') as f:
+            self._projection = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._projection) < TAILLE_ENTETE:
+            raise ValueError('Table de reliquats tronquée.')
+        magie, langue, marqueur, nb_entrees, self.nb_parties = struct.unpack_from(FORMAT_ENTETE, self._projection)
+        if magie != MAGIE or marqueur != MARQUEUR_BOUTISME or nb_entrees != NB_RELIQUATS or \
+                len(self._projection) != TAILLE_ENTETE + 2 * nb_entrees:
+            raise ValueError('Table de reliquats invalide.')
+        self.langue = langue.rstrip(b'\0').decode()
+        self._valeurs = memoryview(self._projection)[TAILLE_ENTETE:].cast('h')
+
+    def valeur(self, lettres):
+        """
+        Args:
+            lettres (iterable): Les lettres du reliquat (au plus TAILLE_MAX).
+
+        Returns:
+            float: La valeur du reliquat, en points.
+        """
+        return self._valeurs[rang_reliquat(lettres)] / 100
+
+
+def charger_table(langue):
+    """
+    Charge la table de reliquats d'une langue, si elle a été construite.
+
+    Args:
+        langue (str): 'FR' ou 'EN'.
+
+    Returns:
+        TableReliquats: La table, ou None si elle n'existe pas ou est invalide.
+    """
+    try:
+        return TableReliquats(chemin_table(langue))
+    except (OSError, ValueError):
+        return None
+
+
+def _observer_partie(langue, graine):
+    """
+    Joue une partie entre deux robots qui choisissent le meilleur coup et note, pour chaque coup suivi d'un autre
+    tour du même joueur, le reliquat laissé et le pointage obtenu à ce tour suivant.
+
+    Returns:
+        list: Les observations (reliquat, points au tour suivant).
+    """
+    partie = Partie(2, langue, graine=graine)
+    generateur = GenerateurCoups(partie.dictionnaire)
+    observations = []
+    en_attente = {}
+    try:
+        while not partie.partie_terminee():
+            joueur = partie.joueur_actif
+            coup = max(generateur.iterer(partie.plateau, joueur.chevalet), key=lambda c: c.score, default=None)
+            points = 0 if coup is None else coup.score
+            if joueur.nom in en_attente:
+                observations.append((en_attente.pop(joueur.nom), points))
+            if coup is None:
+                partie.passer_son_tour()
+                continue
+            reliquat = [jeton.lettre for jeton in joueur.chevalet if jeton is not None]
+            for jeton in coup.jetons:
+                reliquat.remove(jeton.lettre)
+            en_attente[joueur.nom] = ''.join(sorted(reliquat))
+            partie.jouer_coup(coup.jetons, coup.positions)
+    except FinPartie:
+        pass
+    return observations
+
+
+def _observer(arguments):
+    return _observer_partie(*arguments)
+
+
+def _caracteristiques(reliquat):
+    """
+    Returns:
+        list: Les caractéristiques additives d'un reliquat: (lettre, m) pour la m-ième occurrence de chaque lettre.
+    """
+    caracteristiques, vues = [], {}
+    for lettre in reliquat:
+        vues[lettre] = vues.get(lettre, 0) + 1
+        caracteristiques.append((lettre, vues[lettre]))
+    return caracteristiques
+
+
+def construire_table(langue, nb_parties=1000, graine=0, processus=None, iterations=10):
+    """
+    Calcule la valeur de chaque reliquat à partir de parties entre robots.
+
+    La valeur d'un reliquat est l'écart entre le pointage moyen du tour suivant lorsqu'on garde ce reliquat et le
+    pointage moyen de tous les tours suivants. Comme la plupart des reliquats ne sont jamais (ou rarement) observés, on
+    ajuste d'abord un modèle additif sur la m-ième occurrence de chaque lettre, puis on corrige ce modèle pour chaque
+    reliquat selon ses propres observations, avec un lissage (voir LISSAGE).
+
+    Args:
+        langue (str): 'FR' ou 'EN'.
+        nb_parties (int): Nombre de parties à jouer.
+        graine (int): Graine de la première partie (la partie i utilise graine + i).
+        processus (int, optionnel): Nombre de processus (par défaut, le nombre de processeurs).
+        iterations (int): Nombre de passes d'ajustement du modèle additif.
+
+    Returns:
+        array: Les valeurs, en centièmes de point, indexées par rang de reliquat.
+    """
+    with Pool(processus) as pool:
+        observations = [o for partie in pool.imap_unordered(_observer, [(langue, graine + i)
+                                                                          for i in range(nb_parties)])
+                        for o in partie]
+    if not observations:
+        return array('h', bytes(2 * NB_RELIQUATS))
+    moyenne = sum(points for _, points in observations) / len(observations)
+
+    # Modèle additif, ajusté par passes successives sur les résidus.
+    exemples = [(_caracteristiques(reliquat), points - moyenne) for reliquat, points in observations]
+    poids, par_caracteristique = {}, {}
+    for caracteristiques, _ in exemples:
+        for caracteristique in caracteristiques:
+            poids[caracteristique] = 0.0
+            par_caracteristique.setdefault(caracteristique, []).append(caracteristiques)
+    residus = {id(caracteristiques): ecart for caracteristiques, ecart in exemples}
+    for _ in range(iterations):
+        for caracteristique, liste in par_caracteristique.items():
+            ancien = poids[caracteristique]
+            total = sum(residus[id(c)] + ancien for c in liste)
+            nouveau = total / (len(liste) + LISSAGE)
+            for c in liste:
+                residus[id(c)] += ancien - nouveau
+            poids[caracteristique] = nouveau
+
+    # Corrections propres aux reliquats observés.
+    sommes = {}
+    for reliquat, points in observations:
+        total, nombre = sommes.get(reliquat, (0.0, 0))
+        sommes[reliquat] = (total + points - moyenne, nombre + 1)
+
+    valeurs = array('h', bytes(2 * NB_RELIQUATS))
+    lettres = [chr(65 + i) for i in range(NB_LETTRES)]
+    for taille in range(TAILLE_MAX + 1):
+        for combinaison in combinations_with_replacement(lettres, taille):
+            reliquat = ''.join(combinaison)
+            valeur = sum(poids.get(c, 0.0) for c in _caracteristiques(reliquat))
+            if reliquat in sommes:
+                total, nombre = sommes[reliquat]
+                valeur += (total - nombre * valeur) / (nombre + LISSAGE)
+            valeurs[rang_reliquat(reliquat)] = max(-32768, min(32767, round(valeur * 100)))
+    return valeurs
+
+
+def ecrire_table(valeurs, langue, nb_parties, chemin=None):
+    """
+    Écrit une table de reliquats. Le fichier est d'abord écrit sous un nom temporaire puis renommé.
+
+    Args:
+        valeurs (array): Les valeurs, en centièmes de point (voir construire_table).
+        langue (str): Le code de la langue, par exemple 'FR' ou 'EN' (au plus TAILLE_CODE_LANGUE octets en UTF-8).
+        nb_parties (int): Nombre de parties jouées pour construire la table.
+        chemin (Path, optionnel): Chemin du fichier (voir chemin_table par défaut).
+
+    Returns:
+        Path: Chemin du fichier écrit.
+
+    Raises:
+        ValueError: Si le code de la langue ne tient pas dans l'en-tête.
+    """
+    code = langue.upper().encode()
+    if len(code) > TAILLE_CODE_LANGUE or b'\0' in code:
+        raise ValueError(f'Code de langue trop long pour une table de reliquats: {langue}.')
+    chemin = Path(chemin_table(langue) if chemin is None else chemin)
+    entete = struct.pack(FORMAT_ENTETE, MAGIE, code, MARQUEUR_BOUTISME, len(valeurs), nb_parties)
+    chemin_temporaire = chemin.with_name(f'{chemin.name}.{os.getpid()}.tmp')
+    with open(chemin_temporaire, 'wb') as f:
+        f.write(entete)
+        valeurs.tofile(f)
+    os.replace(chemin_temporaire, chemin)
+    return chemin
+
+
+if __name__ == '__main__':
+    parseur = argparse.ArgumentParser(prog='python -m tp4.reliquats',
+                                      description='Construit les tables de reliquats à partir de parties entre robots.')
+    parseur.add_argument('--langue', nargs='+', default=['fr', 'en'],
+                         choices=[code.lower() for code in codes_langues()])
+    parseur.add_argument('--parties', type=int, default=1000, help='nombre de parties à jouer par langue')
+    parseur.add_argument('--graine', type=int, default=0, help='graine de la première partie')
+    parseur.add_argument('-j', '--processus', type=int, default=os.cpu_count(), help='nombre de processus')
+    arguments = parseur.parse_args()
+    for langue in arguments.langue:
+        table = construire_table(langue.upper(), arguments.parties, arguments.graine, arguments.processus)
+        print(f'{langue}: {ecrire_table(table, langue.upper(), arguments.parties)}')
@@ -0,0 +1,135 @@
+from random import Random
+
+from tp4.zobrist import CLES_SAC, cle_occurrence
+
+
+class Sac:
+    """
+    Cette classe représente le sac de jetons d'une partie.
+
+    Chaque tirage choisit un jeton au hasard et le retire en l'échangeant avec le dernier jeton de la liste: un tirage
+    ne coûte donc rien de plus que le nombre de jetons tirés, et ne crée aucune nouvelle liste. Le hasard vient d'un
+    générateur propre au sac (ou à la partie), de sorte qu'une partie jouée avec la même graine tire toujours les
+    mêmes jetons.
+
+    Attributes:
+        jetons (list): Les jetons dans le sac (instances de la classe Jeton), dans un ordre quelconque.
+        hasard (random.Random): Le générateur de nombres aléatoires utilisé pour les tirages.
+        nombres (dict): Le nombre de jetons de chaque lettre dans le sac.
+        empreinte (int): Empreinte de Zobrist du contenu du sac (voir le module zobrist).
+    """
+    def __init__(self, jetons=(), hasard=None):
+        """
+        Constructeur.
+
+        Args:
+            jetons (iterable, optionnel): Les jetons à mettre dans le sac.
+            hasard (random.Random, optionnel): Le générateur à utiliser (par défaut, un nouveau générateur).
+        """
+        self.jetons = list(jetons)
+        self.hasard = Random() if hasard is None else hasard
+        self.nombres = {}
+        self.empreinte = 0
+        for jeton in self.jetons:
+            self.nombres[jeton.lettre] = self.nombres.get(jeton.lettre, 0) + 1
+            self.empreinte ^= cle_occurrence(CLES_SAC, jeton.lettre, self.nombres[jeton.lettre])
+
+    def __len__(self):
+        """
+        Returns:
+            int: Le nombre de jetons dans le sac.
+        """
+        return len(self.jetons)
+
+    def __iter__(self):
+        """
+        Returns:
+            iterator: Les jetons dans le sac.
+        """
+        return iter(self.jetons)
+
+    def nombre(self, lettre):
+        """
+        Args:
+            lettre (str): Une lettre.
+
+        Returns:
+            int: Le nombre de jetons de cette lettre dans le sac.
+        """
+        return self.nombres.get(lettre, 0)
+
+    def _retirer_index(self, i):
+        jetons = self.jetons
+        jetons[i], jetons[-1] = jetons[-1], jetons[i]
+        jeton = jetons.pop()
+        self.empreinte ^= cle_occurrence(CLES_SAC, jeton.lettre, self.nombres[jeton.lettre])
+        self.nombres[jeton.lettre] -= 1
+        return jeton
+
+    def tirer(self, n):
+        """
+        Tire n jetons au hasard.
+
+        Args:
+            n (int): Le nombre de jetons à tirer (au plus le nombre de jetons dans le sac).
+
+        Returns:
+            list: Les jetons tirés.
+
+        Raises:
+            ValueError: S'il n'y a pas assez de jetons dans le sac.
+        """
+        if not 0 <= n <= len(self.jetons):
+            raise ValueError(f'Impossible de tirer {n} jetons d\'un sac qui en contient {len(self.jetons)}.')
+        return [self._retirer_index(self.hasard.randrange(len(self.jetons))) for _ in range(n)]
+
+    def retirer(self, lettre):
+        """
+        Retire un jeton de la lettre donnée (par exemple pour rejouer un tirage connu).
+
+        Args:
+            lettre (str): La lettre du jeton à retirer.
+
+        Returns:
+            Jeton: Le jeton retiré.
+
+        Raises:
+            ValueError: S'il n'y a aucun jeton de cette lettre dans le sac.
+        """
+        if not self.nombre(lettre):
+            raise ValueError(f'Aucun jeton {lettre} dans le sac.')
+        for i in range(len(self.jetons) - 1, -1, -1):
+            if self.jetons[i].lettre == lettre:
+                return self._retirer_index(i)
+
+    def ajouter(self, jeton):
+        """
+        Remet un jeton dans le sac.
+
+        Args:
+            jeton (Jeton): Le jeton à remettre.
+        """
+        self.jetons.append(jeton)
+        self.nombres[jeton.lettre] = self.nombres.get(jeton.lettre, 0) + 1
+        self.empreinte ^= cle_occurrence(CLES_SAC, jeton.lettre, self.nombres[jeton.lettre])
+
+    def copier(self, hasard=None):
+        """
+        Crée une copie du sac. Les jetons eux-mêmes ne sont pas copiés.
+
+        Args:
+            hasard (random.Random, optionnel): Le générateur de la copie. Par défaut, la copie reçoit un générateur
+                                               dans le même état que celui du sac: elle fera donc les mêmes tirages.
+
+        Returns:
+            Sac: La copie.
+        """
+        copie = Sac.__new__(Sac)
+        copie.jetons = self.jetons[:]
+        copie.nombres = dict(self.nombres)
+        copie.empreinte = self.empreinte
+        if hasard is None:
+            hasard = Random()
+            hasard.setstate(self.hasard.getstate())
+        copie.hasard = hasard
+        return copie
@@ -0,0 +1,217 @@
+"""
+Sauvegarde et chargement de parties dans un format texte compact et versionné.
+
+Un fichier de sauvegarde est un fichier JSON Lines. La première ligne contient l'état complet de la partie (voir
+etat_partie): grille, sac, chevalets, pointages, joueur actif, historique et état du générateur de nombres aléatoires,
+de sorte qu'une partie chargée fait les mêmes tirages que si elle n'avait jamais été interrompue. Chaque ligne suivante contient un tour
+joué depuis (voir Partie.jouer_coup et Partie.passer_son_tour), de sorte qu'on peut mettre une sauvegarde à jour en
+ajoutant une ligne à la fin du fichier plutôt qu'en la réécrivant (voir ajouter_tour). Au chargement, ces tours sont
+rejoués sur l'état de la première ligne.
+
+Aucun objet graphique n'est sauvegardé: une partie peut donc être chargée sans affichage.
+"""
+import json
+from random import Random
+
+from tp4.grille import Grille, NB_CASES
+from tp4.jeton import Jeton
+from tp4.joueur import Joueur
+from tp4.partie import Partie
+from tp4.sac import Sac
+
+FORMAT = 'scrabble-partie'
+VERSION = 2
+# Versions qu'on sait encore lire (la version 1 ne contient pas l'état du générateur).
+VERSIONS_LISIBLES = (1, 2)
+VIDE = '.'
+
+
+def _lettres(jetons):
+    """
+    Returns:
+        str: Une lettre par jeton, VIDE pour chaque None.
+    """
+    return ''.join(VIDE if jeton is None else jeton.lettre for jeton in jetons)
+
+
+def etat_partie(partie):
+    """
+    Args:
+        partie (Partie): La partie à sauvegarder.
+
+    Returns:
+        dict: L'état de la partie, prêt à être écrit en JSON. La grille, le sac et les chevalets y sont représentés
+              par des chaînes de caractères (une lettre par jeton), et les valeurs des lettres sont données à part.
+              L'état du générateur de la partie (voir random.Random.getstate) y est donné sous forme de listes.
+    """
+    version, interne, gauss = partie.hasard.getstate()
+    return {
+        'format': FORMAT,
+        'version': VERSION,
+        'langue': partie.langue,
+        'valeurs': dict(partie.valeurs_lettres),
+        'grille': ''.join(chr(code) if code else VIDE for code in partie.plateau.lettres),
+        'sac': _lettres(partie.jetons_libres),
+        'joueurs': [{'nom': joueur.nom, 'points': joueur.points, 'chevalet': _lettres(joueur.chevalet)}
+                    for joueur in partie.joueurs],
+        'joueur_actif': None if partie.joueur_actif is None else partie.joueurs.index(partie.joueur_actif),
+        'historique': list(partie.historique),
+        'fin_standard': partie.fin_standard,
+        'hasard': [version, list(interne), gauss],
+    }
+
+
+def restaurer_partie(etat, partie=None):
+    """
+    Remet une partie dans l'état donné, y compris son générateur de nombres aléatoires (un nouveau générateur pour
+    les sauvegardes de la version 1).
+
+    Args:
+        etat (dict): L'état de la partie (voir etat_partie).
+        partie (Partie, optionnel): La partie à restaurer (par exemple une partie avec interface graphique). Par
+                                    défaut, une nouvelle partie sans interface graphique est créée.
+
+    Returns:
+        Partie: La partie restaurée.
+
+    Raises:
+        ValueError: Si l'état n'est pas dans un format ou une version connus.
+    """
+    if etat.get('format') != FORMAT or etat.get('version') not in VERSIONS_LISIBLES:
+        raise ValueError('Format de sauvegarde inconnu.')
+    if partie is None:
+        partie = Partie.__new__(Partie)
+        partie.plateau = Grille()
+
+    valeurs = etat['valeurs']
+
+    def jetons(lettres):
+        return [None if lettre == VIDE else Jeton(lettre, valeurs[lettre]) for lettre in lettres]
+
+    partie.hasard = Random()
+    if 'hasard' in etat:
+        version, interne, gauss = etat['hasard']
+        partie.hasard.setstate((version, tuple(interne), gauss))
+    partie.langue = etat['langue']
+    partie.valeurs_lettres = dict(valeurs)
+    partie.jetons_libres = Sac(jetons(etat['sac']), partie.hasard)
+    partie.joueurs = []
+    for donnees in etat['joueurs']:
+        joueur = Joueur(donnees['nom'])
+        joueur.points = donnees['points']
+        for i, jeton in enumerate(jetons(donnees['chevalet'])):
+            if jeton is not None:
+                joueur.ajouter_jeton(jeton, i)
+        partie.joueurs.append(joueur)
+    actif = etat['joueur_actif']
+    partie.joueur_actif = None if actif is None else partie.joueurs[actif]
+    partie.historique = list(etat['historique'])
+    partie.fin_standard = etat.get('fin_standard', False)
+    partie.dernier_tirage = []
+
+    grille = partie.plateau
+    for k in range(NB_CASES):
+        if grille.lettres[k]:
+            grille.retirer_jeton_index(k)
+    for k, lettre in enumerate(etat['grille']):
+        if lettre != VIDE:
+            grille.placer_jeton_index(Jeton(lettre, valeurs[lettre]), k)
+    partie.charger_dictionnaire()
+    return partie
+
+
+def appliquer_tour(partie, tour):
+    """
+    Rejoue un tour de l'historique, sans revalider le coup: les jetons sont placés, les points ajoutés, puis le
+    joueur suivant devient actif et reçoit les jetons du tirage (voir _rejouer_tirage). Si le tour a terminé la partie (fin standard, voir
+    Partie.decompter_reliquats), les reliquats notés sont décomptés et le joueur actif ne change pas.
+
+    Args:
+        partie (Partie): La partie, dans l'état qui précède le tour.
+        tour (dict): Le tour à rejouer (voir Partie.jouer_coup et Partie.passer_son_tour).
+    """
+    joueur = partie.joueurs[tour['joueur']]
+    if not tour.get('passe'):
+        for lettre, position in zip(tour['lettres'], tour['positions']):
+            i = next(i for i, jeton in enumerate(joueur.chevalet) if jeton is not None and jeton.lettre == lettre)
+            partie.plateau.placer_jeton_index(joueur.retirer_jeton(i), partie.plateau.index_position(position))
+        joueur.ajouter_points(tour['score'])
+    partie.historique.append(tour)
+    if 'reliquats' in tour:
+        for joueur, ajustement in zip(partie.joueurs, tour['reliquats']):
+            joueur.ajouter_points(ajustement)
+        return
+
+    partie.joueur_actif = partie.joueurs[(tour['joueur'] + 1) % len(partie.joueurs)]
+    partie.dernier_tirage = _rejouer_tirage(partie.jetons_libres, tour['tirage'])
+    for jeton in partie.dernier_tirage:
+        partie.joueur_actif.ajouter_jeton(jeton)
+
+
+def _rejouer_tirage(sac, lettres):
+    """
+    Retire du sac les jetons d'un tirage connu. Le tirage est d'abord refait avec le générateur du sac: s'il redonne
+    les lettres notées (le générateur est dans l'état de la partie d'origine), le sac et son générateur se retrouvent
+    exactement dans l'état de la partie d'origine et les tirages suivants seront les mêmes. Sinon (sauvegarde sans état
+    du générateur), on retire simplement les lettres notées.
+
+    Args:
+        sac (Sac): Le sac.
+        lettres (str): Les lettres tirées, dans l'ordre du tirage.
+
+    Returns:
+        list: Les jetons retirés.
+    """
+    copie = sac.copier()
+    tirage = copie.tirer(len(lettres)) if len(lettres) <= len(copie) else []
+    if ''.join(jeton.lettre for jeton in tirage) == lettres:
+        sac.jetons, sac.nombres, sac.empreinte = copie.jetons, copie.nombres, copie.empreinte
+        sac.hasard.setstate(copie.hasard.getstate())
+        return tirage
+    return [sac.retirer(lettre) for lettre in lettres]
+
+
+def sauvegarder_partie(partie, chemin):
+    """
+    Écrit l'état complet d'une partie dans un fichier (en remplaçant son contenu).
+
+    Args:
+        partie (Partie): La partie à sauvegarder.
+        chemin (str): Le chemin du fichier.
+    """
+    with open(chemin, 'w', encoding='utf-8') as fichier:
+        fichier.write(json.dumps(etat_partie(partie), separators=(',', ':')) + '\n')
+
+
+def ajouter_tour(chemin, tour):
+    """
+    Ajoute un tour à la fin d'un fichier de sauvegarde.
+
+    Args:
+        chemin (str): Le chemin du fichier.
+        tour (dict): Le tour (le dernier élément de Partie.historique).
+    """
+    with open(chemin, 'a', encoding='utf-8') as fichier:
+        fichier.write(json.dumps(tour, separators=(',', ':')) + '\n')
+
+
+def charger_partie(chemin, partie=None):
+    """
+    Charge une partie depuis un fichier de sauvegarde, en rejouant les tours ajoutés après l'état complet.
+
+    Args:
+        chemin (str): Le chemin du fichier.
+        partie (Partie, optionnel): La partie à restaurer (voir restaurer_partie).
+
+    Returns:
+        Partie: La partie chargée.
+
+    Raises:
+        ValueError: Si le fichier n'est pas une sauvegarde valide.
+    """
+    with open(chemin, encoding='utf-8') as fichier:
+        partie = restaurer_partie(json.loads(fichier.readline()), partie)
+        for ligne in fichier:
+            if ligne.strip():
+                appliquer_tour(partie, json.loads(ligne))
+    return partie
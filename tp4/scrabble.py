@@ -1,42 +1,49 @@
-import pickle
-from tkinter import Canvas, Tk, W, S, N, Frame, Button, messagebox, simpledialog, Label, StringVar, Toplevel
-from pathlib import Path
-from random import choice, shuffle
+from tkinter import Canvas, Tk, W, S, N, Frame, Button, messagebox, simpledialog, Label, Toplevel, Listbox
 
-from tp4.joueur import Joueur
+from tp4.langues import codes_langues
+from tp4.partie import Partie
 from tp4.plateau import Plateau
-from tp4.jeton import Jeton
+from tp4.suggestion import RechercheSuggestions
+from tp4.tableau_pointages import TableauPointages
+from tp4 import sauvegarde
 from tp4.utils import dessiner_jeton
 from tp4.exceptions import *
 
-BASE_DIR = Path(__file__).resolve().parent
+# Nombre de coups suggérés, temps alloué à la recherche (en secondes) et délai entre deux mises à jour de l'affichage
+# des suggestions (en millisecondes).
+NB_SUGGESTIONS = 5
+BUDGET_SUGGESTION = 3.0
+DELAI_SUGGESTION = 100
 
 
-class Scrabble(Tk):
+class Scrabble(Partie, Tk):
     """
-    Classe Scrabble qui implémente aussi une partie de la logique de jeu.
-    En dérivant de la classe tkinter.Tk, la classe Scrabble gère aussi la fenêtre principale de l'interface graphique
+    Interface graphique d'une partie de scrabble.
+    La logique de jeu est héritée de la classe Partie (voir Partie pour les attributs dictionnaire, jetons_libres,
+    joueurs et joueur_actif). En dérivant de la classe tkinter.Tk, la classe Scrabble gère aussi la fenêtre principale
+    de l'interface graphique
 
     Attributes:
-        dictionnaire (list): Contient tous les mots qui peuvent être joués sur dans cette partie.
-                             (afin de savoir si un mot est permis, on va vérifier s'il est dans dictionnaire)
         plateau (Plateau): Un objet de la classe Plateau. On y place des jetons et il nous dit le nombre de points
                            gagnés.
-        jetons_libres (list): La liste de tous les jetons dans le sac (instances de la classe Jeton), c'est là que
-                              chaque joueur pige des jetons quand il en a besoin.
-        joueurs: (list): L'ensemble des joueurs de la partie (instances de la classe Joueur)
-        joueur_actif (Joueur): Le joueur qui est en train de jouer le tour en cours. Si aucun joueur alors None.
         nb_pixels_par_case (int): Nombre de pixel qu'occupe la représentation graphique d'une case.
         chevalet (tkinter.Canvas): Rendu graphique du chevalet du joueur actif.
         position_selection_chevalet (int): Mémorise la position du jeton sélectionné sur le chevalet
                                             (vaut None si aucun jeton n'est sélectionné)
+        tableau_pointages (TableauPointages): Affiche le nom et le pointage des joueurs.
+        liste_suggestions (tkinter.Listbox): Les meilleurs coups trouvés par la recherche de suggestions.
+        recherche (RechercheSuggestions): La recherche de suggestions en cours ou terminée (None s'il n'y en a pas).
     """
 
-    def __init__(self):
+    def __init__(self, nom_fichier=None):
         """
         Constructeur
+
+        Args:
+            nom_fichier (str, optionnel): Fichier de sauvegarde d'une partie à reprendre (voir charger_partie). Par
+                                          défaut, on demande le nombre de joueurs et la langue d'une nouvelle partie.
         """
-        super().__init__()
+        Tk.__init__(self)
 
         self.title('Scrabble')
 
@@ -77,10 +84,26 @@ class Scrabble(Tk):
                          height=2))
         bouton.grid(row=3, column=0, pady=15)
 
+        bouton = (Button(panneau_boutons, text="Suggestion",
+                         command=self.clic_suggestion, width=25,
+                         height=2))
+        bouton.grid(row=4, column=0, pady=15)
+
+        self.liste_suggestions = Listbox(panneau_boutons, height=NB_SUGGESTIONS, width=40, activestyle='none')
+        self.liste_suggestions.grid(row=5, column=0)
+        self.liste_suggestions.bind('<<ListboxSelect>>', self.choisir_suggestion)
+        self.liste_suggestions.bind('<Double-Button-1>', self.placer_suggestion)
+        self.recherche = None
+        self._suivi_recherche = None
+        self._version_affichee = None
+
         bouton = (Button(panneau_boutons, text="Contrôle",
                          command=self.fenetre_controle, width=25,
                         height=1))
-        bouton.grid(row=4, column=0, pady=5)
+        bouton.grid(row=6, column=0, pady=5)
+
+        self.tableau_pointages = TableauPointages(self)
+        self.tableau_pointages.grid(row=0, column=1, sticky=N)
 
         # Associe les évènements aux méthodes correspondants
         self.plateau.tag_bind('case', '<Button-1>', self.clic_case_plateau)
@@ -88,16 +111,24 @@ class Scrabble(Tk):
         self.bind('<Button-3>', self.reinitialiser_tour)
         self.bind('<Escape>', self.reinitialiser_tour)
 
+        if nom_fichier is not None:
+            sauvegarde.charger_partie(nom_fichier, self)
+            self.plateau.dessiner()
+            self.dessiner_chevalet()
+            self.afficher_info_joueurs()
+            return
+
         # Vous pouvez afficher une boite de dialogue afin de demander à l'utilisateur le nombre de joueurs
         # et la langue souhaitée et ensuite passer ces valeurs en arguments à la méthode initialiser_jeu
         nbr_joueurs = simpledialog.askinteger('Joueurs', 'Entrez le nombre de joueurs (2-4)')
         while nbr_joueurs not in range(2, 5):
             messagebox.showerror('Oups!', "Le nombre de joueurs doit être entre 2 et 4")
             nbr_joueurs = simpledialog.askinteger('Joueurs', 'Entrez le nombre de joueurs (2-4)')
-        langue = simpledialog.askstring('Langue', 'Entrez FR pour francais et EN pour anglais')
-        while langue not in ('en' 'EN', 'fr', 'FR'):
-            messagebox.showerror('Oups!', "La langue doit être FR ou EN")
-            langue = simpledialog.askstring('Langue', 'Entrez FR pour francais et EN pour anglais')
+        codes = ', '.join(codes_langues())
+        langue = simpledialog.askstring('Langue', f'Entrez la langue ({codes}), par exemple FR pour francais')
+        while langue is None or langue.upper() not in codes_langues():
+            messagebox.showerror('Oups!', f"La langue doit être l'une de: {codes}")
+            langue = simpledialog.askstring('Langue', f'Entrez la langue ({codes}), par exemple FR pour francais')
 
         self.initialiser_jeu(nbr_joueurs, langue)
         # Creation des informations joueur
@@ -132,81 +163,30 @@ class Scrabble(Tk):
 
                 """
         self.reinitialiser_tour()
-        self.joueur_suivant()
-
-    def afficher_info_joueurs(self):
-        """Affiche les info des joueurs.
-
+        try:
+            super().passer_son_tour()
+        except FinPartie:
+            self.terminer_partie()
 
+    def tour_joue(self, tour):
         """
-        panneau_joueurs = Frame(self)
-        panneau_joueurs.grid(row=0, column=1, sticky=N)
-        i = 0
-        for x in self.joueurs:
-            var = StringVar()
-            var.set(x.__str__())
-            if x == self.joueur_actif:
-                l = Label(panneau_joueurs, textvariable=var, bg='#00fbff', relief='raised', width=25, pady=20)
-            else:
-                l = Label(panneau_joueurs, textvariable=var, pady=20)
-            l.grid(row=0 + i, column=0)
-            i = i + 1
+        Annonce le résultat d'un coup, puis remet l'affichage du tour à zéro, avant de passer au joueur suivant (voir
+        Partie.tour_joue): le chevalet du joueur suivant n'est tiré et affiché qu'ensuite. La recherche de
+        suggestions est arrêtée d'abord, pour qu'aucune mise à jour ne survienne pendant l'annonce.
 
-    def initialiser_jeu(self, nb_joueurs=2, langue='fr'):
+        Args:
+            tour (dict): Le tour joué.
         """
-        Étant donné un nombre de joueurs et une langue, cette méthode crée une partie de scrabble.
-
-        Pour une nouvelle partie de scrabble:
-        - La liste des joueurs est créée et chaque joueur porte automatiquement le nom Joueur 1, Joueur 2, ... Joueur n,
-          où n est le nombre de joueurs;
-        - Le joueur_actif est None.
+        self.annuler_suggestion()
+        if not tour.get('passe'):
+            messagebox.showinfo('Bravo!', f"Mots formés: {tour['mots']}\nScore obtenu: {tour['score']}")
+        self.reinitialiser_tour()
 
-        Args:
-            nb_joueurs (int): nombre de joueurs de la partie (au minimun 2 au maximum 4).
-            langue (str): 'FR' pour la langue française et 'EN' pour la langue anglaise. Charge en mémoire les mots
-                          contenus dans le fichier "dictionnaire_francais.txt" ou "dictionnaire_anglais.txt".
-            La langue détermine aussi les jetons de départ.
-            Voir https://fr.wikipedia.org/wiki/Lettres_du_Scrabble
-            Note: Dans notre scrabble, nous n'utiliserons pas les jetons blancs (jokers) qui ne contiennent aucune lettre.
-
-        Raises:
-            AssertionError:
-                - Si la langue n'est ni 'fr', 'FR', 'en', ou 'EN'.
-                - Si le nombre de joueurs n'est pas compris entre 2 et 4 (2 et 4 étant inclus).
-        """
-        if not langue.upper() in ['FR', 'EN']:
-            raise MauvaiseLangue
-        if not 2 <= nb_joueurs <= 4:
-            raise MauvaisNbrJoueurs
-
-        self.joueur_actif = None
-        self.joueurs = [Joueur(f'Joueur {i + 1}') for i in range(nb_joueurs)]
-
-        if langue.upper() == 'FR':
-            # Infos disponibles sur https://fr.wikipedia.org/wiki/Lettres_du_Scrabble
-            data = [('E', 15, 1), ('A', 9, 1), ('I', 8, 1), ('N', 6, 1), ('O', 6, 1),
-                    ('R', 6, 1), ('S', 6, 1), ('T', 6, 1), ('U', 6, 1), ('L', 5, 1),
-                    ('D', 3, 2), ('M', 3, 2), ('G', 2, 2), ('B', 2, 3), ('C', 2, 3),
-                    ('P', 2, 3), ('F', 2, 4), ('H', 2, 4), ('V', 2, 4), ('J', 1, 8),
-                    ('Q', 1, 8), ('K', 1, 10), ('W', 1, 10), ('X', 1, 10), ('Y', 1, 10),
-                    ('Z', 1, 10)]
-
-
-            chemin_fichier_dictionnaire = BASE_DIR / 'dictionnaire_francais.txt'
-        elif langue.upper() == 'EN':
-            # Infos disponibles sur https://fr.wikipedia.org/wiki/Lettres_du_Scrabble
-            data = [('E', 12, 1), ('A', 9, 1), ('I', 9, 1), ('N', 6, 1), ('O', 8, 1),
-                    ('R', 6, 1), ('S', 4, 1), ('T', 6, 1), ('U', 4, 1), ('L', 4, 1),
-                    ('D', 4, 2), ('M', 2, 3), ('G', 3, 2), ('B', 2, 3), ('C', 2, 3),
-                    ('P', 2, 3), ('F', 2, 4), ('H', 2, 4), ('V', 2, 4), ('J', 1, 8),
-                    ('Q', 1, 10), ('K', 1, 5), ('W', 2, 4), ('X', 1, 8), ('Y', 2, 4),
-                    ('Z', 1, 10)]
-            chemin_fichier_dictionnaire = BASE_DIR / 'dictionnaire_anglais.txt'
-        self.jetons_libres = [Jeton(lettre, valeur) for lettre, occurences, valeur in data for i in range(occurences)]
-        with open(chemin_fichier_dictionnaire, 'r') as f:
-            self.dictionnaire = [x[:-1].upper() for x in f.readlines() if len(x[:-1]) > 1]
-
-        self.joueur_suivant()
+    def afficher_info_joueurs(self):
+        """Affiche les info des joueurs.
+        Le tableau des pointages est mis à jour sur place: aucun widget n'est créé à chaque appel.
+        """
+        self.tableau_pointages.mettre_a_jour(self.joueurs, self.joueur_actif)
 
     def clic_melanger_chevalet(self, event=None):
         """
@@ -227,6 +207,7 @@ class Scrabble(Tk):
         Args:
             event (tkinter.Event): L'évènement ayant causé l'appel de la méthode (non utilisé).
         """
+        self.annuler_suggestion()
         liste_jetons = self.plateau.retirer_jetons_en_jeu()[0]
         for jeton in liste_jetons:
             self.joueur_actif.ajouter_jeton(jeton)
@@ -259,69 +240,132 @@ class Scrabble(Tk):
         jeton = self.joueur_actif.retirer_jeton(self.position_selection_chevalet)
 
         if self.plateau.ajouter_jeton_en_jeu(jeton, event.x, event.y):
+            self.annuler_suggestion()
             self.position_selection_chevalet = None
             self.plateau.dessiner()
             self.dessiner_chevalet()
         else:
-            self.joueur_actif.ajouter_jeton(self.position_selection_chevalet)
+            self.joueur_actif.ajouter_jeton(jeton, self.position_selection_chevalet)
 
-    def mot_permis(self, mot):
+    def clic_suggestion(self):
         """
-        Permet de savoir si un mot est permis dans la partie ou pas 
-        en vérifiant dans le dictionnaire.
-
-        Args:
-            mot (str): Mot à vérifier.
+        Lance, en arrière-plan, la recherche des meilleurs coups du joueur actif. Les jetons en jeu reviennent d'abord
+        sur le chevalet. La liste des suggestions et l'aperçu du meilleur coup sur le plateau s'améliorent au fil de la
+        recherche (voir suivre_suggestion).
+        """
+        self.reinitialiser_tour()
+        self.recherche = RechercheSuggestions(self.dictionnaire, self.plateau, self.joueur_actif.chevalet,
+                                              NB_SUGGESTIONS, BUDGET_SUGGESTION)
+        self.liste_suggestions.insert('end', 'Recherche en cours...')
+        self.recherche.demarrer()
+        self._suivi_recherche = self.after(DELAI_SUGGESTION, self.suivre_suggestion)
 
+    def suivre_suggestion(self):
+        """
+        Affiche les meilleurs coups trouvés jusqu'ici, s'ils ont changé, puis se replanifie jusqu'à la fin de la
+        recherche. Cette méthode ne fait qu'interroger la recherche: elle ne bloque jamais l'interface.
+        """
+        self._suivi_recherche = None
+        recherche = self.recherche
+        if recherche is None:
+            return
+        terminee = recherche.terminee
+        if recherche.version != self._version_affichee:
+            self._version_affichee = recherche.version
+            coups = recherche.resultats()
+            selection = self.liste_suggestions.curselection()
+            self.liste_suggestions.delete(0, 'end')
+            for coup in coups:
+                self.liste_suggestions.insert('end', str(coup))
+            rang = selection[0] if selection and selection[0] < len(coups) else 0
+            if coups:
+                self.liste_suggestions.selection_set(rang)
+                self.plateau.afficher_apercu(coups[rang].jetons, coups[rang].positions)
+        if terminee and not recherche.resultats():
+            self.liste_suggestions.delete(0, 'end')
+            self.liste_suggestions.insert('end', 'Aucun coup permis.')
+        if not terminee:
+            self._suivi_recherche = self.after(DELAI_SUGGESTION, self.suivre_suggestion)
+
+    def annuler_suggestion(self):
+        """
+        Arrête la recherche de suggestions, s'il y en a une, et efface la liste des suggestions et l'aperçu.
+        """
+        if self._suivi_recherche is not None:
+            self.after_cancel(self._suivi_recherche)
+            self._suivi_recherche = None
+        if self.recherche is not None:
+            self.recherche.annuler()
+            self.recherche = None
+        self._version_affichee = None
+        self.liste_suggestions.delete(0, 'end')
+        self.plateau.effacer_apercu()
+
+    def _suggestion_choisie(self):
+        """
         Returns:
-            bool: True si le mot est dans le dictionnaire, False sinon.
+            Coup: Le coup sélectionné dans la liste des suggestions, ou None.
         """
-        return mot.upper() in self.dictionnaire
+        selection = self.liste_suggestions.curselection()
+        if self.recherche is None or not selection:
+            return None
+        coups = self.recherche.resultats()
+        return coups[selection[0]] if selection[0] < len(coups) else None
 
-    def determiner_gagnant(self):
+    def choisir_suggestion(self, event=None):
         """
-        Détermine le joueur gagnant.
-        Le joueur gagnant doit avoir un pointage supérieur ou égal à celui des autres.
+        Affiche sur le plateau l'aperçu du coup sélectionné dans la liste des suggestions.
 
-        Returns:
-            Joueur: Le joueur gagnant. Si plusieurs sont à égalité, on en retourne un seul parmi ceux-ci.
+        Args:
+            event (tkinter.Event): L'évènement ayant causé l'appel de la méthode (non utilisé).
         """
-        return max(self.joueurs, key=lambda j: j.points)
+        coup = self._suggestion_choisie()
+        if coup is not None:
+            self.plateau.afficher_apercu(coup.jetons, coup.positions)
 
-    def partie_terminee(self):
+    def placer_suggestion(self, event=None):
         """
-        Vérifie si la partie est terminée. Une partie est terminée si il n'existe plus de jetons libres ou il reste
-        moins de deux (2) joueurs. C'est la règle que nous avons choisi d'utiliser pour ce travail, donc essayez de
-        négliger les autres que vous connaissez ou avez lu sur Internet.
+        Met en jeu les jetons du coup sélectionné dans la liste des suggestions, comme si le joueur les avait placés
+        lui-même: il ne reste qu'à jouer le tour.
 
-        Returns:
-            bool: True si la partie est terminée, et False autrement.
+        Args:
+            event (tkinter.Event): L'évènement ayant causé l'appel de la méthode (non utilisé).
         """
-        return len(self.jetons_libres) == 0 or len(self.joueurs) < 2
+        coup = self._suggestion_choisie()
+        if coup is None:
+            return
+        self.reinitialiser_tour()
+        for jeton, position in zip(coup.jetons, coup.positions):
+            self.joueur_actif.retirer_jeton(self.joueur_actif.chevalet.index(jeton))
+            self.plateau.jetons_en_jeu.append(jeton)
+            self.plateau.positions_en_jeu.append(position)
+        self.plateau.dessiner()
+        self.dessiner_chevalet()
 
     def joueur_suivant(self):
         """
         Change le joueur actif.
         Le nouveau joueur actif est celui à l'index du (joueur courant + 1) % nb_joueurs.
         Si on n'a aucun joueur actif, on détermine au hasard le suivant.
+        Si la partie se termine, le gagnant est annoncé.
+        La recherche de suggestions du joueur précédent a déjà été arrêtée (voir tour_joue et passer_son_tour).
         """
         try:
-            if self.joueur_actif is None:
-                self.joueur_actif = choice(self.joueurs)
-            else:
-                self.joueur_actif = self.joueurs[(self.joueurs.index(self.joueur_actif) + 1) % len(self.joueurs)]
-
-            if self.joueur_actif.nb_a_tirer() > 0:
-                for jeton in self.tirer_jetons(self.joueur_actif.nb_a_tirer()):
-                    self.joueur_actif.ajouter_jeton(jeton)
+            super().joueur_suivant()
             self.position_selection_chevalet = None
             self.dessiner_chevalet()
             self.afficher_info_joueurs()
         except FinPartie:
-            gagnant = self.determiner_gagnant()
-            messagebox.showinfo('Oops', f'Le gagnant est {gagnant.nom} avec {gagnant.points} points')
-            self.nouvelle_partie()
-            self.quit()
+            self.terminer_partie()
+
+    def terminer_partie(self):
+        """
+        Annonce le gagnant et propose une nouvelle partie.
+        """
+        gagnant = self.determiner_gagnant()
+        messagebox.showinfo('Oops', f'Le gagnant est {gagnant.nom} avec {gagnant.points} points')
+        self.nouvelle_partie()
+        self.quit()
 
     def dessiner_chevalet(self):
         """
@@ -334,27 +378,6 @@ class Scrabble(Tk):
                 selection = j == self.position_selection_chevalet
                 dessiner_jeton(self.chevalet, jeton, 0, j, self.nb_pixels_par_case, selection)
 
-    def tirer_jetons(self, n):
-        """
-        Simule le tirage de n jetons du sac à jetons et renvoie ceux-ci. Il s'agit de prendre au hasard des jetons dans
-        self.jetons_libres et de les retourner.
-
-        Args:
-            n (int): Le nombre de jetons à tirer.
-
-        Returns:
-            list: La liste des jetons tirés (instances de la classe Jeton).
-
-        Raises:
-            AssertionError: Si n n'est pas compris dans l'intervalle [0, nombre total de jetons libres].
-        """
-        if not 0 <= n <= len(self.jetons_libres):
-            raise FinPartie
-        shuffle(self.jetons_libres)
-        res = self.jetons_libres[:n]
-        self.jetons_libres = self.jetons_libres[n:]
-        return res
-
     def jouer_un_tour(self):
         """
         Vérifie d'abord si les positions des jetons déposés sur le plateau par le joueur actif sont valides.
@@ -364,43 +387,22 @@ class Scrabble(Tk):
         """
 
         try:
-            points_depart = self.joueur_actif.points
             liste_jetons, liste_positions = self.plateau.retirer_jetons_en_jeu()
-            if len(liste_positions) == 0:
-                raise AucunJeton
-            self.plateau.valider_positions_avant_ajout(liste_positions)
-
-            mots, score = self.plateau.placer_mots(liste_jetons, liste_positions)
-
-            if any([not self.mot_permis(m) for m in mots]):
-                messagebox.showerror('Oups!', "Au moins l'un des mots formés est absent du dictionnaire.")
-                for pos in liste_positions:
-                    self.plateau.retirer_jeton(pos)
-            else:
-                messagebox.showinfo('Bravo!', f'Mots formés: {mots}\nScore obtenu: {score}')
-                self.joueur_actif.ajouter_points(score)
-                liste_jetons = []
-
             for jeton in liste_jetons:
                 self.joueur_actif.ajouter_jeton(jeton)
 
-            self.reinitialiser_tour()
-            if points_depart != self.joueur_actif.points:
-                self.joueur_suivant()
+            # Le résultat est annoncé par tour_joue, avant de passer au joueur suivant.
+            self.jouer_coup(liste_jetons, liste_positions)
 
+        except FinPartie:
+            self.terminer_partie()
         except PositionInvalideException:
-            for jeton in liste_jetons:
-                self.joueur_actif.ajouter_jeton(jeton)
             messagebox.showerror('Oups!', "La position des lettres n'est pas valide.")
             self.reinitialiser_tour()
         except MotNonPermisException:
-            for jeton in liste_jetons:
-                self.joueur_actif.ajouter_jeton(jeton)
             messagebox.showerror('Oups!', "Au moins l'un des mots formés est absent du dictionnaire.")
             self.reinitialiser_tour()
         except CaseOccupeeException:
-            for jeton in liste_jetons:
-                self.joueur_actif.ajouter_jeton(jeton)
             messagebox.showerror('Oups!', "On ne peut placer un jeton sur cette case.")
             self.reinitialiser_tour()
         except AucunJeton:
@@ -409,20 +411,19 @@ class Scrabble(Tk):
 
     def sauvegarder_partie(self, nom_fichier):
         """
-        Permet de sauvegarder l'objet courant dans le fichier portant le nom spécifié.
-        La sauvegarde se fera grâce à la fonction dump du module pickle.
+        Permet de sauvegarder la partie courante dans le fichier portant le nom spécifié.
+        Seul l'état de la partie est sauvegardé (voir le module sauvegarde), pas l'interface graphique.
 
         Args:
-            nom_fichier (str): Nom du fichier qui contient un objet scrabble.
+            nom_fichier (str): Nom du fichier de sauvegarde.
 
         Returns:
             bool: True si la sauvegarde s'est bien déroulée,
                   False si une erreur est survenue durant la sauvegarde.
         """
         try:
-            with open(nom_fichier, 'wb') as f:
-                pickle.dump(self, f)
-        except:
+            sauvegarde.sauvegarder_partie(self, nom_fichier)
+        except OSError:
             return False
 
         return True
@@ -430,14 +431,13 @@ class Scrabble(Tk):
 
 def charger_partie(nom_fichier):
     """
-    Fonction permettant de créer un objet scrabble en lisant le fichier dans lequel l'objet avait été sauvegardé
-    précédemment.
+    Fonction permettant de créer un objet scrabble en lisant le fichier dans lequel la partie avait été sauvegardée
+    précédemment (voir Scrabble.sauvegarder_partie).
 
     Args:
-        nom_fichier (str): Nom du fichier qui contient un objet scrabble.
+        nom_fichier (str): Nom du fichier de sauvegarde.
 
     Returns
         Scrabble: L'objet chargé en mémoire.
     """
-    with open(nom_fichier, 'rb') as f:
-        return pickle.load(f)
+    return Scrabble(nom_fichier)
@@ -0,0 +1,389 @@
+"""
+Serveur de parties en réseau.
+
+Le serveur héberge autant de parties qu'on veut dans un seul processus, sans interface graphique (voir la classe
+Partie); celles d'une même langue partagent son dictionnaire (voir le module langues). Le protocole est du JSON Lines
+sur TCP: chaque requête est un objet JSON sur une ligne, avec un champ action et un champ id facultatif, que la réponse
+reprend. Une réponse contient ok (booléen) et, en cas d'erreur, un message dans erreur.
+
+Actions:
+    creer       {nb_joueurs, langue, graine}   -> {partie}
+    rejoindre   {partie}                        -> {joueur, valeurs, etat}
+    etat        {partie}                        -> {etat}
+    jouer       {partie, lettres, positions}    -> {mots, score, etat}
+    passer      {partie}                        -> {etat}
+    mesures     {format}                        -> {mesures}
+
+L'action mesures renvoie le temps passé dans chaque phase des tours (voir le module instrumentation), en JSON ou, si
+format vaut 'prometheus', au format texte de Prometheus. Les mesures ne sont prises que si le serveur a été démarré
+avec --instrumenter.
+
+Après chaque tour, les autres joueurs assis à la partie reçoivent un évènement {evenement: 'tour', partie, etat}, sans
+id. Les tours d'une même partie sont traités un à la fois (un verrou par partie); les parties sont indépendantes.
+
+Exemple:
+    python -m tp4.serveur --port 7777
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+
+from tp4 import instrumentation
+from tp4.jeton import Jeton
+from tp4.langues import codes_langues
+from tp4.partie import Partie
+from tp4.exceptions import *
+
+VIDE = '.'
+# Délai, en secondes, après lequel une partie où plus aucun joueur n'est assis est supprimée.
+DELAI_INACTIVITE = 300.0
+# Taille maximale, en octets, des messages en attente d'envoi vers un client: au-delà, le client est trop lent (ou ne
+# lit plus) et il est déconnecté.
+TAMPON_MAX = 1 << 20
+
+
+class RequeteInvalide(Exception):
+    pass
+
+
+def _message_creation():
+    return f'Il faut entre 2 et 4 joueurs et une langue parmi {", ".join(codes_langues())}.'
+
+
+class Session:
+    """
+    Une partie hébergée et les connexions des joueurs qui y sont assis.
+
+    Attributes:
+        identifiant (int): Numéro de la partie sur le serveur.
+        partie (Partie): La partie.
+        verrou (asyncio.Lock): Verrou des tours de la partie.
+        sieges (list): Pour chaque joueur, la connexion qui le contrôle (None si le siège est libre).
+        terminee (bool): True si la partie est terminée.
+        passes_consecutives (int): Nombre de tours passés d'affilée. La partie se termine lorsque chaque joueur a passé
+                                   deux fois de suite.
+        expiration (asyncio.TimerHandle): La suppression prévue de la partie, tant qu'aucun joueur n'y est assis (None
+                                          sinon).
+    """
+    def __init__(self, identifiant, partie):
+        """
+        Constructeur.
+
+        Args:
+            identifiant (int): Numéro de la partie.
+            partie (Partie): La partie.
+        """
+        self.identifiant = identifiant
+        self.partie = partie
+        self.verrou = asyncio.Lock()
+        self.sieges = [None] * len(partie.joueurs)
+        self.terminee = False
+        self.passes_consecutives = 0
+        self.expiration = None
+
+    def etat(self, joueur=None):
+        """
+        Args:
+            joueur (int, optionnel): Le joueur à qui l'état est destiné: son chevalet y est ajouté.
+
+        Returns:
+            dict: L'état public de la partie.
+        """
+        partie = self.partie
+        etat = {
+            'partie': self.identifiant,
+            'langue': partie.langue,
+            'grille': ''.join(chr(code) if code else VIDE for code in partie.plateau.lettres),
+            'joueurs': [{'nom': j.nom, 'points': j.points} for j in partie.joueurs],
+            'joueur_actif': partie.joueurs.index(partie.joueur_actif),
+            'sac': len(partie.jetons_libres),
+            'tour': len(partie.historique),
+            'terminee': self.terminee,
+        }
+        if self.terminee:
+            etat['gagnant'] = partie.joueurs.index(partie.determiner_gagnant())
+        if joueur is not None:
+            etat['chevalet'] = ''.join(VIDE if jeton is None else jeton.lettre
+                                       for jeton in partie.joueurs[joueur].chevalet)
+        return etat
+
+    def jouer(self, joueur, lettres, positions):
+        """
+        Joue un coup pour un joueur, après avoir vérifié que c'est son tour, que les lettres sont sur son chevalet et
+        que les positions sont des cases vides distinctes. Le placement et les mots sont ensuite validés par les règles
+        de la partie (voir Partie.jouer_coup).
+
+        Returns:
+            list: Les mots formés.
+            int: Les points obtenus.
+
+        Raises:
+            RequeteInvalide: Si le coup ne peut pas être tenté.
+            PositionInvalideException, MotNonPermisException, AucunJeton: Si le coup est refusé par les règles.
+        """
+        partie = self._verifier_tour(joueur)
+        if not isinstance(lettres, str) or not isinstance(positions, list) or len(lettres) != len(positions) or \
+                not all(isinstance(p, str) for p in positions):
+            raise RequeteInvalide('Il faut autant de lettres que de positions (des chaînes comme "H8").')
+        plateau = partie.plateau
+        if len(set(positions)) != len(positions) or \
+                not all(plateau.code_position_est_valide(p) and plateau.case_est_vide(p) for p in positions):
+            raise PositionInvalideException
+        restants = [jeton.lettre for jeton in partie.joueur_actif.chevalet if jeton is not None]
+        for lettre in lettres:
+            if lettre not in restants:
+                raise RequeteInvalide(f'La lettre {lettre} n\'est pas sur le chevalet.')
+            restants.remove(lettre)
+
+        jetons = [Jeton(lettre, partie.valeurs_lettres[lettre]) for lettre in lettres]
+        try:
+            mots, score = partie.jouer_coup(jetons, positions)
+        except FinPartie:
+            self.terminee = True
+            tour = partie.historique[-1]
+            return tour['mots'], tour['score']
+        self.passes_consecutives = 0
+        return mots, score
+
+    def passer(self, joueur):
+        """
+        Passe le tour d'un joueur.
+
+        Raises:
+            RequeteInvalide: Si ce n'est pas le tour de ce joueur.
+        """
+        partie = self._verifier_tour(joueur)
+        try:
+            partie.passer_son_tour()
+        except FinPartie:
+            self.terminee = True
+        self.passes_consecutives += 1
+        if self.passes_consecutives >= 2 * len(partie.joueurs):
+            self.terminee = True
+
+    def _verifier_tour(self, joueur):
+        if self.terminee:
+            raise RequeteInvalide('La partie est terminée.')
+        if joueur is None or self.partie.joueurs[joueur] is not self.partie.joueur_actif:
+            raise RequeteInvalide('Ce n\'est pas votre tour.')
+        return self.partie
+
+
+class Connexion:
+    """
+    Un client connecté au serveur.
+
+    Attributes:
+        ecrivain (asyncio.StreamWriter): Flux d'écriture vers le client.
+        sieges (dict): Pour chaque partie (par numéro) où le client est assis, le numéro de son joueur.
+    """
+    def __init__(self, ecrivain):
+        self.ecrivain = ecrivain
+        self.sieges = {}
+
+    def envoyer(self, message):
+        """
+        Envoie un message au client (sans attendre qu'il soit transmis). Si plus de TAMPON_MAX octets attendent déjà
+        d'être transmis, le client est déconnecté (ses sièges sont alors libérés, voir ServeurScrabble.servir_client)
+        plutôt que de laisser grossir le tampon indéfiniment.
+        """
+        if self.ecrivain.is_closing():
+            return
+        if self.ecrivain.transport.get_write_buffer_size() > TAMPON_MAX:
+            # close() attendrait que le tampon soit transmis: on coupe la connexion sans attendre.
+            self.ecrivain.transport.abort()
+            return
+        self.ecrivain.write(json.dumps(message, ensure_ascii=False).encode() + b'\n')
+
+
+class ServeurScrabble:
+    """
+    Serveur de parties de scrabble (voir le module serveur pour le protocole).
+
+    Une partie où aucun joueur n'est assis (jamais rejointe, ou dont tous les joueurs se sont déconnectés) est
+    supprimée après delai_inactivite secondes, à moins qu'un joueur la rejoigne d'ici là.
+
+    Attributes:
+        sessions (dict): Les parties hébergées, par numéro.
+        delai_inactivite (float): Délai de suppression des parties sans joueur, en secondes.
+    """
+    def __init__(self, delai_inactivite=DELAI_INACTIVITE):
+        """
+        Constructeur.
+
+        Args:
+            delai_inactivite (float): Délai de suppression des parties sans joueur, en secondes.
+        """
+        self.sessions = {}
+        self.delai_inactivite = delai_inactivite
+        self._numeros = itertools.count(1)
+
+    def _surveiller(self, session):
+        """
+        Prévoit la suppression d'une partie si plus aucun joueur n'y est assis.
+        """
+        if session.expiration is None and all(siege is None for siege in session.sieges):
+            session.expiration = asyncio.get_running_loop().call_later(self.delai_inactivite, self._expirer, session)
+
+    def _expirer(self, session):
+        session.expiration = None
+        if self.sessions.get(session.identifiant) is session and all(siege is None for siege in session.sieges):
+            del self.sessions[session.identifiant]
+
+    async def demarrer(self, hote='127.0.0.1', port=7777):
+        """
+        Ouvre le port d'écoute.
+
+        Returns:
+            asyncio.Server: Le serveur asyncio (voir asyncio.start_server).
+        """
+        return await asyncio.start_server(self.servir_client, hote, port, limit=2 ** 20)
+
+    async def servir_client(self, lecteur, ecrivain):
+        """
+        Traite les requêtes d'un client jusqu'à ce qu'il se déconnecte. Ses sièges sont alors libérés.
+        """
+        connexion = Connexion(ecrivain)
+        try:
+            while True:
+                ligne = await lecteur.readline()
+                if not ligne:
+                    break
+                connexion.envoyer(await self.traiter(ligne, connexion))
+                await ecrivain.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for numero, joueur in connexion.sieges.items():
+                session = self.sessions.get(numero)
+                if session is not None and session.sieges[joueur] is connexion:
+                    session.sieges[joueur] = None
+                    self._surveiller(session)
+            ecrivain.close()
+
+    async def traiter(self, ligne, connexion):
+        """
+        Args:
+            ligne (bytes): Une requête (un objet JSON).
+            connexion (Connexion): Le client qui l'a envoyée.
+
+        Returns:
+            dict: La réponse.
+        """
+        try:
+            requete = json.loads(ligne)
+        except ValueError:
+            return {'ok': False, 'erreur': 'JSON invalide.'}
+        if not isinstance(requete, dict):
+            return {'ok': False, 'erreur': 'La requête doit être un objet JSON.'}
+
+        reponse = {'id': requete.get('id')}
+        try:
+            reponse.update(await self._executer(requete, connexion))
+            reponse['ok'] = True
+        except RequeteInvalide as erreur:
+            reponse.update(ok=False, erreur=str(erreur))
+        except PositionInvalideException:
+            reponse.update(ok=False, erreur='La position des lettres n\'est pas valide.')
+        except MotNonPermisException:
+            reponse.update(ok=False, erreur='Au moins l\'un des mots formés est absent du dictionnaire.')
+        except AucunJeton:
+            reponse.update(ok=False, erreur='Aucun jeton n\'est placé.')
+        except (MauvaiseLangue, MauvaisNbrJoueurs):
+            reponse.update(ok=False, erreur=_message_creation())
+        except Exception:
+            # Une requête imprévue ne doit jamais couper la connexion du client (ni libérer ses sièges), mais l'erreur
+            # est consignée avec sa trace.
+            logging.exception('Erreur inattendue en traitant la requête %r', requete)
+            reponse.update(ok=False, erreur='La requête n\'a pas pu être traitée.')
+        return reponse
+
+    async def _executer(self, requete, connexion):
+        action = requete.get('action')
+        if action == 'creer':
+            langue = requete.get('langue', 'fr')
+            nb_joueurs = requete.get('nb_joueurs', 2)
+            graine = requete.get('graine')
+            if not isinstance(langue, str) or not isinstance(nb_joueurs, int):
+                raise RequeteInvalide(_message_creation())
+            if graine is not None and not isinstance(graine, int):
+                raise RequeteInvalide('La graine doit être un entier.')
+            numero = next(self._numeros)
+            self.sessions[numero] = Session(numero, Partie(nb_joueurs, langue, graine=graine))
+            self._surveiller(self.sessions[numero])
+            return {'partie': numero}
+        if action == 'mesures':
+            if requete.get('format') == 'prometheus':
+                return {'mesures': instrumentation.exporter_prometheus()}
+            return {'mesures': instrumentation.mesures()}
+
+        numero = requete.get('partie')
+        if not isinstance(numero, int) or isinstance(numero, bool):
+            raise RequeteInvalide('Le numéro de la partie doit être un entier.')
+        session = self.sessions.get(numero)
+        if session is None:
+            raise RequeteInvalide('Partie inconnue.')
+        joueur = connexion.sieges.get(session.identifiant)
+
+        if action == 'etat':
+            return {'etat': session.etat(joueur)}
+
+        async with session.verrou:
+            if action == 'rejoindre':
+                if joueur is None:
+                    if None not in session.sieges:
+                        raise RequeteInvalide('La partie est complète.')
+                    joueur = session.sieges.index(None)
+                    session.sieges[joueur] = connexion
+                    connexion.sieges[session.identifiant] = joueur
+                    if session.expiration is not None:
+                        session.expiration.cancel()
+                        session.expiration = None
+                return {'joueur': joueur, 'valeurs': session.partie.valeurs_lettres, 'etat': session.etat(joueur)}
+            if action == 'jouer':
+                mots, score = session.jouer(joueur, requete.get('lettres'), requete.get('positions'))
+                reponse = {'mots': mots, 'score': score}
+            elif action == 'passer':
+                session.passer(joueur)
+                reponse = {}
+            else:
+                raise RequeteInvalide(f'Action inconnue: {action}.')
+
+            for autre, client in enumerate(session.sieges):
+                if client is not None and client is not connexion:
+                    client.envoyer({'evenement': 'tour', 'partie': session.identifiant, 'etat': session.etat(autre)})
+            reponse['etat'] = session.etat(joueur)
+            if session.terminee:
+                del self.sessions[session.identifiant]
+                for client in session.sieges:
+                    if client is not None:
+                        client.sieges.pop(session.identifiant, None)
+            return reponse
+
+
+async def servir(hote, port, delai_inactivite=DELAI_INACTIVITE):
+    """
+    Démarre un serveur et le laisse tourner indéfiniment.
+    """
+    serveur = await ServeurScrabble(delai_inactivite).demarrer(hote, port)
+    async with serveur:
+        await serveur.serve_forever()
+
+
+if __name__ == '__main__':
+    analyseur = argparse.ArgumentParser(prog='python -m tp4.serveur', description='Serveur de parties de scrabble.')
+    analyseur.add_argument('--hote', default='127.0.0.1')
+    analyseur.add_argument('--port', type=int, default=7777)
+    analyseur.add_argument('--instrumenter', action='store_true',
+                           help='mesure le temps passé dans chaque phase des tours (action mesures)')
+    analyseur.add_argument('--delai-inactivite', type=float, default=DELAI_INACTIVITE,
+                           help='délai (en secondes) de suppression des parties où plus aucun joueur n\'est assis')
+    args = analyseur.parse_args()
+    if args.instrumenter:
+        instrumentation.activer()
+    try:
+        asyncio.run(servir(args.hote, args.port, args.delai_inactivite))
+    except KeyboardInterrupt:
+        pass
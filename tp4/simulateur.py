@@ -0,0 +1,300 @@
+"""
+Simulation de parties complètes entre robots, sans interface graphique.
+
+Chaque partie est identifiée par une graine: la même graine et les mêmes stratégies donnent toujours la même partie,
+peu importe le processus qui la joue. Seules exceptions, les stratégies monte_carlo et finale réfléchissent pendant un
+temps donné: leurs coups dépendent de la vitesse et de la charge de la machine. Leurs variantes monte_carlo_fixe et
+finale_fixe font une quantité de travail fixe et sont reproductibles. Les parties sont réparties sur plusieurs processus et le résumé de chacune est
+écrit, dès qu'elle se termine, sous la forme d'une ligne JSON.
+
+Exemple:
+    python -m tp4.simulateur -n 200 --strategies meilleur aleatoire --sortie parties.jsonl
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+from tp4.finale import SolveurFinale
+from tp4.generateur import GenerateurCoups
+from tp4.langues import codes_langues
+from tp4.partie import Partie
+from tp4.reliquats import charger_table
+from tp4.simulation import EvaluateurMonteCarlo
+from tp4.exceptions import FinPartie
+
+# Tables de reliquats déjà chargées dans le processus courant, par langue (None si la table n'a pas été construite).
+_TABLES_RELIQUATS = {}
+# Temps alloué à la résolution d'une fin de partie, en secondes, à chaque tour.
+TEMPS_FINALE = 2.0
+# Travail des variantes reproductibles: nombre de simulations de chaque candidat et nombre de tours explorés en finale.
+NB_SIMULATIONS_FIXE = 16
+PROFONDEUR_FINALE_FIXE = 4
+
+
+def strategie_meilleur(partie, generateur, hasard):
+    """
+    Joue le coup qui rapporte le plus de points.
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    meilleur = None
+    for coup in generateur.iterer(partie.plateau, partie.joueur_actif.chevalet):
+        if meilleur is None or coup.score > meilleur.score:
+            meilleur = coup
+    return meilleur
+
+
+def strategie_aleatoire(partie, generateur, hasard):
+    """
+    Joue un coup permis choisi au hasard.
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    coups = list(generateur.iterer(partie.plateau, partie.joueur_actif.chevalet))
+    return hasard.choice(coups) if coups else None
+
+
+def strategie_monte_carlo(partie, generateur, hasard):
+    """
+    Joue le coup qui a le meilleur écart de points espéré selon des simulations de Monte-Carlo (une demi-seconde
+    par tour, dans le processus courant).
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    return EvaluateurMonteCarlo(generateur, budget=0.5).choisir(partie, hasard)
+
+
+def strategie_monte_carlo_fixe(partie, generateur, hasard):
+    """
+    Comme strategie_monte_carlo, mais avec NB_SIMULATIONS_FIXE simulations de chaque candidat plutôt qu'un temps
+    alloué: le coup choisi ne dépend que de la partie et du hasard.
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    return EvaluateurMonteCarlo(generateur, nb_simulations=NB_SIMULATIONS_FIXE).choisir(partie, hasard)
+
+
+def strategie_reliquat(partie, generateur, hasard):
+    """
+    Joue le coup qui maximise son pointage plus la valeur des jetons qu'il laisse sur le chevalet (voir le module
+    reliquats). Sans table de reliquats pour la langue de la partie, joue le coup qui rapporte le plus de points.
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    if partie.langue not in _TABLES_RELIQUATS:
+        _TABLES_RELIQUATS[partie.langue] = charger_table(partie.langue)
+    table = _TABLES_RELIQUATS[partie.langue]
+    if table is None:
+        return strategie_meilleur(partie, generateur, hasard)
+
+    chevalet = [jeton.lettre for jeton in partie.joueur_actif.chevalet if jeton is not None]
+    meilleur, meilleure_valeur = None, None
+    for coup in generateur.iterer(partie.plateau, partie.joueur_actif.chevalet):
+        reliquat = list(chevalet)
+        for jeton in coup.jetons:
+            reliquat.remove(jeton.lettre)
+        valeur = coup.score + table.valeur(reliquat)
+        if meilleur is None or valeur > meilleure_valeur:
+            meilleur, meilleure_valeur = coup, valeur
+    return meilleur
+
+
+def strategie_finale(partie, generateur, hasard):
+    """
+    Une fois le sac vide (avec la fin standard, à deux joueurs), joue le premier coup de la meilleure suite trouvée
+    par le solveur de fins de partie (voir le module finale). Avant, joue le coup qui rapporte le plus de points.
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    return _jouer_finale(partie, generateur, hasard, SolveurFinale(generateur, TEMPS_FINALE))
+
+
+def strategie_finale_fixe(partie, generateur, hasard):
+    """
+    Comme strategie_finale, mais le solveur explore au plus PROFONDEUR_FINALE_FIXE tours, sans limite de temps: le coup
+    choisi ne dépend que de la partie.
+
+    Returns:
+        Coup: Le coup à jouer, ou None pour passer son tour.
+    """
+    solveur = SolveurFinale(generateur, temps_max=None, profondeur_max=PROFONDEUR_FINALE_FIXE)
+    return _jouer_finale(partie, generateur, hasard, solveur)
+
+
+def _jouer_finale(partie, generateur, hasard, solveur):
+    if not partie.fin_standard or len(partie.jetons_libres) or len(partie.joueurs) != 2:
+        return strategie_meilleur(partie, generateur, hasard)
+    sequence = solveur.resoudre(partie).sequence
+    return sequence[0] if sequence else None
+
+
+# Stratégies disponibles, par nom. Une stratégie reçoit la partie, le générateur de coups et un générateur de nombres
+# aléatoires propre à la partie, et retourne le coup à jouer (ou None pour passer son tour).
+STRATEGIES = {
+    'meilleur': strategie_meilleur,
+    'aleatoire': strategie_aleatoire,
+    'monte_carlo': strategie_monte_carlo,
+    'monte_carlo_fixe': strategie_monte_carlo_fixe,
+    'reliquat': strategie_reliquat,
+    'finale': strategie_finale,
+    'finale_fixe': strategie_finale_fixe,
+}
+
+
+def jouer_partie(graine, strategies, langue='fr', fin_standard=False):
+    """
+    Joue une partie complète entre robots.
+    Le joueur i de la partie utilise la stratégie strategies[i]. La partie s'arrête lorsque le sac ne permet plus de
+    compléter un chevalet (ou, avec la fin standard, lorsqu'un joueur a vidé son chevalet une fois le sac vide), ou
+    lorsque tous les joueurs passent leur tour deux fois de suite.
+
+    Args:
+        graine (int): Graine de la partie.
+        strategies (list): Noms des stratégies des joueurs (entre 2 et 4, voir STRATEGIES).
+        langue (str): 'fr' ou 'en'.
+        fin_standard (bool): True pour jouer avec la fin standard (voir Partie.fin_standard).
+
+    Returns:
+        dict: Le résumé de la partie (pointages, nombre de coups, de passes et de bingos par joueur, durée, etc.).
+    """
+    debut = time.perf_counter()
+    # Le hasard des stratégies a sa propre graine, dérivée de celle de la partie: il reste reproductible sans être
+    # corrélé aux tirages du sac.
+    hasard = random.Random(f'strategie-{graine}')
+    partie = Partie(len(strategies), langue, graine=graine, fin_standard=fin_standard)
+    generateur = GenerateurCoups(partie.dictionnaire)
+    coups = [0] * len(strategies)
+    passes = [0] * len(strategies)
+    bingos = [0] * len(strategies)
+    passes_consecutives = 0
+
+    try:
+        while not partie.partie_terminee() and passes_consecutives < 2 * len(strategies):
+            joueur = partie.joueurs.index(partie.joueur_actif)
+            coup = STRATEGIES[strategies[joueur]](partie, generateur, hasard)
+            if coup is None:
+                passes[joueur] += 1
+                passes_consecutives += 1
+                partie.passer_son_tour()
+                continue
+            coups[joueur] += 1
+            passes_consecutives = 0
+            if len(coup.jetons) == partie.joueur_actif.taille_chevalet:
+                bingos[joueur] += 1
+            partie.jouer_coup(coup.jetons, coup.positions)
+    except FinPartie:
+        pass
+
+    scores = [joueur.points for joueur in partie.joueurs]
+    return {
+        'graine': graine,
+        'langue': langue,
+        'strategies': list(strategies),
+        'scores': scores,
+        'gagnant': scores.index(max(scores)),
+        'coups': coups,
+        'passes': passes,
+        'bingos': bingos,
+        'taux_bingo': [b / c if c else 0.0 for b, c in zip(bingos, coups)],
+        'jetons_restants': len(partie.jetons_libres),
+        'duree': time.perf_counter() - debut,
+    }
+
+
+def _jouer_partie(arguments):
+    return jouer_partie(*arguments)
+
+
+def simuler(nb_parties, strategies, langue='fr', graine=0, processus=None, fin_standard=False):
+    """
+    Joue nb_parties parties, réparties sur plusieurs processus.
+    La partie numéro i utilise la graine graine + i.
+
+    Args:
+        nb_parties (int): Nombre de parties à jouer.
+        strategies (list): Noms des stratégies des joueurs.
+        langue (str): 'fr' ou 'en'.
+        graine (int): Graine de la première partie.
+        processus (int, optionnel): Nombre de processus (par défaut, le nombre de processeurs).
+        fin_standard (bool): True pour jouer avec la fin standard (voir Partie.fin_standard).
+
+    Yields:
+        dict: Le résumé de chaque partie, dans l'ordre où elles se terminent.
+    """
+    taches = [(graine + i, list(strategies), langue, fin_standard) for i in range(nb_parties)]
+    if processus == 1:
+        yield from map(_jouer_partie, taches)
+        return
+    with Pool(processus) as pool:
+        yield from pool.imap_unordered(_jouer_partie, taches)
+
+
+def agreger(resumes):
+    """
+    Args:
+        resumes (list): Résumés de parties jouées avec les mêmes stratégies.
+
+    Returns:
+        dict: Pour chaque place de joueur, le nombre de victoires, le pointage moyen et le taux de bingo, ainsi que la
+              durée moyenne d'une partie.
+    """
+    nb_parties = len(resumes)
+    if nb_parties == 0:
+        return {'parties': 0}
+    nb_joueurs = len(resumes[0]['scores'])
+    joueurs = []
+    for i in range(nb_joueurs):
+        coups = sum(r['coups'][i] for r in resumes)
+        joueurs.append({
+            'strategie': resumes[0]['strategies'][i],
+            'victoires': sum(r['gagnant'] == i for r in resumes),
+            'score_moyen': sum(r['scores'][i] for r in resumes) / nb_parties,
+            'coups_moyens': coups / nb_parties,
+            'taux_bingo': sum(r['bingos'][i] for r in resumes) / coups if coups else 0.0,
+        })
+    return {
+        'parties': nb_parties,
+        'joueurs': joueurs,
+        'duree_moyenne': sum(r['duree'] for r in resumes) / nb_parties,
+    }
+
+
+if __name__ == '__main__':
+    analyseur = argparse.ArgumentParser(prog='python -m tp4.simulateur',
+                                        description='Simule des parties de scrabble entre robots.')
+    analyseur.add_argument('-n', '--parties', type=int, default=100, help='nombre de parties à jouer')
+    analyseur.add_argument('--strategies', nargs='+', default=['meilleur', 'meilleur'], choices=sorted(STRATEGIES),
+                           help='stratégie de chaque joueur (entre 2 et 4)')
+    analyseur.add_argument('--langue', default='fr', choices=[code.lower() for code in codes_langues()])
+    analyseur.add_argument('--graine', type=int, default=0, help='graine de la première partie')
+    analyseur.add_argument('-j', '--processus', type=int, default=os.cpu_count(), help='nombre de processus')
+    analyseur.add_argument('--fin-standard', action='store_true',
+                           help='continuer une fois le sac vide et décompter les reliquats (règles officielles)')
+    analyseur.add_argument('--sortie', default='-',
+                           help='fichier où écrire le résumé de chaque partie, une ligne JSON par partie')
+    args = analyseur.parse_args()
+    if not 2 <= len(args.strategies) <= 4:
+        analyseur.error('il faut entre 2 et 4 stratégies')
+
+    sortie = sys.stdout if args.sortie == '-' else open(args.sortie, 'w', encoding='utf-8')
+    resumes = []
+    try:
+        for resume in simuler(args.parties, args.strategies, args.langue, args.graine, args.processus,
+                              args.fin_standard):
+            resumes.append(resume)
+            sortie.write(json.dumps(resume) + '\n')
+            sortie.flush()
+    finally:
+        if sortie is not sys.stdout:
+            sortie.close()
+    print(json.dumps(agreger(resumes), indent=2), file=sys.stderr)
@@ -0,0 +1,257 @@
+"""
+Évaluation des coups par simulations de Monte-Carlo.
+
+Pour chaque coup candidat (les meilleurs coups selon le pointage), on joue de nombreuses fins de tour fictives: on
+tire au hasard les chevalets des adversaires parmi les jetons que le joueur actif ne voit pas (le sac et les
+chevalets des autres joueurs), on joue le coup candidat, puis chaque joueur joue à tour de rôle son meilleur coup
+pendant quelques tours. L'écart moyen de points entre le joueur actif et ses adversaires mesure la valeur du coup.
+
+Les simulations sont réparties sur plusieurs processus et s'arrêtent lorsque le temps alloué est écoulé, ou, si un
+nombre de simulations est imposé, lorsqu'il est atteint: le résultat ne dépend alors plus de la vitesse de la machine.
+"""
+import time
+from multiprocessing import Pool
+from random import Random
+
+from tp4 import langues
+from tp4.generateur import GenerateurCoups
+from tp4.grille import Grille
+from tp4.jeton import Jeton
+from tp4.zobrist import TableTransposition, empreinte_lettres
+
+# Nombre de meilleurs coups gardés en mémoire, par position et chevalet, pendant les simulations d'une évaluation.
+TAILLE_TABLE = 1 << 12
+
+
+class Evaluation:
+    """
+    Résultat des simulations d'un coup candidat.
+
+    Attributes:
+        coup (Coup): Le coup évalué.
+        ecart (float): L'écart moyen de points entre le joueur actif et ses adversaires à la fin des simulations.
+        nb_simulations (int): Le nombre de simulations jouées.
+    """
+    def __init__(self, coup, ecart, nb_simulations):
+        """
+        Constructeur.
+
+        Args:
+            coup (Coup): Le coup évalué.
+            ecart (float): L'écart moyen.
+            nb_simulations (int): Le nombre de simulations.
+        """
+        self.coup = coup
+        self.ecart = ecart
+        self.nb_simulations = nb_simulations
+
+    def __str__(self):
+        """
+        Returns:
+            str: Chaîne de caractères représentant une évaluation.
+        """
+        return '{} ({:+.1f} en moyenne sur {} simulations)'.format(self.coup, self.ecart, self.nb_simulations)
+
+
+class EvaluateurMonteCarlo:
+    """
+    Classe les coups du joueur actif d'une partie selon l'écart de points espéré (voir le module simulation).
+
+    Attributes:
+        generateur (GenerateurCoups): Le générateur des coups permis.
+        nb_candidats (int): Nombre de coups évalués (les meilleurs selon le pointage).
+        profondeur (int): Nombre de tours joués après le coup candidat dans chaque simulation.
+        budget (float): Temps alloué à une évaluation, en secondes.
+        processus (int): Nombre de processus de calcul (1 pour tout faire dans le processus courant).
+        nb_simulations (int): Nombre de simulations de chaque candidat, ou None pour simuler jusqu'à la fin du temps
+                              alloué.
+    """
+    def __init__(self, generateur, nb_candidats=8, profondeur=2, budget=1.0, processus=1, nb_simulations=None):
+        """
+        Constructeur.
+
+        Args:
+            generateur (GenerateurCoups): Le générateur des coups permis.
+            nb_candidats (int): Nombre de coups évalués.
+            profondeur (int): Nombre de tours joués après le coup candidat.
+            budget (float): Temps alloué à une évaluation, en secondes.
+            processus (int): Nombre de processus de calcul.
+            nb_simulations (int, optionnel): Nombre de simulations de chaque candidat, réparties entre les processus;
+                                             le budget est alors ignoré. À hasard et nombre de processus égaux,
+                                             l'évaluation est toujours la même.
+        """
+        self.generateur = generateur
+        self.nb_candidats = nb_candidats
+        self.profondeur = profondeur
+        self.budget = budget
+        self.processus = processus
+        self.nb_simulations = nb_simulations
+        self._pool = None
+
+    def fermer(self):
+        """
+        Arrête les processus de calcul, s'il y en a.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+    def evaluer(self, partie, hasard=None):
+        """
+        Évalue les meilleurs coups du joueur actif.
+        Chaque candidat est simulé au moins une fois, même si le temps alloué est dépassé (sans nombre de simulations
+        imposé).
+
+        Args:
+            partie (Partie): La partie.
+            hasard (random.Random, optionnel): Générateur utilisé pour les graines des simulations (un nouveau
+                                               générateur indépendant par défaut). Le générateur de la partie
+                                               (partie.hasard) n'est jamais utilisé: l'évaluation ne change pas les
+                                               tirages qui suivent.
+
+        Returns:
+            list: Les évaluations (instances de la classe Evaluation), de la meilleure à la moins bonne.
+        """
+        candidats = self.generateur.generer(partie.plateau, partie.joueur_actif.chevalet)[:self.nb_candidats]
+        if len(candidats) <= 1:
+            return [Evaluation(coup, float(coup.score), 0) for coup in candidats]
+
+        hasard = Random() if hasard is None else hasard
+        inconnus = [jeton.lettre for jeton in partie.jetons_libres]
+        for joueur in partie.joueurs:
+            if joueur is not partie.joueur_actif:
+                inconnus += [jeton.lettre for jeton in joueur.chevalet if jeton is not None]
+        etat = {
+            'langue': partie.langue,
+            'valeurs': partie.valeurs_lettres,
+            'lettres': bytes(partie.plateau.lettres),
+            'chevalet': ''.join(jeton.lettre for jeton in partie.joueur_actif.chevalet if jeton is not None),
+            'inconnus': ''.join(inconnus),
+            'nb_joueurs': len(partie.joueurs),
+            'profondeur': self.profondeur,
+            'candidats': [(coup.positions, ''.join(jeton.lettre for jeton in coup.jetons), coup.score)
+                          for coup in candidats],
+        }
+        echeance = time.time() + self.budget
+
+        if self.processus == 1:
+            resultats = [_simuler_candidats(etat, hasard.getrandbits(32), echeance, self.generateur.lexique,
+                                            self.nb_simulations)]
+        else:
+            if self._pool is None:
+                self._pool = Pool(self.processus)
+            if self.nb_simulations is None:
+                passages = [None] * self.processus
+            else:
+                quotient, reste = divmod(self.nb_simulations, self.processus)
+                passages = [quotient + (i < reste) for i in range(self.processus) if quotient + (i < reste)]
+            taches = [(etat, hasard.getrandbits(32), echeance, None, nombre) for nombre in passages]
+            resultats = self._pool.starmap(_simuler_candidats, taches)
+
+        evaluations = []
+        for i, coup in enumerate(candidats):
+            total = sum(resultat[i][0] for resultat in resultats)
+            nombre = sum(resultat[i][1] for resultat in resultats)
+            evaluations.append(Evaluation(coup, total / nombre if nombre else float(coup.score), nombre))
+        return sorted(evaluations, key=lambda evaluation: (evaluation.ecart, evaluation.coup.score), reverse=True)
+
+    def choisir(self, partie, hasard=None):
+        """
+        Returns:
+            Coup: Le coup du joueur actif qui a le meilleur écart espéré, ou None s'il n'y a aucun coup permis.
+        """
+        evaluations = self.evaluer(partie, hasard)
+        return evaluations[0].coup if evaluations else None
+
+
+def _simuler_candidats(etat, graine, echeance, lexique=None, nb_passages=None):
+    """
+    Simule chaque candidat à tour de rôle jusqu'à l'échéance (au moins une fois chacun), ou un nombre donné de fois.
+
+    Args:
+        etat (dict): La position à évaluer (voir EvaluateurMonteCarlo.evaluer).
+        graine (int): Graine des simulations.
+        echeance (float): Heure (au sens de time.time) à laquelle s'arrêter.
+        lexique (Lexique, optionnel): Le lexique à utiliser (celui de la langue de la partie par défaut).
+        nb_passages (int, optionnel): Nombre de simulations de chaque candidat; l'échéance est alors ignorée.
+
+    Returns:
+        list: Pour chaque candidat, la somme des écarts obtenus et le nombre de simulations.
+    """
+    lexique = langues.lexique(etat['langue']) if lexique is None else lexique
+    generateur = GenerateurCoups(lexique)
+    valeurs = etat['valeurs']
+    base = Grille()
+    for k, code in enumerate(etat['lettres']):
+        if code:
+            base.placer_jeton_index(Jeton(chr(code), valeurs[chr(code)]), k)
+    base.definir_lexique(lexique)
+
+    hasard = Random(graine)
+    table = TableTransposition(TAILLE_TABLE)
+    resultats = [[0.0, 0] for _ in etat['candidats']]
+    passages = 0
+    while passages == 0 or (time.time() < echeance if nb_passages is None else passages < nb_passages):
+        for i, candidat in enumerate(etat['candidats']):
+            resultats[i][0] += _simuler(etat, base, generateur, candidat, hasard, table)
+            resultats[i][1] += 1
+        passages += 1
+    return resultats
+
+
+def _simuler(etat, base, generateur, candidat, hasard, table=None):
+    """
+    Joue une simulation: le candidat, puis etat['profondeur'] tours où chaque joueur joue son meilleur coup.
+    Le meilleur coup de chaque position et chevalet déjà rencontrés est lu dans la table de transposition, s'il y en a
+    une.
+
+    Returns:
+        float: L'écart de points entre le joueur actif et la moyenne de ses adversaires.
+    """
+    valeurs = etat['valeurs']
+    nb_joueurs = etat['nb_joueurs']
+    positions, lettres, score = candidat
+    grille = base.copier()
+    for lettre, position in zip(lettres, positions):
+        grille.placer_jeton_index(Jeton(lettre, valeurs[lettre]), grille.index_position(position))
+
+    sac = list(etat['inconnus'])
+    hasard.shuffle(sac)
+    restants = list(etat['chevalet'])
+    for lettre in lettres:
+        restants.remove(lettre)
+    chevalets = [restants] + [[sac.pop() for _ in range(min(7, len(sac)))] for _ in range(nb_joueurs - 1)]
+    while len(chevalets[0]) < 7 and sac:
+        chevalets[0].append(sac.pop())
+    points = [score] + [0] * (nb_joueurs - 1)
+
+    for tour in range(etat['profondeur']):
+        joueur = (tour + 1) % nb_joueurs
+        cle = grille.empreinte ^ empreinte_lettres(chevalets[joueur])
+        trouve = None if table is None else table.chercher(cle)
+        if trouve is not None:
+            meilleur, = trouve
+        else:
+            chevalet = [Jeton(lettre, valeurs[lettre]) for lettre in chevalets[joueur]]
+            meilleur = None
+            for coup in generateur.iterer(grille, chevalet):
+                if meilleur is None or coup.score > meilleur.score:
+                    meilleur = coup
+            if table is not None:
+                table.stocker(cle, (meilleur,))
+        if meilleur is None:
+            continue
+        for jeton, position in zip(meilleur.jetons, meilleur.positions):
+            grille.placer_jeton_index(jeton, grille.index_position(position))
+            chevalets[joueur].remove(jeton.lettre)
+        points[joueur] += meilleur.score
+        while len(chevalets[joueur]) < 7 and sac:
+            chevalets[joueur].append(sac.pop())
+
+    return points[0] - sum(points[1:]) / (nb_joueurs - 1)
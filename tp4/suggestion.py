@@ -0,0 +1,93 @@
+"""
+Recherche de suggestions en arrière-plan.
+
+La recherche parcourt les coups permis dans un fil d'exécution séparé, sur une copie de la grille, et tient à jour
+les meilleurs coups trouvés jusqu'ici. L'interface graphique consulte ces résultats périodiquement (voir
+RechercheSuggestions.resultats) sans jamais attendre la fin de la recherche, qui s'arrête d'elle-même lorsque tous les
+coups ont été vus ou que le temps alloué est écoulé, ou dès qu'on l'annule.
+"""
+import heapq
+import threading
+import time
+
+from tp4.generateur import GenerateurCoups
+
+
+class RechercheSuggestions:
+    """
+    Recherche des meilleurs coups d'un chevalet, dans un fil d'exécution séparé.
+
+    Attributes:
+        nb_suggestions (int): Nombre de coups retenus.
+        budget (float): Temps alloué à la recherche, en secondes.
+        version (int): Augmente chaque fois que les meilleurs coups changent.
+    """
+    def __init__(self, lexique, grille, chevalet, nb_suggestions=5, budget=3.0):
+        """
+        Constructeur. La grille et le chevalet sont copiés: la partie peut continuer pendant la recherche.
+
+        Args:
+            lexique (Lexique): Le lexique des mots permis.
+            grille (Grille): La grille de jeu.
+            chevalet (list): Le chevalet du joueur (jetons ou None).
+            nb_suggestions (int): Nombre de coups retenus.
+            budget (float): Temps alloué à la recherche, en secondes.
+        """
+        self.nb_suggestions = nb_suggestions
+        self.budget = budget
+        self.version = 0
+        self._generateur = GenerateurCoups(lexique)
+        self._grille = grille.copier()
+        self._chevalet = list(chevalet)
+        self._meilleurs = []
+        self._verrou = threading.Lock()
+        self._annulation = threading.Event()
+        self._fil = threading.Thread(target=self._rechercher, daemon=True)
+
+    def demarrer(self):
+        """
+        Lance la recherche.
+        """
+        self._fil.start()
+
+    def annuler(self):
+        """
+        Demande l'arrêt de la recherche. Les coups déjà trouvés restent disponibles.
+        """
+        self._annulation.set()
+
+    @property
+    def terminee(self):
+        """
+        Returns:
+            bool: True si la recherche est terminée (tous les coups vus, temps écoulé ou annulation).
+        """
+        return self._fil.ident is not None and not self._fil.is_alive()
+
+    def resultats(self):
+        """
+        Returns:
+            list: Les meilleurs coups trouvés jusqu'ici (instances de la classe Coup), du meilleur au moins bon.
+        """
+        with self._verrou:
+            return [coup for _, _, coup in sorted(self._meilleurs, reverse=True)]
+
+    def _rechercher(self):
+        """
+        Parcourt les coups permis jusqu'à la fin, l'échéance ou l'annulation.
+        """
+        echeance = time.monotonic() + self.budget
+        for rang, coup in enumerate(self._generateur.iterer(self._grille, self._chevalet)):
+            if self._annulation.is_set() or time.monotonic() > echeance:
+                break
+            # Le rang (négatif) départage les coups de même pointage en faveur du premier trouvé.
+            entree = (coup.score, -rang, coup)
+            meilleurs = self._meilleurs
+            if len(meilleurs) < self.nb_suggestions:
+                with self._verrou:
+                    heapq.heappush(meilleurs, entree)
+                    self.version += 1
+            elif entree[:2] > meilleurs[0][:2]:
+                with self._verrou:
+                    heapq.heapreplace(meilleurs, entree)
+                    self.version += 1
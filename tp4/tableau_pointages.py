@@ -0,0 +1,51 @@
+from tkinter import Frame, Label, StringVar
+
+
+class TableauPointages(Frame):
+    """
+    Tableau des pointages des joueurs, affiché à côté du plateau. Le joueur actif y est mis en évidence.
+    Les étiquettes sont créées une seule fois par joueur, puis mises à jour sur place (voir mettre_a_jour).
+
+    Attributes:
+        etiquettes (list): L'étiquette (tkinter.Label) de chaque joueur.
+        textes (list): Le texte (tkinter.StringVar) de l'étiquette de chaque joueur.
+    """
+    def __init__(self, parent):
+        """
+        Constructeur.
+
+        Args:
+            parent (tkinter.Widget): Le Widget parent.
+        """
+        super().__init__(parent)
+        self.etiquettes = []
+        self.textes = []
+        self._fond = None
+
+    def mettre_a_jour(self, joueurs, joueur_actif):
+        """
+        Affiche le nom et le pointage de chaque joueur. Des étiquettes sont créées ou détruites seulement si le nombre
+        de joueurs a changé.
+
+        Args:
+            joueurs (list): Les joueurs de la partie (instances de la classe Joueur).
+            joueur_actif (Joueur): Le joueur actif (None si aucun).
+        """
+        while len(self.etiquettes) < len(joueurs):
+            texte = StringVar(self)
+            etiquette = Label(self, textvariable=texte, pady=20)
+            etiquette.grid(row=len(self.etiquettes), column=0)
+            if self._fond is None:
+                self._fond = etiquette.cget('bg')
+            self.textes.append(texte)
+            self.etiquettes.append(etiquette)
+        while len(self.etiquettes) > len(joueurs):
+            self.etiquettes.pop().destroy()
+            self.textes.pop()
+
+        for joueur, etiquette, texte in zip(joueurs, self.etiquettes, self.textes):
+            texte.set(str(joueur))
+            if joueur is joueur_actif:
+                etiquette.configure(bg='#00fbff', relief='raised', width=25)
+            else:
+                etiquette.configure(bg=self._fond, relief='flat', width=0)
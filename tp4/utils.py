@@ -19,7 +19,7 @@ def coordonnees_case(ligne, colonne, nb_pixels_par_case):
     return debut_ligne, debut_colonne, fin_ligne, fin_colonne
 
 
-def dessiner_jeton(canvas, jeton, ligne, colonne, nb_pixels_par_case, selection=False, tag='lettre'):
+def dessiner_jeton(canvas, jeton, ligne, colonne, nb_pixels_par_case, selection=False, tag='lettre', couleur=None):
     """
     Dessine une jeton sur l'interface graphique.
 
@@ -31,14 +31,17 @@ def dessiner_jeton(canvas, jeton, ligne, colonne, nb_pixels_par_case, selection=
         nb_pixels_par_case (int): Nombre de pixels qu'occupe la représentation graphique d'une case (ou d'un jeton).
         selection (bool): True si le jeton est sélectionné par le joueur (False par défaut).
         tag (str): Étiquette à affubler au dessin du jeton ("lettre" par défaut)
+        couleur (str, optionnel): Couleur de fond du jeton (par défaut, selon qu'il est sélectionné ou non).
+
+    Returns:
+        (int, int): Les identifiants du rectangle et du texte créés sur le canvas.
     """
     debut_ligne, debut_colonne, fin_ligne, fin_colonne = coordonnees_case(ligne, colonne, nb_pixels_par_case)
     centre = (debut_colonne + nb_pixels_par_case // 2, debut_ligne + nb_pixels_par_case // 2)
 
-    if selection:
-        couleur = 'orange'
-    else:
-        couleur = '#b9936c'
+    if couleur is None:
+        couleur = 'orange' if selection else '#b9936c'
 
-    canvas.create_rectangle(debut_colonne, debut_ligne, fin_colonne, fin_ligne, fill=couleur, tags=tag)
-    canvas.create_text(centre, font=('Times', '31'), text=str(jeton), tags=tag)
+    rectangle = canvas.create_rectangle(debut_colonne, debut_ligne, fin_colonne, fin_ligne, fill=couleur, tags=tag)
+    texte = canvas.create_text(centre, font=('Times', '31'), text=str(jeton), tags=tag)
+    return rectangle, texte
@@ -0,0 +1,180 @@
+"""
+Empreintes de Zobrist et table de transposition.
+
+Une empreinte de Zobrist est le ou exclusif (XOR) de clés aléatoires de 64 bits, une par élément présent: un jeton
+sur une case de la grille, la m-ième occurrence d'une lettre sur un chevalet ou dans le sac. Ajouter ou retirer un
+élément revient à faire le XOR de sa clé, de sorte que la grille, les chevalets et le sac tiennent leur empreinte à
+jour en temps constant (voir Grille.empreinte, Joueur.empreinte et Sac.empreinte). Deux positions identiques ont la
+même empreinte, peu importe l'ordre des coups qui y ont mené; deux positions différentes ont la même empreinte avec
+une probabilité négligeable.
+
+Une table de transposition (voir TableTransposition) conserve les évaluations déjà faites, par empreinte.
+"""
+from collections import OrderedDict
+from random import Random
+
+NB_LETTRES = 26
+# Nombre maximal d'occurrences d'une même lettre dans un sac ou sur un chevalet.
+MAX_OCCURRENCES = 32
+MASQUE_64 = (1 << 64) - 1
+
+
+def tirer_cles(nombre, graine):
+    """
+    Args:
+        nombre (int): Nombre de clés.
+        graine (int): Graine du générateur: les clés sont les mêmes d'une exécution à l'autre.
+
+    Returns:
+        tuple: Les clés, des entiers aléatoires de 64 bits.
+    """
+    hasard = Random(graine)
+    return tuple(hasard.getrandbits(64) for _ in range(nombre))
+
+
+CLES_CHEVALET = tirer_cles(NB_LETTRES * MAX_OCCURRENCES, 0x43484556)
+CLES_SAC = tirer_cles(NB_LETTRES * MAX_OCCURRENCES, 0x534143)
+# Clé du joueur actif, selon son rang dans la partie.
+CLES_JOUEUR_ACTIF = tirer_cles(4, 0x4a4f55)
+
+
+def cle_occurrence(cles, lettre, m):
+    """
+    Args:
+        cles (tuple): CLES_CHEVALET ou CLES_SAC.
+        lettre (str): Une lettre majuscule.
+        m (int): Le rang de l'occurrence de cette lettre (à partir de 1).
+
+    Returns:
+        int: La clé de la m-ième occurrence de la lettre.
+    """
+    return cles[(ord(lettre) - 65) * MAX_OCCURRENCES + m - 1]
+
+
+def empreinte_lettres(lettres, cles=CLES_CHEVALET):
+    """
+    Calcule l'empreinte d'un multiensemble de lettres (par exemple un chevalet représenté par ses lettres).
+
+    Args:
+        lettres (iterable): Les lettres, dans n'importe quel ordre.
+        cles (tuple): CLES_CHEVALET (par défaut) ou CLES_SAC.
+
+    Returns:
+        int: L'empreinte, égale à celle d'un chevalet (ou d'un sac) qui contient ces lettres.
+    """
+    empreinte, vues = 0, {}
+    for lettre in lettres:
+        vues[lettre] = vues.get(lettre, 0) + 1
+        empreinte ^= cle_occurrence(cles, lettre, vues[lettre])
+    return empreinte
+
+
+def rotation(empreinte, n):
+    """
+    Returns:
+        int: L'empreinte (64 bits) tournée de n bits vers la gauche, pour distinguer des éléments de même nature (par
+             exemple les chevalets de deux joueurs).
+    """
+    n %= 64
+    return ((empreinte << n) | (empreinte >> (64 - n))) & MASQUE_64
+
+
+class TableTransposition:
+    """
+    Table bornée d'évaluations indexées par empreinte.
+
+    Deux politiques de remplacement sont offertes:
+    - 'lru': la table garde les capacite entrées les plus récemment consultées ou stockées;
+    - 'profondeur': chaque empreinte a une seule place possible (empreinte % capacite), qu'une nouvelle entrée ne prend
+      que si elle a été calculée à une profondeur au moins aussi grande que l'entrée qui l'occupe. Une entrée ne sert
+      que pour une recherche d'une profondeur au plus égale à la sienne.
+
+    Attributes:
+        capacite (int): Nombre maximal d'entrées.
+        remplacement (str): 'lru' ou 'profondeur'.
+        succes (int): Nombre de recherches fructueuses.
+        echecs (int): Nombre de recherches infructueuses.
+    """
+    def __init__(self, capacite=1 << 16, remplacement='lru'):
+        """
+        Constructeur.
+
+        Args:
+            capacite (int): Nombre maximal d'entrées.
+            remplacement (str): 'lru' (par défaut) ou 'profondeur'.
+
+        Raises:
+            ValueError: Si la politique de remplacement est inconnue ou la capacité n'est pas positive.
+        """
+        if remplacement not in ('lru', 'profondeur'):
+            raise ValueError(f'Politique de remplacement inconnue: {remplacement}.')
+        if capacite <= 0:
+            raise ValueError('La capacité doit être positive.')
+        self.capacite = capacite
+        self.remplacement = remplacement
+        self.succes = 0
+        self.echecs = 0
+        self.vider()
+
+    def vider(self):
+        """
+        Retire toutes les entrées (les compteurs sont conservés).
+        """
+        if self.remplacement == 'lru':
+            self._entrees = OrderedDict()
+        else:
+            self._entrees = [None] * self.capacite
+
+    def __len__(self):
+        """
+        Returns:
+            int: Le nombre d'entrées.
+        """
+        if self.remplacement == 'lru':
+            return len(self._entrees)
+        return self.capacite - self._entrees.count(None)
+
+    def chercher(self, cle, profondeur=0):
+        """
+        Args:
+            cle (int): L'empreinte de la position.
+            profondeur (int): Profondeur minimale de l'évaluation cherchée.
+
+        Returns:
+            object: La valeur stockée pour cette empreinte, ou None s'il n'y en a pas (ou si elle a été calculée à une
+                    profondeur insuffisante).
+        """
+        if self.remplacement == 'lru':
+            entree = self._entrees.get(cle)
+            if entree is not None:
+                self._entrees.move_to_end(cle)
+        else:
+            entree = self._entrees[cle % self.capacite]
+            if entree is not None and entree[0] != cle:
+                entree = None
+        if entree is None or entree[1] < profondeur:
+            self.echecs += 1
+            return None
+        self.succes += 1
+        return entree[2]
+
+    def stocker(self, cle, valeur, profondeur=0):
+        """
+        Stocke une valeur (selon la politique de remplacement).
+
+        Args:
+            cle (int): L'empreinte de la position.
+            valeur (object): La valeur à stocker (pas None).
+            profondeur (int): Profondeur à laquelle la valeur a été calculée.
+        """
+        entree = (cle, profondeur, valeur)
+        if self.remplacement == 'lru':
+            self._entrees[cle] = entree
+            self._entrees.move_to_end(cle)
+            if len(self._entrees) > self.capacite:
+                self._entrees.popitem(last=False)
+            return
+        place = cle % self.capacite
+        ancienne = self._entrees[place]
+        if ancienne is None or ancienne[0] == cle or ancienne[1] <= profondeur:
+            self._entrees[place] = entree